@@ -0,0 +1 @@
+"""Benchmarking and performance tooling for OpenCode Monitor."""
@@ -0,0 +1,261 @@
+"""Synthetic OpenCode storage generator for benchmarking.
+
+Writes a storage tree in the layout ``FileProcessor`` reads::
+
+    <root>/storage/message/<session_id>/<message_id>.json
+    <root>/storage/session/<project_id>/<session_id>.json
+
+Every session is generated from its own random stream derived from the seed
+and the session index, so the same arguments always produce the same tree,
+regardless of how many writer threads are used. File and directory
+modification times are set to the message completion times, matching how a
+real OpenCode storage directory ages.
+"""
+
+import hashlib
+import json
+import os
+import random
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Default model mix as (model_id, provider_id, weight)
+DEFAULT_MODEL_MIX: List[Tuple[str, str, float]] = [
+    ("claude-sonnet-4-20250514", "anthropic", 0.55),
+    ("claude-opus-4", "anthropic", 0.15),
+    ("grok-code", "opencode", 0.15),
+    ("kimi-k2", "openrouter", 0.10),
+    ("qwen/qwen3-coder", "openrouter", 0.05),
+]
+
+TITLE_WORDS = [
+    "Fix", "Refactor", "Add", "Debug", "Optimize", "Document", "Review", "Migrate",
+    "parser", "CLI", "exports", "dashboard", "config loader", "tests", "pricing",
+    "session view", "API client", "build", "cache", "report",
+]
+
+GENERATOR_MANIFEST = "generator.json"
+
+_ID_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZabcdefghijkmnpqrstvwxyz"
+
+
+def parse_model_mix(value: str) -> List[Tuple[str, str, float]]:
+    """Parse a model mix such as ``"claude-opus-4:3,grok-code:1"``.
+
+    Args:
+        value: Comma-separated ``model[:weight]`` entries
+
+    Returns:
+        List of (model_id, provider_id, weight) tuples
+
+    Raises:
+        ValueError: If the mix is empty or a weight is invalid
+    """
+    providers = {model: provider for model, provider, _ in DEFAULT_MODEL_MIX}
+    mix = []
+    for entry in value.split(','):
+        entry = entry.strip()
+        if not entry:
+            continue
+        model, _, weight = entry.rpartition(':') if ':' in entry else (entry, '', '1')
+        try:
+            weight_value = float(weight)
+        except ValueError:
+            raise ValueError(f"Invalid weight for model '{model}': {weight}")
+        if weight_value <= 0:
+            raise ValueError(f"Weight for model '{model}' must be positive")
+        provider = providers.get(model, model.split('/')[0] if '/' in model else "unknown")
+        mix.append((model, provider, weight_value))
+
+    if not mix:
+        raise ValueError("Model mix must contain at least one model")
+    return mix
+
+
+class StorageGenerator:
+    """Generates a deterministic synthetic OpenCode storage tree."""
+
+    def __init__(self, sessions: int = 100, messages_per_session: int = 50,
+                 model_mix: Optional[Sequence[Tuple[str, str, float]]] = None,
+                 projects: int = 5, days: int = 90, end_date: Optional[date] = None,
+                 seed: int = 0, user_messages: bool = True):
+        """Initialize generator.
+
+        Args:
+            sessions: Number of sessions to generate
+            messages_per_session: Assistant messages per session
+            model_mix: Weighted models as (model_id, provider_id, weight)
+            projects: Number of distinct projects
+            days: Number of days the sessions are spread over
+            end_date: Last day of the time span (defaults to today). The span
+                never extends past the current time, so no interaction or
+                modification time lies in the future
+            seed: Random seed
+            user_messages: Also write a zero-token user message before each
+                assistant message, as OpenCode does
+        """
+        self.sessions = sessions
+        self.messages_per_session = messages_per_session
+        self.model_mix = list(model_mix or DEFAULT_MODEL_MIX)
+        self.projects = projects
+        self.days = days
+        self.end_date = end_date or date.today()
+        self.seed = seed
+        self.user_messages = user_messages
+
+        self._models = [model for model, _, _ in self.model_mix]
+        self._providers = {model: provider for model, provider, _ in self.model_mix}
+        self._weights = [weight for _, _, weight in self.model_mix]
+        self._project_paths = [f"/home/dev/projects/project-{index:02d}" for index in range(projects)]
+        end_of_day_ms = int(datetime.combine(self.end_date + timedelta(days=1), time()).timestamp() * 1000)
+        self._end_ms = min(end_of_day_ms, int(datetime.now().timestamp() * 1000))
+        self._span_ms = days * 86400000
+
+    def generate(self, root: str, max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """Write the storage tree.
+
+        Args:
+            root: Output directory; ``storage/`` is created inside it
+            max_workers: Number of writer threads
+
+        Returns:
+            Summary with paths and file counts
+
+        Raises:
+            ValueError: If the storage directory already exists and is not empty
+        """
+        storage = Path(root) / "storage"
+        message_root = storage / "message"
+        if message_root.exists() and any(message_root.iterdir()):
+            raise ValueError(f"Message directory is not empty: {message_root}")
+        message_root.mkdir(parents=True, exist_ok=True)
+
+        for project_path in self._project_paths:
+            (storage / "session" / self._project_id(project_path)).mkdir(parents=True, exist_ok=True)
+
+        workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            file_counts = list(executor.map(
+                lambda index: self._write_session(storage, index), range(self.sessions)
+            ))
+
+        summary = {
+            "root": str(Path(root).resolve()),
+            "messages_dir": str(message_root.resolve()),
+            "storage_dir": str(storage.resolve()),
+            "sessions": self.sessions,
+            "message_files": sum(file_counts),
+            "assistant_messages": self.sessions * self.messages_per_session,
+            "parameters": {
+                "sessions": self.sessions,
+                "messages_per_session": self.messages_per_session,
+                "model_mix": [list(entry) for entry in self.model_mix],
+                "projects": self.projects,
+                "days": self.days,
+                "end_date": self.end_date.isoformat(),
+                "seed": self.seed,
+                "user_messages": self.user_messages,
+            },
+        }
+        with open(Path(root) / GENERATOR_MANIFEST, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2)
+        return summary
+
+    def _write_session(self, storage: Path, index: int) -> int:
+        """Write one session's message and title files; returns the file count."""
+        rng = random.Random(f"{self.seed}:{index}")
+        session_id = self._make_id("ses", rng)
+        project_path = rng.choice(self._project_paths)
+        session_dir = storage / "message" / session_id
+        session_dir.mkdir()
+
+        # Sessions start anywhere in the span and last minutes to a few hours
+        start_ms = self._end_ms - self._span_ms + rng.randrange(self._span_ms)
+        current_ms = start_ms
+        messages: List[Tuple[Path, Dict[str, Any], int]] = []
+
+        for message_index in range(self.messages_per_session):
+            if self.user_messages:
+                message_id = self._make_id("msg", rng)
+                messages.append((session_dir / f"{message_id}.json", {
+                    "id": message_id,
+                    "role": "user",
+                    "sessionID": session_id,
+                    "time": {"created": current_ms},
+                }, current_ms))
+
+            created_ms = current_ms + rng.randint(200, 2000)
+            completed_ms = created_ms + int(rng.lognormvariate(9.5, 0.8))
+            model_id = rng.choices(self._models, weights=self._weights)[0]
+            message_id = self._make_id("msg", rng)
+            messages.append((session_dir / f"{message_id}.json", {
+                "id": message_id,
+                "role": "assistant",
+                "sessionID": session_id,
+                "mode": "build",
+                "modelID": model_id,
+                "providerID": self._providers[model_id],
+                "path": {"cwd": project_path, "root": project_path},
+                "cost": 0,
+                "tokens": {
+                    "input": int(rng.lognormvariate(7.5, 1.2)),
+                    "output": int(rng.lognormvariate(6.0, 1.0)),
+                    "reasoning": 0,
+                    "cache": {
+                        "write": int(rng.lognormvariate(7.0, 1.5)) if rng.random() < 0.6 else 0,
+                        "read": int(rng.lognormvariate(9.5, 1.0)) if message_index else 0,
+                    },
+                },
+                "time": {"created": created_ms, "completed": completed_ms},
+            }, completed_ms))
+
+            # Think time before the next prompt
+            current_ms = completed_ms + int(rng.expovariate(1 / 90000))
+
+        # Move sessions that would run past the end of the span back so they end with it
+        shift_ms = max(0, current_ms - self._end_ms)
+        for path, data, mtime_ms in messages:
+            if shift_ms:
+                data["time"] = {key: value - shift_ms for key, value in data["time"].items()}
+            self._write_json(path, data, mtime_ms - shift_ms)
+        start_ms -= shift_ms
+        current_ms -= shift_ms
+
+        self._write_json(storage / "session" / self._project_id(project_path) / f"{session_id}.json", {
+            "id": session_id,
+            "version": "0.5.0",
+            "projectID": self._project_id(project_path),
+            "directory": project_path,
+            "title": self._make_title(rng, index),
+            "time": {"created": start_ms, "updated": current_ms},
+        }, current_ms)
+
+        mtime = current_ms / 1000
+        os.utime(session_dir, (mtime, mtime))
+        return len(messages)
+
+    @staticmethod
+    def _write_json(path: Path, data: Dict[str, Any], mtime_ms: int) -> None:
+        """Write a JSON file and set its modification time."""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        os.utime(path, (mtime_ms / 1000, mtime_ms / 1000))
+
+    @staticmethod
+    def _make_id(prefix: str, rng: random.Random) -> str:
+        """Create an OpenCode-style identifier."""
+        return f"{prefix}_" + ''.join(rng.choice(_ID_ALPHABET) for _ in range(26))
+
+    @staticmethod
+    def _project_id(project_path: str) -> str:
+        """Derive a stable project directory name from a project path."""
+        return hashlib.sha1(project_path.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _make_title(rng: random.Random, index: int) -> str:
+        """Create a plausible session title."""
+        verb = rng.choice(TITLE_WORDS[:8])
+        subject = rng.choice(TITLE_WORDS[8:])
+        return f"{verb} {subject} #{index + 1}"
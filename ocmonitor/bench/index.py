@@ -0,0 +1,174 @@
+"""Benchmark date-range queries: linear scans against the sorted time indexes.
+
+Builds a synthetic interaction timeline and the matching per-session
+summaries, then answers the same random date ranges twice: once with the
+linear filters the reports used before (checking every interaction, or
+every session's ``start_time``), once through ``UsageTimeline.slice`` and
+``SessionIndex.select``. Also times building the indexes and reading a
+persisted timeline back. A per-query budget turns it into a regression
+check for CI.
+
+Usage::
+
+    python -m ocmonitor.bench.index --count 1000000
+    python -m ocmonitor.bench.index --max-query-ms 5
+"""
+
+import argparse
+import marshal
+import random
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+from ..models.records import SessionSummary
+from ..models.timeline import SessionIndex, UsageTimeline
+from ..utils.time_utils import TimeUtils
+
+MODELS = ["claude-sonnet-4-20250514", "claude-opus-4", "grok-code", "kimi-k2"]
+
+INTERACTIONS_PER_SESSION = 20
+
+START_DATE = date(2025, 1, 1)
+
+
+def build_timeline(count: int, days: int, seed: int = 0) -> Tuple[List[tuple], List[SessionSummary]]:
+    """Create interaction entries and session summaries spread over ``days``.
+
+    Args:
+        count: Number of interactions
+        days: Number of days the sessions start in
+        seed: Random seed
+
+    Returns:
+        Tuple of (unsorted timeline entries, session summaries)
+    """
+    rng = random.Random(seed)
+    start_ms = int(TimeUtils.date_start_timestamp(START_DATE) * 1000)
+    # A few shared token rows keep the entries small enough for millions
+    token_rows = [
+        (1, rng.randint(100, 20000), rng.randint(50, 4000), rng.randint(0, 5000), rng.randint(0, 50000))
+        for _ in range(64)
+    ]
+
+    entries = []
+    summaries = []
+    for first in range(0, count, INTERACTIONS_PER_SESSION):
+        session_id = f"ses_{first:08d}"
+        created = start_ms + rng.randrange(days * 86400000)
+        session_start = created
+        for _ in range(min(INTERACTIONS_PER_SESSION, count - first)):
+            entries.append((created, session_id, rng.choice(MODELS), rng.choice(token_rows)))
+            created += rng.randint(5000, 600000)
+        summaries.append(SessionSummary(session_id, Path(session_id), start_ms=session_start))
+    return entries, summaries
+
+
+def random_ranges(queries: int, days: int, seed: int = 0) -> List[Tuple[date, date]]:
+    """Create random inclusive date ranges of one to 31 days."""
+    rng = random.Random(seed + 1)
+    ranges = []
+    for _ in range(queries):
+        first = START_DATE + timedelta(days=rng.randrange(days))
+        ranges.append((first, first + timedelta(days=rng.randint(0, 30))))
+    return ranges
+
+
+def linear_interactions(timeline: UsageTimeline, start_ms: int, end_ms: int) -> int:
+    """Sum input tokens in a range by checking every interaction."""
+    total = 0
+    for timestamp, input in zip(timeline.timestamps, timeline.input):
+        if start_ms <= timestamp < end_ms:
+            total += input
+    return total
+
+
+def indexed_interactions(timeline: UsageTimeline, start_ms: int, end_ms: int) -> int:
+    """Sum input tokens in a range through binary search."""
+    lo, hi = timeline.slice(start_ms, end_ms)
+    return sum(timeline.input[lo:hi])
+
+
+def linear_sessions(sessions: Sequence[SessionSummary], start_date: date, end_date: date) -> int:
+    """Count sessions by start date like the previous per-session filter."""
+    return sum(
+        1 for session in sessions
+        if session.start_time and TimeUtils.date_in_range(session.start_time.date(), start_date, end_date)
+    )
+
+
+def time_queries(function, arguments: Sequence[tuple]) -> Tuple[float, List[int]]:
+    """Run a query function for every argument tuple.
+
+    Returns:
+        Tuple of (seconds per query, results)
+    """
+    start = time.perf_counter()
+    results = [function(*args) for args in arguments]
+    return (time.perf_counter() - start) / len(arguments), results
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the index benchmark and print a comparison."""
+    parser = argparse.ArgumentParser(description="Compare linear date filters with sorted time indexes")
+    parser.add_argument("--count", type=int, default=1000000, help="Number of interactions")
+    parser.add_argument("--days", type=int, default=365, help="Days the sessions are spread over")
+    parser.add_argument("--queries", type=int, default=20, help="Number of random date ranges")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--max-query-ms", type=float, default=None,
+                        help="Fail if an indexed query takes longer on average")
+    options = parser.parse_args(argv)
+
+    entries, summaries = build_timeline(options.count, options.days, options.seed)
+    ranges = random_ranges(options.queries, options.days, options.seed)
+    bounds = [TimeUtils.date_range_ms(first, last) for first, last in ranges]
+
+    start = time.perf_counter()
+    timeline = UsageTimeline(entries)
+    timeline_build = time.perf_counter() - start
+    del entries
+
+    start = time.perf_counter()
+    session_index = SessionIndex(summaries)
+    index_build = time.perf_counter() - start
+
+    data = marshal.dumps(timeline.to_dict())
+    start = time.perf_counter()
+    UsageTimeline.from_dict(marshal.loads(data))
+    timeline_load = time.perf_counter() - start
+
+    linear_i, linear_i_results = time_queries(lambda lo, hi: linear_interactions(timeline, lo, hi), bounds)
+    indexed_i, indexed_i_results = time_queries(lambda lo, hi: indexed_interactions(timeline, lo, hi), bounds)
+    linear_s, linear_s_results = time_queries(lambda first, last: linear_sessions(summaries, first, last), ranges)
+    indexed_s, indexed_s_results = time_queries(lambda lo, hi: len(session_index.select(lo, hi)), bounds)
+
+    if linear_i_results != indexed_i_results or linear_s_results != indexed_s_results:
+        print("Indexed results differ from linear scans", file=sys.stderr)
+        return 1
+
+    print(f"{options.count} interactions in {len(summaries)} sessions over {options.days} days, "
+          f"{options.queries} queries")
+    print(f"{'':<30}{'linear':>12}{'indexed':>12}{'speedup':>9}")
+    for label, before, after in [
+        ("interaction range (ms/query)", linear_i, indexed_i),
+        ("session range (ms/query)", linear_s, indexed_s),
+    ]:
+        ratio = before / after if after else float("inf")
+        print(f"{label:<30}{before * 1e3:>12.2f}{after * 1e3:>12.2f}{ratio:>8.0f}x")
+    print(f"{'build timeline (ms)':<30}{'':>12}{timeline_build * 1e3:>12.1f}")
+    print(f"{'build session index (ms)':<30}{'':>12}{index_build * 1e3:>12.1f}")
+    print(f"{'load stored timeline (ms)':<30}{'':>12}{timeline_load * 1e3:>12.1f}"
+          f"  ({len(data) / 1048576:.1f} MiB)")
+
+    slowest = max(indexed_i, indexed_s) * 1e3
+    if options.max_query_ms is not None and slowest > options.max_query_ms:
+        print(f"Indexed queries take {slowest:.2f} ms, exceeding budget of {options.max_query_ms:.2f} ms",
+              file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
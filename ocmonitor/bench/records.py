@@ -0,0 +1,191 @@
+"""Benchmark pydantic session models against lightweight records.
+
+Builds the same synthetic interactions both as ``InteractionFile`` /
+``SessionData`` and as ``InteractionRecord`` / ``SessionRecord`` and reports
+construction time, memory per interaction and aggregation time. Memory
+budgets turn it into a regression check for CI.
+
+Usage::
+
+    python -m ocmonitor.bench.records --count 100000
+    python -m ocmonitor.bench.records --max-model-bytes 3000 --max-record-bytes 500
+"""
+
+import argparse
+import gc
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from ..models.analytics import TimeframeAnalyzer
+from ..models.session import InteractionFile, SessionData
+from ..models.records import InteractionRecord, SessionRecord
+from ..utils.file_utils import FileProcessor
+
+MODELS = ["claude-sonnet-4-20250514", "claude-opus-4", "grok-code", "kimi-k2"]
+
+INTERACTIONS_PER_SESSION = 20
+
+
+def sample_messages(count: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """Create message payloads shaped like OpenCode message files.
+
+    Args:
+        count: Number of messages
+        seed: Random seed
+
+    Returns:
+        List of parsed message dictionaries
+    """
+    rng = random.Random(seed)
+    start_ms = 1735689600000  # 2025-01-01
+    messages = []
+    for index in range(count):
+        created = start_ms + index * 60000 + rng.randint(0, 30000)
+        messages.append({
+            "id": f"msg_{index:08d}",
+            "role": "assistant",
+            "modelID": rng.choice(MODELS),
+            "providerID": "anthropic",
+            "tokens": {
+                "input": rng.randint(100, 20000),
+                "output": rng.randint(50, 4000),
+                "reasoning": 0,
+                "cache": {"write": rng.randint(0, 5000), "read": rng.randint(0, 50000)},
+            },
+            "time": {"created": created, "completed": created + rng.randint(500, 60000)},
+            "path": {"cwd": f"/home/user/projects/project-{index % 7}", "root": "/"},
+            "cost": 0,
+        })
+    return messages
+
+
+def build_models(messages: Sequence[Dict[str, Any]]) -> List[SessionData]:
+    """Build pydantic sessions with their raw payloads, as a pydantic-only load path would."""
+    sessions = []
+    for start in range(0, len(messages), INTERACTIONS_PER_SESSION):
+        session_id = f"ses_{start:08d}"
+        files = []
+        for offset, data in enumerate(messages[start:start + INTERACTIONS_PER_SESSION]):
+            model_id, tokens, time_data, project_path = FileProcessor._extract_interaction_fields(data)
+            files.append(InteractionFile(
+                file_path=Path(session_id) / f"msg_{offset}.json",
+                session_id=session_id,
+                model_id=model_id,
+                tokens=tokens.to_model(),
+                time_data=time_data.to_model() if time_data else None,
+                project_path=project_path,
+                raw_data=data,
+            ))
+        sessions.append(SessionData(session_id=session_id, session_path=Path(session_id), files=files))
+    return sessions
+
+
+def build_records(messages: Sequence[Dict[str, Any]]) -> List[SessionRecord]:
+    """Build session records the way ``load_session_record`` does."""
+    sessions = []
+    for start in range(0, len(messages), INTERACTIONS_PER_SESSION):
+        session_id = f"ses_{start:08d}"
+        files = []
+        for offset, data in enumerate(messages[start:start + INTERACTIONS_PER_SESSION]):
+            model_id, tokens, time_data, project_path = FileProcessor._extract_interaction_fields(data)
+            files.append(InteractionRecord(Path(session_id) / f"msg_{offset}.json",
+                                           session_id, model_id, tokens, time_data, project_path))
+        sessions.append(SessionRecord(session_id, Path(session_id), files))
+    return sessions
+
+
+def aggregate(sessions: Sequence[Any]) -> Tuple[int, float]:
+    """Run the daily/weekly/monthly aggregation used by the reports."""
+    daily, weekly, monthly = TimeframeAnalyzer.create_timeframe_breakdowns(sessions)
+    total_tokens = sum(day.total_tokens.total for day in daily)
+    total_tokens += sum(week.total_tokens.total for week in weekly)
+    total_tokens += sum(month.total_tokens.total for month in monthly)
+    return total_tokens, len(daily)
+
+
+def measure(builder: Callable[[Sequence[Dict[str, Any]]], List[Any]],
+            messages: Sequence[Dict[str, Any]]) -> Dict[str, float]:
+    """Measure construction time, memory and aggregation time for one builder.
+
+    Args:
+        builder: Function building sessions from messages
+        messages: Message payloads
+
+    Returns:
+        Dictionary with construction seconds, bytes per interaction and
+        aggregation seconds
+    """
+    gc.collect()
+    start = time.perf_counter()
+    sessions = builder(messages)
+    construct_seconds = time.perf_counter() - start
+    del sessions
+
+    gc.collect()
+    tracemalloc.start()
+    sessions = builder(messages)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    aggregate(sessions)
+    aggregate_seconds = time.perf_counter() - start
+
+    return {
+        "construct_seconds": construct_seconds,
+        "bytes_per_interaction": allocated / len(messages),
+        "aggregate_seconds": aggregate_seconds,
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the records benchmark and print a comparison."""
+    parser = argparse.ArgumentParser(description="Compare pydantic models with lightweight records")
+    parser.add_argument("--count", type=int, default=50000, help="Number of interactions")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--max-model-bytes", type=float, default=None,
+                        help="Fail if InteractionFile/SessionData use more bytes per interaction")
+    parser.add_argument("--max-record-bytes", type=float, default=None,
+                        help="Fail if InteractionRecord/SessionRecord use more bytes per interaction")
+    options = parser.parse_args(argv)
+
+    messages = sample_messages(options.count, options.seed)
+    if aggregate(build_models(messages[:200]))[0] != aggregate(build_records(messages[:200]))[0]:
+        print("Token totals differ between models and records", file=sys.stderr)
+        return 1
+
+    pydantic_result = measure(build_models, messages)
+    record_result = measure(build_records, messages)
+
+    print(f"{options.count} interactions, {INTERACTIONS_PER_SESSION} per session")
+    print(f"{'':<24}{'pydantic':>12}{'records':>12}{'ratio':>8}")
+    rows = [
+        ("construct (us/object)", "construct_seconds", 1e6 / options.count),
+        ("memory (bytes/object)", "bytes_per_interaction", 1),
+        ("aggregate (ms)", "aggregate_seconds", 1e3),
+    ]
+    for label, key, scale in rows:
+        before = pydantic_result[key] * scale
+        after = record_result[key] * scale
+        ratio = before / after if after else float("inf")
+        print(f"{label:<24}{before:>12.1f}{after:>12.1f}{ratio:>7.1f}x")
+
+    budgets = [
+        ("InteractionFile/SessionData", pydantic_result, options.max_model_bytes),
+        ("InteractionRecord/SessionRecord", record_result, options.max_record_bytes),
+    ]
+    exit_code = 0
+    for label, result, budget in budgets:
+        if budget is not None and result["bytes_per_interaction"] > budget:
+            print(f"{label}: {result['bytes_per_interaction']:.1f} bytes per interaction "
+                  f"exceeds budget of {budget:.0f}", file=sys.stderr)
+            exit_code = 1
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
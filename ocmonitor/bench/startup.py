@@ -0,0 +1,183 @@
+"""Startup-time budget checks for the OpenCode Monitor CLI.
+
+Runs short CLI invocations in fresh interpreters under ``python -X importtime``
+and checks that they stay within a time budget and do not import heavy
+modules (Rich, pydantic, the analysis services) that only real work needs.
+
+Usage::
+
+    python -m ocmonitor.bench.startup --budget-ms 100
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Snippet used to invoke the CLI in a fresh interpreter
+CLI_SNIPPET = "from ocmonitor.cli import cli; cli(prog_name='ocmonitor')"
+
+# Short commands that must start fast, with optional extra environment
+STARTUP_COMMANDS: List[Tuple[str, List[str], Dict[str, str]]] = [
+    ("--help", ["--help"], {}),
+    ("daily --help", ["daily", "--help"], {}),
+    ("config --help", ["config", "--help"], {}),
+    ("completion", [], {
+        "_OCMONITOR_COMPLETE": "bash_complete",
+        "COMP_WORDS": "ocmonitor da",
+        "COMP_CWORD": "1",
+    }),
+]
+
+# Modules that must not be imported by the startup commands above
+FORBIDDEN_MODULES = [
+    "rich",
+    "pydantic",
+    "toml",
+    "ocmonitor.config",
+    "ocmonitor.services",
+    "ocmonitor.ui",
+    "ocmonitor.models",
+]
+
+
+def parse_importtime(stderr: str) -> Dict[str, int]:
+    """Parse ``-X importtime`` output into cumulative microseconds per module.
+
+    Args:
+        stderr: Standard error captured from a ``-X importtime`` run
+
+    Returns:
+        Dictionary mapping module name to cumulative import time in microseconds
+    """
+    timings = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            cumulative = int(parts[1].strip())
+        except ValueError:
+            # Header line
+            continue
+        timings[parts[2].strip()] = cumulative
+    return timings
+
+
+def _run(args: Sequence[str], env: Optional[Dict[str, str]] = None,
+         importtime: bool = False) -> Tuple[float, str]:
+    """Run the CLI in a fresh interpreter.
+
+    Returns:
+        Tuple of (wall time in milliseconds, captured stderr)
+    """
+    command = [sys.executable]
+    if importtime:
+        command += ["-X", "importtime"]
+    command += ["-c", CLI_SNIPPET, *args]
+
+    run_env = dict(os.environ)
+    run_env.update(env or {})
+
+    start = time.perf_counter()
+    result = subprocess.run(command, env=run_env, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.PIPE, text=True)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    return elapsed_ms, result.stderr
+
+
+def measure_interpreter_baseline(repeat: int = 5) -> float:
+    """Measure the best wall time of a bare interpreter start in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "pass"], stdout=subprocess.DEVNULL,
+                       stderr=subprocess.DEVNULL)
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return best
+
+
+def measure_command(args: Sequence[str], env: Optional[Dict[str, str]] = None,
+                    repeat: int = 5) -> Dict[str, object]:
+    """Measure startup cost of one CLI invocation.
+
+    Args:
+        args: CLI arguments
+        env: Extra environment variables
+        repeat: Number of timed runs (the best is reported)
+
+    Returns:
+        Dictionary with best wall time, ``ocmonitor.cli`` import time and
+        any forbidden modules imported
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        elapsed_ms, _ = _run(args, env)
+        best = min(best, elapsed_ms)
+
+    _, stderr = _run(args, env, importtime=True)
+    timings = parse_importtime(stderr)
+    forbidden = sorted(
+        module for module in timings
+        if any(module == name or module.startswith(name + ".") for name in FORBIDDEN_MODULES)
+    )
+
+    return {
+        "wall_ms": best,
+        "ocmonitor_cli_import_ms": timings.get("ocmonitor.cli", 0) / 1000,
+        "forbidden_imports": forbidden,
+    }
+
+
+def check_startup_budget(budget_ms: float = 100.0, repeat: int = 5) -> Tuple[bool, List[Dict[str, object]]]:
+    """Check every startup command against the budget.
+
+    The budget applies to the time spent on top of a bare interpreter start,
+    so results are comparable across machines with slow interpreter startup.
+
+    Args:
+        budget_ms: Allowed overhead in milliseconds
+        repeat: Number of timed runs per command
+
+    Returns:
+        Tuple of (all within budget, per-command results)
+    """
+    baseline = measure_interpreter_baseline(repeat)
+    results = []
+    ok = True
+    for name, args, env in STARTUP_COMMANDS:
+        result = measure_command(args, env, repeat)
+        result["command"] = name
+        result["overhead_ms"] = max(0.0, result["wall_ms"] - baseline)
+        result["within_budget"] = (result["overhead_ms"] <= budget_ms
+                                   and not result["forbidden_imports"])
+        ok = ok and result["within_budget"]
+        results.append(result)
+    return ok, results
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the startup budget check and print a report."""
+    parser = argparse.ArgumentParser(description="Check OpenCode Monitor CLI startup time")
+    parser.add_argument("--budget-ms", type=float, default=100.0,
+                        help="Allowed startup overhead over a bare interpreter (ms)")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per command")
+    options = parser.parse_args(argv)
+
+    ok, results = check_startup_budget(options.budget_ms, options.repeat)
+    for result in results:
+        status = "ok" if result["within_budget"] else "OVER BUDGET"
+        print(f"{result['command']:<16} overhead {result['overhead_ms']:7.1f} ms  "
+              f"(wall {result['wall_ms']:.1f} ms, ocmonitor.cli import "
+              f"{result['ocmonitor_cli_import_ms']:.1f} ms)  {status}")
+        if result["forbidden_imports"]:
+            print(f"  heavy imports: {', '.join(result['forbidden_imports'])}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
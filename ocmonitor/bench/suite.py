@@ -0,0 +1,299 @@
+"""Benchmark suite covering every CLI command.
+
+Each command runs in a fresh interpreter against generated storage trees of
+several sizes, so the numbers include startup, scanning, aggregation and
+output exactly as a user sees them. Wall time, files per second and peak
+resident memory are recorded; results are saved as JSON and can be compared
+against a stored baseline to flag regressions.
+"""
+
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .generator import GENERATOR_MANIFEST, StorageGenerator
+
+RESULTS_VERSION = 1
+
+# Storage tree sizes as (sessions, assistant messages per session)
+BENCH_SIZES: Dict[str, Tuple[int, int]] = {
+    "small": (100, 20),
+    "medium": (500, 40),
+    "large": (2000, 100),
+}
+
+BENCH_COMMANDS = [
+    "session", "sessions", "daily", "weekly", "monthly",
+    "models", "projects", "export", "live",
+]
+
+# Fixed end date so generated trees are identical across machines and days
+BENCH_END_DATE = date(2025, 6, 30)
+BENCH_SEED = 1234
+
+CLI_SNIPPET = "from ocmonitor.cli import cli; cli(prog_name='ocmonitor')"
+LIVE_TICK_SNIPPET = "import sys; from ocmonitor.bench.suite import simulate_live_tick; simulate_live_tick(sys.argv[1])"
+
+
+def simulate_live_tick(base_path: str) -> None:
+    """Run one live dashboard update without a terminal.
+
+    Discovers the most recent session, reloads it and renders the dashboard
+    to an in-memory console, like one iteration of ``LiveMonitor``.
+
+    Args:
+        base_path: Path to directory containing sessions
+    """
+    from rich.console import Console
+
+    from ..config import config_manager
+    from ..services.live_monitor import LiveMonitor
+    from ..utils.file_utils import FileProcessor
+
+    console = Console(file=io.StringIO(), width=120)
+    monitor = LiveMonitor(config_manager.load_pricing_data(), console)
+
+    session = FileProcessor.get_most_recent_session(base_path)
+    if session is None:
+        raise SystemExit(f"No sessions found in {base_path}")
+    session = FileProcessor.load_session_data(session.session_path) or session
+    console.print(monitor._generate_dashboard(session))
+
+
+def ensure_dataset(data_dir: str, size: str) -> Dict[str, Any]:
+    """Generate the storage tree for a size unless it already exists.
+
+    Args:
+        data_dir: Directory holding generated datasets
+        size: One of ``BENCH_SIZES``
+
+    Returns:
+        Generator summary for the dataset
+    """
+    sessions, messages = BENCH_SIZES[size]
+    root = Path(data_dir) / f"{size}-{sessions}x{messages}-seed{BENCH_SEED}"
+    manifest = root / GENERATOR_MANIFEST
+
+    if manifest.exists():
+        with open(manifest, 'r', encoding='utf-8') as f:
+            dataset = json.load(f)
+        # The data directory may have moved since generation
+        dataset['messages_dir'] = str((root / "storage" / "message").resolve())
+        return dataset
+
+    generator = StorageGenerator(
+        sessions=sessions,
+        messages_per_session=messages,
+        end_date=BENCH_END_DATE,
+        seed=BENCH_SEED,
+    )
+    return generator.generate(str(root))
+
+
+def build_command(command: str, dataset: Dict[str, Any], scratch_dir: str) -> Tuple[List[str], int]:
+    """Build the argument list for one benchmarked command.
+
+    Args:
+        command: One of ``BENCH_COMMANDS``
+        dataset: Generator summary
+        scratch_dir: Directory for export output
+
+    Returns:
+        Tuple of (command line, number of message files the command reads)
+    """
+    messages_dir = dataset['messages_dir']
+    files = dataset['message_files']
+    python = [sys.executable, "-c"]
+
+    if command in ("session", "live"):
+        session_dirs = list(Path(messages_dir).iterdir())
+        if command == "session":
+            # The largest session directory in the tree
+            session_dir = max(session_dirs, key=lambda d: len(os.listdir(d)))
+            args = python + [CLI_SNIPPET, "session", str(session_dir), "--format", "json"]
+        else:
+            # Live monitoring follows the most recently modified session
+            session_dir = max(session_dirs, key=lambda d: d.stat().st_mtime)
+            args = python + [LIVE_TICK_SNIPPET, messages_dir]
+        return args, len(os.listdir(session_dir))
+
+    if command == "export":
+        output = os.path.join(scratch_dir, f"export-{time.time_ns()}.csv")
+        return python + [CLI_SNIPPET, "export", "sessions", messages_dir,
+                         "--format", "csv", "--output", output], files
+
+    return python + [CLI_SNIPPET, command, messages_dir, "--format", "json"], files
+
+
+def run_measured(args: Sequence[str]) -> Tuple[float, Optional[int], int]:
+    """Run a command and measure it.
+
+    Returns:
+        Tuple of (wall seconds, peak RSS in KiB or None if unavailable, exit code)
+    """
+    start = time.perf_counter()
+    process = subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    if hasattr(os, 'wait4'):
+        _, status, usage = os.wait4(process.pid, 0)
+        elapsed = time.perf_counter() - start
+        process.returncode = os.waitstatus_to_exitcode(status)
+        # ru_maxrss is KiB on Linux and bytes on macOS
+        peak_rss = usage.ru_maxrss // 1024 if sys.platform == 'darwin' else usage.ru_maxrss
+        return elapsed, peak_rss, process.returncode
+
+    returncode = process.wait()
+    return time.perf_counter() - start, None, returncode
+
+
+def run_suite(data_dir: str, sizes: Sequence[str], commands: Sequence[str],
+              repeat: int = 3, progress=None) -> Dict[str, Any]:
+    """Run the benchmark suite.
+
+    Args:
+        data_dir: Directory holding generated datasets
+        sizes: Dataset sizes to run
+        commands: Commands to benchmark
+        repeat: Timed runs per command (the median is reported)
+        progress: Optional callback receiving a status line per result
+
+    Returns:
+        Results dictionary suitable for saving as JSON
+    """
+    results = []
+    with tempfile.TemporaryDirectory(prefix="ocmonitor-bench-") as scratch_dir:
+        for size in sizes:
+            dataset = ensure_dataset(data_dir, size)
+
+            for command in commands:
+                timings = []
+                peak_rss = None
+                failed = False
+                for _ in range(repeat):
+                    args, files = build_command(command, dataset, scratch_dir)
+                    elapsed, rss, returncode = run_measured(args)
+                    if returncode != 0:
+                        failed = True
+                        break
+                    timings.append(elapsed)
+                    if rss is not None:
+                        peak_rss = max(peak_rss or 0, rss)
+
+                result = {
+                    "size": size,
+                    "command": command,
+                    "files": files,
+                    "wall_seconds": timings,
+                    "median_seconds": statistics.median(timings) if timings else None,
+                    "files_per_second": files / statistics.median(timings) if timings else None,
+                    "peak_rss_kb": peak_rss,
+                    "failed": failed,
+                }
+                results.append(result)
+                if progress:
+                    progress(format_result(result))
+
+    return {
+        "version": RESULTS_VERSION,
+        "created": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def format_result(result: Dict[str, Any]) -> str:
+    """Format one benchmark result as a table row."""
+    if result['failed']:
+        return f"{result['size']:<8}{result['command']:<10}FAILED"
+    rss = f"{result['peak_rss_kb'] / 1024:8.1f} MiB" if result['peak_rss_kb'] else "      n/a"
+    return (f"{result['size']:<8}{result['command']:<10}"
+            f"{result['median_seconds']:8.3f} s {result['files_per_second']:12,.0f} files/s {rss}")
+
+
+def save_results(results: Dict[str, Any], path: str) -> None:
+    """Save benchmark results as JSON."""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    """Load benchmark results saved by :func:`save_results`.
+
+    Raises:
+        ValueError: If the file is not a benchmark results file
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if not isinstance(data, dict) or data.get('version') != RESULTS_VERSION or 'results' not in data:
+        raise ValueError(f"Not a benchmark results file: {path}")
+    return data
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any],
+                    threshold: float = 0.10) -> List[Dict[str, Any]]:
+    """Compare two result sets.
+
+    Args:
+        baseline: Baseline results
+        current: Current results
+        threshold: Relative slowdown or memory growth that counts as a regression
+
+    Returns:
+        One comparison per (size, command) present in both result sets
+    """
+    baseline_index = {(r['size'], r['command']): r for r in baseline['results']}
+    comparisons = []
+
+    for result in current['results']:
+        before = baseline_index.get((result['size'], result['command']))
+        if before is None:
+            continue
+
+        time_ratio = None
+        rss_ratio = None
+        if before['median_seconds'] and result['median_seconds']:
+            time_ratio = result['median_seconds'] / before['median_seconds']
+        if before['peak_rss_kb'] and result['peak_rss_kb']:
+            rss_ratio = result['peak_rss_kb'] / before['peak_rss_kb']
+
+        regressed = (result['failed'] and not before['failed']) \
+            or (time_ratio is not None and time_ratio > 1 + threshold) \
+            or (rss_ratio is not None and rss_ratio > 1 + threshold)
+
+        comparisons.append({
+            "size": result['size'],
+            "command": result['command'],
+            "baseline_seconds": before['median_seconds'],
+            "current_seconds": result['median_seconds'],
+            "time_ratio": time_ratio,
+            "baseline_rss_kb": before['peak_rss_kb'],
+            "current_rss_kb": result['peak_rss_kb'],
+            "rss_ratio": rss_ratio,
+            "regressed": regressed,
+        })
+
+    return comparisons
+
+
+def format_comparison(comparison: Dict[str, Any]) -> str:
+    """Format one comparison as a table row."""
+    def ratio(value: Optional[float]) -> str:
+        return f"{value:6.2f}x" if value is not None else "    n/a"
+
+    seconds = "n/a"
+    if comparison['baseline_seconds'] is not None and comparison['current_seconds'] is not None:
+        seconds = f"{comparison['baseline_seconds']:.3f}s -> {comparison['current_seconds']:.3f}s"
+    status = "REGRESSION" if comparison['regressed'] else "ok"
+    return (f"{comparison['size']:<8}{comparison['command']:<10}{seconds:<22}"
+            f"time {ratio(comparison['time_ratio'])}  rss {ratio(comparison['rss_ratio'])}  {status}")
@@ -1,23 +1,25 @@
-"""Command line interface for OpenCode Monitor."""
+"""Command line interface for OpenCode Monitor.
+
+Startup cost matters here: ``--help``, shell completion and short commands
+should not pay for Rich, pydantic or the analysis services. Heavy modules
+are therefore imported inside the code that needs them, and services are
+built on first access through :class:`LazyServices`.
+"""
 
 import click
 import json
-from decimal import Decimal
+from datetime import datetime
 from pathlib import Path
-from typing import Optional
-from rich.console import Console
-
-from .config import config_manager
-from .services.session_analyzer import SessionAnalyzer
-from .services.report_generator import ReportGenerator
-from .services.export_service import ExportService
-from .services.live_monitor import LiveMonitor
-from .utils.error_handling import ErrorHandler, handle_errors, create_user_friendly_error
+from typing import Any, Callable, Dict, Optional
+
 from . import __version__
+from .utils import instrumentation
 
 
 def json_serializer(obj):
     """Custom JSON serializer for special types."""
+    from decimal import Decimal
+
     if hasattr(obj, 'model_dump'):
         return obj.model_dump()
     elif isinstance(obj, Decimal):
@@ -28,55 +30,211 @@ def json_serializer(obj):
         return str(obj)
 
 
+def create_user_friendly_error(error: Exception) -> str:
+    """Create a user-friendly error message (imports error utilities on demand)."""
+    from .utils.error_handling import create_user_friendly_error as _create_user_friendly_error
+    return _create_user_friendly_error(error)
+
+
+class TimeBound(click.ParamType):
+    """Click parameter type for ``--since``/``--until`` values."""
+
+    name = "time"
+
+    def convert(self, value, param, ctx):
+        if isinstance(value, datetime):
+            return value
+        from .utils.time_utils import TimeUtils
+
+        try:
+            return TimeUtils.parse_time_bound(value)
+        except ValueError as e:
+            self.fail(str(e), param, ctx)
+
+
+class SessionPathType(click.Path):
+    """Existing path, or a session directory pruned into a pack by ``archive``."""
+
+    def __init__(self):
+        super().__init__(exists=True)
+
+    def convert(self, value, param, ctx):
+        if isinstance(value, str) and Path(value).name.startswith('ses_') and not Path(value).exists():
+            from .utils.archive_storage import find_packed_session
+
+            try:
+                packed = find_packed_session(Path(value))
+            except ValueError as e:
+                self.fail(str(e), param, ctx)
+            if packed is not None:
+                return str(packed)
+        return super().convert(value, param, ctx)
+
+
+def time_window_options(func: Callable) -> Callable:
+    """Add ``--since``/``--until`` interaction filters to a report command."""
+    func = click.option('--until', type=TimeBound(),
+                        help='Only count interactions created before this time')(func)
+    func = click.option('--since', type=TimeBound(),
+                        help='Only count interactions created at or after this time '
+                             '(e.g. 24h, 7d, today, 2024-01-15)')(func)
+    return func
+
+
+def check_time_window(ctx: click.Context, since: Optional[datetime], until: Optional[datetime]):
+    """Exit with an error if ``--since`` is not before ``--until``."""
+    if since and until and since >= until:
+        click.echo("--since must be earlier than --until.", err=True)
+        ctx.exit(1)
+
+
+class LazyServices(dict):
+    """Context object that builds configuration and services on first access.
+
+    Behaves like the plain dict previously stored in ``ctx.obj``; missing
+    keys such as ``'config'`` or ``'report_generator'`` are constructed by
+    the matching ``_build_*`` method the first time a command asks for them.
+    """
+
+    def __init__(self, config_path: Optional[str] = None, verbose: bool = False):
+        super().__init__(verbose=verbose)
+        self._config_path = config_path
+
+    def __missing__(self, key: str) -> Any:
+        builder: Optional[Callable[[], Any]] = getattr(self, f"_build_{key}", None)
+        if builder is None:
+            raise KeyError(key)
+        with instrumentation.span(f"init.{key}"):
+            value = builder()
+        self[key] = value
+        return value
+
+    def _config_manager(self):
+        from .config import config_manager
+
+        if self._config_path and config_manager.config_path != self._config_path:
+            config_manager.config_path = self._config_path
+            config_manager.reload()
+        return config_manager
+
+    def _initialization_error(self, error: Exception) -> SystemExit:
+        # Report like the eager startup did; SystemExit is not swallowed by
+        # the ``except Exception`` blocks in the command handlers.
+        error_msg = create_user_friendly_error(error)
+        click.echo(f"Error initializing OpenCode Monitor: {error_msg}", err=True)
+        if self['verbose']:
+            click.echo(f"Details: {str(error)}", err=True)
+        return SystemExit(1)
+
+    def _build_console(self):
+        from rich.console import Console
+        return Console()
+
+    def _build_error_handler(self):
+        from .utils.error_handling import ErrorHandler
+        return ErrorHandler(verbose=self['verbose'])
+
+    def _build_config(self):
+        try:
+            return self._config_manager().config
+        except Exception as e:
+            raise self._initialization_error(e)
+
+    def _build_pricing_data(self):
+        try:
+            return self._config_manager().load_pricing_data()
+        except Exception as e:
+            raise self._initialization_error(e)
+
+    def _build_analyzer(self):
+        from .services.session_analyzer import SessionAnalyzer
+        summary_cache = rollup_store = None
+        config = self['config']
+        if config.analytics.summary_cache:
+            from .utils.summary_cache import SessionSummaryCache
+            summary_cache = SessionSummaryCache(str(Path(config.paths.cache_dir) / "sessions"))
+        if config.analytics.daily_rollups:
+            from .utils.rollup_store import DailyRollupStore
+            rollup_store = DailyRollupStore(config.paths.cache_dir, summary_cache)
+        interaction_cache = None
+        if config.analytics.interaction_cache:
+            from .utils.interaction_cache import InteractionCache
+            interaction_cache = InteractionCache(config.paths.cache_dir)
+        return SessionAnalyzer(self['pricing_data'], summary_cache, rollup_store, self['timezone'],
+                               interaction_cache=interaction_cache)
+
+    def _build_timezone(self):
+        from .utils.time_utils import TimeUtils
+        return TimeUtils.get_timezone(self['config'].analytics.timezone)
+
+    def _build_report_generator(self):
+        from .services.report_generator import ReportGenerator
+        return ReportGenerator(self['analyzer'], self['console'])
+
+    def _build_export_service(self):
+        from .services.export_service import ExportService
+        return ExportService(self['config'].paths.export_dir, self['timezone'])
+
+    def _build_live_monitor(self):
+        from .services.live_monitor import LiveMonitor
+        return LiveMonitor(self['pricing_data'], self['console'])
+
+
 @click.group()
 @click.version_option(version=__version__)
 @click.option('--config', '-c', type=click.Path(exists=True),
               help='Path to configuration file')
 @click.option('--verbose', '-v', is_flag=True, help='Enable verbose output')
+@click.option('--timings', is_flag=True,
+              help='Print a per-stage timing breakdown to stderr at exit')
+@click.option('--trace', 'trace_file', type=click.Path(dir_okay=False),
+              help='Write a Chrome trace of the timed stages to this file')
+@click.option('--profile', 'profile_file', type=click.Path(dir_okay=False),
+              help='Run under cProfile and write the statistics to this .prof file')
+@click.option('--profile-top', type=click.IntRange(min=1), default=20, show_default=True,
+              help='Number of functions in the --profile summary')
+@click.option('--memory-profile', is_flag=True,
+              help='Print per-stage memory usage and top allocation sites to stderr at exit')
+@click.option('--memory-top', type=click.IntRange(min=0), default=10, show_default=True,
+              help='Allocation sites per stage in the --memory-profile report (0 to skip)')
 @click.pass_context
-def cli(ctx: click.Context, config: Optional[str], verbose: bool):
+def cli(ctx: click.Context, config: Optional[str], verbose: bool, timings: bool,
+        trace_file: Optional[str], profile_file: Optional[str], profile_top: int,
+        memory_profile: bool, memory_top: int):
     """OpenCode Monitor - Analytics and monitoring for OpenCode sessions.
 
     Monitor token usage, costs, and performance metrics from your OpenCode
     AI coding sessions with beautiful tables and real-time dashboards.
     """
-    # Initialize context object
-    ctx.ensure_object(dict)
-    ctx.obj['verbose'] = verbose
-    ctx.obj['console'] = Console()
-    ctx.obj['error_handler'] = ErrorHandler(verbose=verbose)
-
-    # Load configuration
-    try:
-        if config:
-            config_manager.config_path = config
-            config_manager.reload()
-
-        ctx.obj['config'] = config_manager.config
-        ctx.obj['pricing_data'] = config_manager.load_pricing_data()
-
-        # Initialize services
-        analyzer = SessionAnalyzer(ctx.obj['pricing_data'])
-        ctx.obj['analyzer'] = analyzer
-        ctx.obj['report_generator'] = ReportGenerator(analyzer, ctx.obj['console'])
-        ctx.obj['export_service'] = ExportService(ctx.obj['config'].paths.export_dir)
-        ctx.obj['live_monitor'] = LiveMonitor(ctx.obj['pricing_data'], ctx.obj['console'])
-
-    except Exception as e:
-        error_msg = create_user_friendly_error(e)
-        click.echo(f"Error initializing OpenCode Monitor: {error_msg}", err=True)
-        if verbose:
-            click.echo(f"Details: {str(e)}", err=True)
-        ctx.exit(1)
+    if timings or trace_file or memory_profile:
+        instrumentation.enable(trace=bool(trace_file), memory=memory_profile, memory_top=memory_top)
+    if memory_profile:
+        ctx.call_on_close(lambda: click.echo(instrumentation.format_memory_report(), err=True))
+    if timings:
+        ctx.call_on_close(lambda: click.echo(instrumentation.format_report(), err=True))
+    if trace_file:
+        def write_trace():
+            count = instrumentation.write_trace(trace_file)
+            click.echo(f"Trace with {count:,} spans written to {trace_file}", err=True)
+        ctx.call_on_close(write_trace)
+    if profile_file:
+        profiler = instrumentation.start_profiler()
+        ctx.call_on_close(lambda: click.echo(
+            instrumentation.finish_profiler(profiler, profile_file, profile_top), err=True))
+
+    # Configuration and services are loaded lazily by the commands that use them
+    ctx.obj = LazyServices(config, verbose)
 
 
 @cli.command()
-@click.argument('path', type=click.Path(exists=True), required=False)
+@click.argument('path', type=SessionPathType(), required=False)
 @click.option('--format', '-f', 'output_format',
               type=click.Choice(['table', 'json', 'csv']),
               default='table', help='Output format')
+@time_window_options
 @click.pass_context
-def session(ctx: click.Context, path: Optional[str], output_format: str):
+def session(ctx: click.Context, path: Optional[str], output_format: str,
+            since: Optional[datetime], until: Optional[datetime]):
     """Analyze a single OpenCode session directory.
 
     PATH: Path to session directory (defaults to current directory)
@@ -84,9 +242,11 @@ def session(ctx: click.Context, path: Optional[str], output_format: str):
     if not path:
         path = str(Path.cwd())
 
+    check_time_window(ctx, since, until)
+
     try:
         report_generator = ctx.obj['report_generator']
-        result = report_generator.generate_single_session_report(path, output_format)
+        result = report_generator.generate_single_session_report(path, output_format, since, until)
 
         if result is None:
             click.echo("No valid session data found in the specified directory.", err=True)
@@ -112,8 +272,12 @@ def session(ctx: click.Context, path: Optional[str], output_format: str):
               default='table', help='Output format')
 @click.option('--limit', '-l', type=int, default=None,
               help='Limit number of sessions to analyze')
+@click.option('--sort-by', type=click.Choice(['recent', 'cost', 'tokens']), default='recent',
+              help='Which sessions --limit keeps: most recent, most expensive or most tokens')
+@time_window_options
 @click.pass_context
-def sessions(ctx: click.Context, path: Optional[str], output_format: str, limit: Optional[int]):
+def sessions(ctx: click.Context, path: Optional[str], output_format: str, limit: Optional[int],
+             sort_by: str, since: Optional[datetime], until: Optional[datetime]):
     """Analyze all OpenCode sessions in a directory.
 
     PATH: Path to directory containing session folders
@@ -122,24 +286,31 @@ def sessions(ctx: click.Context, path: Optional[str], output_format: str, limit:
     config = ctx.obj['config']
 
     if not path:
-        path = config.paths.messages_dir
+        path = config.paths.storage_path
+
+    check_time_window(ctx, since, until)
 
     try:
         analyzer = ctx.obj['analyzer']
         report_generator = ctx.obj['report_generator']
 
-        if limit:
-            sessions = analyzer.analyze_all_sessions(path, limit)
+        sessions = analyzer.analyze_all_sessions(path, limit, since=since, until=until,
+                                               sort_by=sort_by, summaries=True)
+        if limit and sort_by == 'recent':
             click.echo(f"Analyzing {len(sessions)} most recent sessions...")
+        elif limit:
+            click.echo(f"Analyzing {len(sessions)} sessions with the highest {sort_by}...")
         else:
-            sessions = analyzer.analyze_all_sessions(path)
             click.echo(f"Analyzing {len(sessions)} sessions...")
 
         if not sessions:
             click.echo("No sessions found in the specified directory.", err=True)
             ctx.exit(1)
 
-        result = report_generator.generate_sessions_summary_report(path, limit, output_format)
+        # Reuse the sessions loaded above instead of scanning the directory again
+        result = report_generator.generate_sessions_summary_report(
+            path, limit, output_format, since, until, sort_by, sessions=sessions
+        )
 
         if output_format == 'json':
             click.echo(json.dumps(result, indent=2, default=json_serializer))
@@ -169,7 +340,7 @@ def live(ctx: click.Context, path: Optional[str], interval: Optional[int], no_co
     config = ctx.obj['config']
 
     if not path:
-        path = config.paths.messages_dir
+        path = config.paths.storage_path
 
     if interval is None:
         interval = config.ui.live_refresh_interval
@@ -189,7 +360,7 @@ def live(ctx: click.Context, path: Optional[str], interval: Optional[int], no_co
                 click.echo(f"Warning: {warning}")
 
         click.echo(f"[green]Starting live dashboard...[/green]")
-        click.echo(f"Monitoring: {path}")
+        click.echo(f"Monitoring: {path if isinstance(path, str) else ', '.join(path)}")
         click.echo(f"Update interval: {interval}s")
 
         live_monitor.start_monitoring(path, interval)
@@ -210,8 +381,10 @@ def live(ctx: click.Context, path: Optional[str], interval: Optional[int], no_co
 @click.option('--format', '-f', 'output_format',
               type=click.Choice(['table', 'json', 'csv']),
               default='table', help='Output format')
+@time_window_options
 @click.pass_context
-def daily(ctx: click.Context, path: Optional[str], month: Optional[str], output_format: str):
+def daily(ctx: click.Context, path: Optional[str], month: Optional[str], output_format: str,
+          since: Optional[datetime], until: Optional[datetime]):
     """Show daily breakdown of OpenCode usage.
 
     PATH: Path to directory containing session folders
@@ -220,11 +393,13 @@ def daily(ctx: click.Context, path: Optional[str], month: Optional[str], output_
     config = ctx.obj['config']
 
     if not path:
-        path = config.paths.messages_dir
+        path = config.paths.storage_path
+
+    check_time_window(ctx, since, until)
 
     try:
         report_generator = ctx.obj['report_generator']
-        result = report_generator.generate_daily_report(path, month, output_format)
+        result = report_generator.generate_daily_report(path, month, output_format, since, until)
 
         if output_format == 'json':
             click.echo(json.dumps(result, indent=2, default=json_serializer))
@@ -245,8 +420,10 @@ def daily(ctx: click.Context, path: Optional[str], month: Optional[str], output_
 @click.option('--format', '-f', 'output_format',
               type=click.Choice(['table', 'json', 'csv']),
               default='table', help='Output format')
+@time_window_options
 @click.pass_context
-def weekly(ctx: click.Context, path: Optional[str], year: Optional[int], output_format: str):
+def weekly(ctx: click.Context, path: Optional[str], year: Optional[int], output_format: str,
+           since: Optional[datetime], until: Optional[datetime]):
     """Show weekly breakdown of OpenCode usage.
 
     PATH: Path to directory containing session folders
@@ -255,11 +432,13 @@ def weekly(ctx: click.Context, path: Optional[str], year: Optional[int], output_
     config = ctx.obj['config']
 
     if not path:
-        path = config.paths.messages_dir
+        path = config.paths.storage_path
+
+    check_time_window(ctx, since, until)
 
     try:
         report_generator = ctx.obj['report_generator']
-        result = report_generator.generate_weekly_report(path, year, output_format)
+        result = report_generator.generate_weekly_report(path, year, output_format, since, until)
 
         if output_format == 'json':
             click.echo(json.dumps(result, indent=2, default=json_serializer))
@@ -280,8 +459,10 @@ def weekly(ctx: click.Context, path: Optional[str], year: Optional[int], output_
 @click.option('--format', '-f', 'output_format',
               type=click.Choice(['table', 'json', 'csv']),
               default='table', help='Output format')
+@time_window_options
 @click.pass_context
-def monthly(ctx: click.Context, path: Optional[str], year: Optional[int], output_format: str):
+def monthly(ctx: click.Context, path: Optional[str], year: Optional[int], output_format: str,
+            since: Optional[datetime], until: Optional[datetime]):
     """Show monthly breakdown of OpenCode usage.
 
     PATH: Path to directory containing session folders
@@ -290,11 +471,13 @@ def monthly(ctx: click.Context, path: Optional[str], year: Optional[int], output
     config = ctx.obj['config']
 
     if not path:
-        path = config.paths.messages_dir
+        path = config.paths.storage_path
+
+    check_time_window(ctx, since, until)
 
     try:
         report_generator = ctx.obj['report_generator']
-        result = report_generator.generate_monthly_report(path, year, output_format)
+        result = report_generator.generate_monthly_report(path, year, output_format, since, until)
 
         if output_format == 'json':
             click.echo(json.dumps(result, indent=2, default=json_serializer))
@@ -318,9 +501,11 @@ def monthly(ctx: click.Context, path: Optional[str], year: Optional[int], output
 @click.option('--format', '-f', 'output_format',
               type=click.Choice(['table', 'json', 'csv']),
               default='table', help='Output format')
+@time_window_options
 @click.pass_context
 def models(ctx: click.Context, path: Optional[str], timeframe: str,
-           start_date: Optional[str], end_date: Optional[str], output_format: str):
+           start_date: Optional[str], end_date: Optional[str], output_format: str,
+           since: Optional[datetime], until: Optional[datetime]):
     """Show model usage breakdown and statistics.
 
     PATH: Path to directory containing session folders
@@ -329,12 +514,14 @@ def models(ctx: click.Context, path: Optional[str], timeframe: str,
     config = ctx.obj['config']
 
     if not path:
-        path = config.paths.messages_dir
+        path = config.paths.storage_path
+
+    check_time_window(ctx, since, until)
 
     try:
         report_generator = ctx.obj['report_generator']
         result = report_generator.generate_models_report(
-            path, timeframe, start_date, end_date, output_format
+            path, timeframe, start_date, end_date, output_format, since, until
         )
 
         if output_format == 'json':
@@ -359,9 +546,11 @@ def models(ctx: click.Context, path: Optional[str], timeframe: str,
 @click.option('--format', '-f', 'output_format',
               type=click.Choice(['table', 'json', 'csv']),
               default='table', help='Output format')
+@time_window_options
 @click.pass_context
 def projects(ctx: click.Context, path: Optional[str], timeframe: str,
-           start_date: Optional[str], end_date: Optional[str], output_format: str):
+           start_date: Optional[str], end_date: Optional[str], output_format: str,
+           since: Optional[datetime], until: Optional[datetime]):
     """Show project usage breakdown and statistics.
 
     PATH: Path to directory containing session folders
@@ -370,12 +559,14 @@ def projects(ctx: click.Context, path: Optional[str], timeframe: str,
     config = ctx.obj['config']
 
     if not path:
-        path = config.paths.messages_dir
+        path = config.paths.storage_path
+
+    check_time_window(ctx, since, until)
 
     try:
         report_generator = ctx.obj['report_generator']
         result = report_generator.generate_projects_report(
-            path, timeframe, start_date, end_date, output_format
+            path, timeframe, start_date, end_date, output_format, since, until
         )
 
         if output_format == 'json':
@@ -391,54 +582,378 @@ def projects(ctx: click.Context, path: Optional[str], timeframe: str,
         ctx.exit(1)
 
 
+def parse_dimensions(ctx: click.Context, param: click.Parameter, value: str):
+    """Parse a comma-separated list of usage cube dimensions."""
+    from .models.cube import CUBE_DIMENSIONS
+
+    dimensions = [item.strip() for item in value.split(',') if item.strip()]
+    for dimension in dimensions:
+        if dimension not in CUBE_DIMENSIONS:
+            raise click.BadParameter(
+                f"unknown dimension '{dimension}' (choose from {', '.join(CUBE_DIMENSIONS)})")
+    return dimensions
+
+
+def parse_where(ctx: click.Context, param: click.Parameter, values):
+    """Parse ``DIMENSION=VALUE`` filters into labels per dimension."""
+    from .models.cube import CUBE_DIMENSIONS
+
+    where: Dict[str, list] = {}
+    for item in values:
+        dimension, separator, label = item.partition('=')
+        dimension = dimension.strip()
+        if not separator or dimension not in CUBE_DIMENSIONS:
+            raise click.BadParameter(
+                f"expected DIMENSION=VALUE with a dimension from {', '.join(CUBE_DIMENSIONS)}, got '{item}'")
+        where.setdefault(dimension, []).append(label.strip())
+    return where
+
+
+@cli.command()
+@click.argument('path', type=click.Path(exists=True), required=False)
+@click.option('--by', type=str, default='month,project,model', show_default=True, callback=parse_dimensions,
+              help='Comma-separated dimensions to group by: year, month, week, day, model, project, session')
+@click.option('--where', '-w', multiple=True, callback=parse_where,
+              help='Only include one label of a dimension, e.g. project=api or month=2025-06 (repeatable)')
+@click.option('--start-date', type=str, help='Start date (YYYY-MM-DD)')
+@click.option('--end-date', type=str, help='End date (YYYY-MM-DD)')
+@click.option('--sort-by', type=click.Choice(['key', 'cost', 'tokens']), default='key',
+              help='Order rows by their labels, or by cost or tokens descending')
+@click.option('--limit', '-l', type=click.IntRange(min=1), default=None, help='Maximum number of rows')
+@click.option('--format', '-f', 'output_format',
+              type=click.Choice(['table', 'json']),
+              default='table', help='Output format')
+@click.pass_context
+def pivot(ctx: click.Context, path: Optional[str], by: list, where: Dict[str, list],
+          start_date: Optional[str], end_date: Optional[str], sort_by: str,
+          limit: Optional[int], output_format: str):
+    """Pivot usage by day, model, project and session.
+
+    Groups usage by any combination of time level (year, month, week or
+    day), model, project and session. Leave a dimension out to roll it up,
+    add one to drill down, and narrow to a group with --where.
+
+    PATH: Path to directory containing session folders
+          (defaults to configured messages directory)
+    """
+    config = ctx.obj['config']
+
+    if not path:
+        path = config.paths.storage_path
+
+    try:
+        report_generator = ctx.obj['report_generator']
+        result = report_generator.generate_pivot_report(
+            path, by, start_date, end_date, where, sort_by, limit, output_format
+        )
+
+        if output_format == 'json':
+            click.echo(json.dumps(result, indent=2, default=json_serializer))
+
+    except Exception as e:
+        error_msg = create_user_friendly_error(e)
+        click.echo(f"Error generating pivot: {error_msg}", err=True)
+        if ctx.obj['verbose']:
+            click.echo(f"Details: {str(e)}", err=True)
+        ctx.exit(1)
+
+
 @cli.command()
-@click.argument('report_type', type=click.Choice([
-    'session', 'sessions', 'daily', 'weekly', 'monthly', 'models', 'projects'
-]))
 @click.argument('path', type=click.Path(exists=True), required=False)
+@click.option('--output', '-o', type=click.Path(dir_okay=False),
+              help='Rollup file to write (default: <export_dir>/rollup-<source>.json.gz)')
+@click.option('--source', type=str, default=None,
+              help='Name recorded for this machine (default: host name)')
+@click.pass_context
+def rollup(ctx: click.Context, path: Optional[str], output: Optional[str], source: Optional[str]):
+    """Write a mergeable rollup of this machine's usage.
+
+    The rollup holds usage sums per day, model and project and session
+    sketches, but no message contents. Combine rollups from several
+    machines with 'ocmonitor merge'.
+
+    PATH: Path to directory containing session folders
+          (defaults to configured messages directory)
+    """
+    config = ctx.obj['config']
+
+    if not path:
+        path = config.paths.storage_path
+    if not source:
+        import socket
+        source = socket.gethostname()
+    if not output:
+        safe_source = "".join(c if c.isalnum() or c in "-_." else "_" for c in source)
+        output = str(Path(config.paths.export_dir) / f"rollup-{safe_source}.json.gz")
+
+    try:
+        team_rollup = ctx.obj['analyzer'].build_team_rollup(path, source)
+        Path(output).parent.mkdir(parents=True, exist_ok=True)
+        team_rollup.write(output)
+
+        first_last = team_rollup.date_range()
+        covered = f"{first_last[0]} to {first_last[1]}" if first_last else "no usage"
+        click.echo(f"Wrote rollup of {source} ({covered}, {len(team_rollup.cells)} cells) to {output}")
+
+    except Exception as e:
+        error_msg = create_user_friendly_error(e)
+        click.echo(f"Error writing rollup: {error_msg}", err=True)
+        if ctx.obj['verbose']:
+            click.echo(f"Details: {str(e)}", err=True)
+        ctx.exit(1)
+
+
+@cli.command()
+@click.argument('path', type=click.Path(exists=True, file_okay=False), required=False)
+@click.option('--older-than', 'older_than', type=click.IntRange(min=1), default=30, show_default=True,
+              help='Pack sessions last modified more than this many days ago')
+@click.option('--prune', is_flag=True, help='Delete session directories once they are packed')
+@click.pass_context
+def archive(ctx: click.Context, path: Optional[str], older_than: int, prune: bool):
+    """Pack old sessions into per-month pack files for faster scans.
+
+    Sessions not modified for --older-than days are copied into one zip per
+    month under PATH/ocmonitor-packs. Reports then list packed sessions from
+    the pack index and read a pack from one open file instead of opening
+    every message file. Originals are kept unless
+    --prune is given; 'ocmonitor session' still finds a pruned session by
+    its original path.
+
+    PATH: Path to directory containing session folders
+          (defaults to configured messages directory)
+    """
+    from .utils.file_utils import storage_roots
+    from .utils.session_packs import SessionPacker
+
+    config = ctx.obj['config']
+
+    if not path:
+        path = config.paths.storage_path
+
+    try:
+        packed = pruned = 0
+        for root in storage_roots(path):
+            if not root.is_dir():
+                click.echo(f"Skipping {root}: only session directories can be packed")
+                continue
+            for pack in SessionPacker.pack(root, older_than, prune=prune):
+                packed += pack['added']
+                pruned += pack['pruned']
+                size_mb = pack['size_bytes'] / (1024 * 1024)
+                click.echo(f"{pack['month']}: {pack['sessions']} sessions "
+                           f"({pack['added']} added, {size_mb:.1f} MB) in {pack['path']}")
+
+        summary = f"Packed {packed} sessions older than {older_than} days"
+        if prune:
+            summary += f", pruned {pruned} session directories"
+        click.echo(summary)
+
+    except Exception as e:
+        error_msg = create_user_friendly_error(e)
+        click.echo(f"Error packing sessions: {error_msg}", err=True)
+        if ctx.obj['verbose']:
+            click.echo(f"Details: {str(e)}", err=True)
+        ctx.exit(1)
+
+
+@cli.command()
+@click.argument('files', nargs=-1, required=True, type=click.Path(exists=True, dir_okay=False))
+@click.option('--report', '-r', 'report_type',
+              type=click.Choice(['daily', 'weekly', 'monthly', 'models', 'projects']),
+              default='daily', show_default=True, help='Report to build from the merged rollups')
+@click.option('--start-date', type=str, help='Start date (YYYY-MM-DD)')
+@click.option('--end-date', type=str, help='End date (YYYY-MM-DD)')
+@click.option('--output', '-o', type=click.Path(dir_okay=False),
+              help='Also write the merged rollup to this file, to merge again later')
+@click.option('--format', '-f', 'output_format',
+              type=click.Choice(['table', 'json']),
+              default='table', help='Output format')
+@click.pass_context
+def merge(ctx: click.Context, files: tuple, report_type: str, start_date: Optional[str],
+          end_date: Optional[str], output: Optional[str], output_format: str):
+    """Combine rollups from several machines into one report.
+
+    FILES: Rollup files written by 'ocmonitor rollup' or 'ocmonitor merge --output'
+    """
+    from .models.team_rollup import TeamRollup
+
+    try:
+        team_rollup = TeamRollup.merge_all(TeamRollup.read(file) for file in files)
+        if output:
+            team_rollup.write(output)
+
+        if output_format == 'table':
+            click.echo(f"Merged {len(files)} rollups from {len(team_rollup.sources)} machines: "
+                       f"{', '.join(team_rollup.sources)}")
+        if len(team_rollup.timezones) > 1:
+            click.echo(f"Warning: rollups use different timezones ({', '.join(team_rollup.timezones)}); "
+                       f"days are merged as each machine recorded them.", err=True)
+
+        result = ctx.obj['report_generator'].generate_merged_report(
+            team_rollup, report_type, start_date, end_date, output_format
+        )
+
+        if output_format == 'json':
+            click.echo(json.dumps(result, indent=2, default=json_serializer))
+
+    except ValueError as e:
+        # Unreadable rollups, duplicate sources and precision mismatches
+        click.echo(f"Error merging rollups: {e}", err=True)
+        ctx.exit(1)
+    except Exception as e:
+        error_msg = create_user_friendly_error(e)
+        click.echo(f"Error merging rollups: {error_msg}", err=True)
+        if ctx.obj['verbose']:
+            click.echo(f"Details: {str(e)}", err=True)
+        ctx.exit(1)
+
+
+BUNDLE_REPORT_TYPES = ['session', 'sessions', 'daily', 'weekly', 'monthly', 'models', 'projects']
+
+
+@cli.command()
+@click.argument('report_type', type=click.Choice(BUNDLE_REPORT_TYPES + ['bundle']))
+@click.argument('path', type=SessionPathType(), required=False)
 @click.option('--format', '-f', 'export_format',
-              type=click.Choice(['csv', 'json']),
+              type=click.Choice(['csv', 'json', 'sqlite']),
               help='Export format (defaults to configured format)')
 @click.option('--output', '-o', type=click.Path(),
               help='Output file path')
 @click.option('--include-raw', is_flag=True,
               help='Include raw data in export')
+@click.option('--partitioned', is_flag=True,
+              help='Write interaction rows into a date-partitioned directory tree')
+@click.option('--partition-by', type=click.Choice(['year', 'month', 'day']),
+              default='month', help='Partition granularity for --partitioned')
+@click.option('--workers', type=click.IntRange(min=1), default=None,
+              help='Number of writer threads for --partitioned and bundle exports')
+@click.option('--reports', type=str, default=','.join(BUNDLE_REPORT_TYPES),
+              help='Comma-separated report types to include in a bundle export')
+@time_window_options
 @click.pass_context
 def export(ctx: click.Context, report_type: str, path: Optional[str],
-           export_format: Optional[str], output: Optional[str], include_raw: bool):
+           export_format: Optional[str], output: Optional[str], include_raw: bool,
+           partitioned: bool, partition_by: str, workers: Optional[int], reports: str,
+           since: Optional[datetime], until: Optional[datetime]):
     """Export analysis results to file.
 
-    REPORT_TYPE: Type of report to export
+    REPORT_TYPE: Type of report to export ('bundle' writes several reports
+                 from a single scan into one directory, see --reports)
     PATH: Path to analyze (defaults to configured messages directory)
     """
     config = ctx.obj['config']
 
     if not path:
-        path = config.paths.messages_dir
+        path = config.paths.storage_path
 
     if not export_format:
         export_format = config.export.default_format
 
+    check_time_window(ctx, since, until)
+
+    if partitioned and report_type not in ('session', 'sessions'):
+        click.echo("Partitioned export is only available for 'session' and 'sessions' reports.", err=True)
+        ctx.exit(1)
+
+    if partitioned and export_format == 'sqlite':
+        click.echo("Partitioned export supports 'csv' and 'json' formats only.", err=True)
+        ctx.exit(1)
+
+    if report_type == 'bundle':
+        bundle_reports = [name.strip() for name in reports.split(',') if name.strip()]
+        unknown = [name for name in bundle_reports if name not in BUNDLE_REPORT_TYPES]
+        if unknown or not bundle_reports:
+            click.echo(f"Invalid bundle report types: {', '.join(unknown) or '(none)'}. "
+                       f"Choose from: {', '.join(BUNDLE_REPORT_TYPES)}", err=True)
+            ctx.exit(1)
+        if export_format == 'sqlite':
+            click.echo("Bundle export supports 'csv' and 'json' formats only.", err=True)
+            ctx.exit(1)
+
     try:
         report_generator = ctx.obj['report_generator']
         export_service = ctx.obj['export_service']
 
+        if report_type == 'bundle':
+            bundle = report_generator.generate_report_bundle(path, bundle_reports, since, until)
+            bundle_name = output or f"ocmonitor_bundle_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            output_paths = export_service.export_bundle(
+                bundle, export_format, bundle_name, config.export.include_metadata, workers
+            )
+
+            if not output_paths:
+                click.echo("No data to export.", err=True)
+                ctx.exit(1)
+
+            click.echo("✅ Export completed successfully!")
+            for bundle_report, output_path in output_paths.items():
+                summary = export_service.get_export_summary(output_path)
+                click.echo(f"{bundle_report}: {output_path} ({summary.get('size_human', 'Unknown')})")
+            return
+
+        if partitioned or export_format == 'sqlite':
+            analyzer = ctx.obj['analyzer']
+            if report_type == 'session':
+                session_data = analyzer.analyze_single_session(path, since, until)
+                sessions = [session_data] if session_data else []
+            else:
+                sessions = analyzer.analyze_all_sessions(path, since=since, until=until)
+
+        if export_format == 'sqlite':
+            # The database holds the normalized sessions behind every report type
+            if not sessions:
+                click.echo("No data to export.", err=True)
+                ctx.exit(1)
+
+            output_path = export_service.export_to_sqlite(
+                sessions, output or f"ocmonitor_{report_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+                ctx.obj['pricing_data'], config.export.include_metadata
+            )
+
+            summary = export_service.get_export_summary(output_path)
+            click.echo("✅ Export completed successfully!")
+            click.echo(f"File: {output_path}")
+            click.echo(f"Size: {summary.get('size_human', 'Unknown')}")
+            for table, count in summary.get('tables', {}).items():
+                click.echo(f"{table.capitalize()}: {count}")
+            return
+
+        if partitioned:
+            rows = export_service.build_interaction_rows(sessions, ctx.obj['pricing_data'])
+            if not rows:
+                click.echo("No data to export.", err=True)
+                ctx.exit(1)
+
+            dataset_name = output or f"ocmonitor_{report_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            output_path = export_service.export_partitioned(
+                rows, dataset_name, export_format, partition_by,
+                include_metadata=config.export.include_metadata, max_workers=workers
+            )
+
+            summary = export_service.get_export_summary(output_path)
+            click.echo("✅ Export completed successfully!")
+            click.echo(f"Directory: {output_path}")
+            click.echo(f"Size: {summary.get('size_human', 'Unknown')}")
+            click.echo(f"Partitions: {summary.get('partitions', 'Unknown')}")
+            click.echo(f"Rows: {len(rows)}")
+            return
+
         # Generate report data
         report_data = None
         if report_type == 'session':
-            report_data = report_generator.generate_single_session_report(path, 'json')
+            report_data = report_generator.generate_single_session_report(path, 'json', since, until)
         elif report_type == 'sessions':
-            report_data = report_generator.generate_sessions_summary_report(path, None, 'table')  # Use 'table' to get raw data
+            report_data = report_generator.generate_sessions_summary_report(path, None, 'table', since, until)  # Use 'table' to get raw data
         elif report_type == 'daily':
-            report_data = report_generator.generate_daily_report(path, None, 'table')  # Use 'table' to get raw data
+            report_data = report_generator.generate_daily_report(path, None, 'table', since, until)  # Use 'table' to get raw data
         elif report_type == 'weekly':
-            report_data = report_generator.generate_weekly_report(path, None, 'table')  # Use 'table' to get raw data
+            report_data = report_generator.generate_weekly_report(path, None, 'table', since, until)  # Use 'table' to get raw data
         elif report_type == 'monthly':
-            report_data = report_generator.generate_monthly_report(path, None, 'table')  # Use 'table' to get raw data
+            report_data = report_generator.generate_monthly_report(path, None, 'table', since, until)  # Use 'table' to get raw data
         elif report_type == 'models':
-            report_data = report_generator.generate_models_report(path, 'all', None, None, 'table')  # Use 'table' to get raw data
+            report_data = report_generator.generate_models_report(path, 'all', None, None, 'table', since, until)  # Use 'table' to get raw data
         elif report_type == 'projects':
-            report_data = report_generator.generate_projects_report(path, 'all', None, None, 'table')  # Use 'table' to get raw data
+            report_data = report_generator.generate_projects_report(path, 'all', None, None, 'table', since, until)  # Use 'table' to get raw data
 
         if not report_data:
             click.echo("No data to export.", err=True)
@@ -483,7 +998,10 @@ def config_show(ctx: click.Context):
         click.echo()
         click.echo("📁 Paths:")
         click.echo(f"  Messages directory: {config.paths.messages_dir}")
+        if config.paths.messages_dirs:
+            click.echo(f"  Storage roots: {', '.join(config.paths.messages_dirs)}")
         click.echo(f"  Export directory: {config.paths.export_dir}")
+        click.echo(f"  Cache directory: {config.paths.cache_dir}")
         click.echo()
         click.echo("🎨 UI Settings:")
         click.echo(f"  Table style: {config.ui.table_style}")
@@ -520,6 +1038,176 @@ def config_set(ctx: click.Context, key: str, value: str):
     click.echo("Please edit the config.toml file directly for now.")
 
 
+@cli.group()
+def bench():
+    """Benchmarking and performance tools."""
+    pass
+
+
+@bench.command('generate')
+@click.argument('output_dir', type=click.Path(file_okay=False))
+@click.option('--sessions', type=click.IntRange(min=1), default=100, show_default=True,
+              help='Number of sessions to generate')
+@click.option('--messages', type=click.IntRange(min=1), default=50, show_default=True,
+              help='Assistant messages per session')
+@click.option('--models', 'model_mix', type=str, default=None,
+              help='Weighted model mix, e.g. "claude-sonnet-4-20250514:3,grok-code:1"')
+@click.option('--projects', type=click.IntRange(min=1), default=5, show_default=True,
+              help='Number of distinct projects')
+@click.option('--days', type=click.IntRange(min=1), default=90, show_default=True,
+              help='Number of days the sessions are spread over')
+@click.option('--end-date', type=str, default=None,
+              help='Last day of the time span (YYYY-MM-DD, defaults to today; never past now)')
+@click.option('--seed', type=int, default=0, show_default=True, help='Random seed')
+@click.option('--no-user-messages', is_flag=True,
+              help='Only write assistant messages (no zero-token user messages)')
+@click.option('--workers', type=click.IntRange(min=1), default=None,
+              help='Number of writer threads')
+@click.pass_context
+def bench_generate(ctx: click.Context, output_dir: str, sessions: int, messages: int,
+                   model_mix: Optional[str], projects: int, days: int, end_date: Optional[str],
+                   seed: int, no_user_messages: bool, workers: Optional[int]):
+    """Generate a synthetic OpenCode storage tree for benchmarking.
+
+    OUTPUT_DIR: Directory to create the storage/ tree in
+    """
+    from .bench.generator import StorageGenerator, parse_model_mix
+    from .utils.time_utils import TimeUtils
+
+    end = None
+    if end_date:
+        end = TimeUtils.parse_date_string(end_date)
+        if end is None:
+            click.echo(f"Invalid end date: {end_date}. Use YYYY-MM-DD format.", err=True)
+            ctx.exit(1)
+
+    try:
+        generator = StorageGenerator(
+            sessions=sessions,
+            messages_per_session=messages,
+            model_mix=parse_model_mix(model_mix) if model_mix else None,
+            projects=projects,
+            days=days,
+            end_date=end,
+            seed=seed,
+            user_messages=not no_user_messages,
+        )
+
+        start = datetime.now()
+        summary = generator.generate(output_dir, max_workers=workers)
+        elapsed = (datetime.now() - start).total_seconds()
+
+        click.echo(f"✅ Generated {summary['sessions']:,} sessions "
+                   f"({summary['message_files']:,} message files) in {elapsed:.1f}s")
+        click.echo(f"Messages directory: {summary['messages_dir']}")
+        click.echo(f"Storage directory: {summary['storage_dir']}")
+
+    except Exception as e:
+        error_msg = create_user_friendly_error(e)
+        click.echo(f"Error generating storage: {error_msg}", err=True)
+        if ctx.obj['verbose']:
+            click.echo(f"Details: {str(e)}", err=True)
+        ctx.exit(1)
+
+
+@bench.command('run')
+@click.option('--sizes', type=str, default='small,medium', show_default=True,
+              help='Comma-separated dataset sizes (small, medium, large)')
+@click.option('--commands', type=str, default=None,
+              help='Comma-separated commands to benchmark (default: all)')
+@click.option('--repeat', type=click.IntRange(min=1), default=3, show_default=True,
+              help='Timed runs per command; the median is reported')
+@click.option('--data-dir', type=click.Path(file_okay=False), default=None,
+              help='Directory for generated datasets (default: <cache_dir>/bench)')
+@click.option('--output', '-o', type=click.Path(dir_okay=False), default=None,
+              help='Save results as JSON')
+@click.option('--baseline', type=click.Path(exists=True, dir_okay=False), default=None,
+              help='Compare against saved baseline results')
+@click.option('--threshold', type=click.FloatRange(min=0), default=0.10, show_default=True,
+              help='Relative slowdown or memory growth that counts as a regression')
+@click.pass_context
+def bench_run(ctx: click.Context, sizes: str, commands: Optional[str], repeat: int,
+              data_dir: Optional[str], output: Optional[str], baseline: Optional[str],
+              threshold: float):
+    """Benchmark every CLI command against generated storage trees.
+
+    Datasets are generated on first use and reused afterwards.
+    """
+    from .bench import suite
+
+    size_list = [size.strip() for size in sizes.split(',') if size.strip()]
+    command_list = ([command.strip() for command in commands.split(',') if command.strip()]
+                    if commands else list(suite.BENCH_COMMANDS))
+
+    invalid = [size for size in size_list if size not in suite.BENCH_SIZES]
+    invalid += [command for command in command_list if command not in suite.BENCH_COMMANDS]
+    if invalid or not size_list or not command_list:
+        click.echo(f"Invalid sizes or commands: {', '.join(invalid) or 'none given'}", err=True)
+        click.echo(f"Sizes: {', '.join(suite.BENCH_SIZES)}; commands: {', '.join(suite.BENCH_COMMANDS)}", err=True)
+        ctx.exit(1)
+
+    if not data_dir:
+        data_dir = str(Path(ctx.obj['config'].paths.cache_dir) / "bench")
+
+    try:
+        results = suite.run_suite(data_dir, size_list, command_list, repeat, progress=click.echo)
+
+        if output:
+            suite.save_results(results, output)
+            click.echo(f"Results saved to {output}")
+
+        regressions = []
+        if baseline:
+            click.echo()
+            for comparison in suite.compare_results(suite.load_results(baseline), results, threshold):
+                click.echo(suite.format_comparison(comparison))
+                if comparison['regressed']:
+                    regressions.append(comparison)
+
+    except Exception as e:
+        error_msg = create_user_friendly_error(e)
+        click.echo(f"Error running benchmarks: {error_msg}", err=True)
+        if ctx.obj['verbose']:
+            click.echo(f"Details: {str(e)}", err=True)
+        ctx.exit(1)
+
+    if regressions or any(result['failed'] for result in results['results']):
+        ctx.exit(1)
+
+
+@bench.command('compare')
+@click.argument('baseline', type=click.Path(exists=True, dir_okay=False))
+@click.argument('current', type=click.Path(exists=True, dir_okay=False))
+@click.option('--threshold', type=click.FloatRange(min=0), default=0.10, show_default=True,
+              help='Relative slowdown or memory growth that counts as a regression')
+@click.pass_context
+def bench_compare(ctx: click.Context, baseline: str, current: str, threshold: float):
+    """Compare two saved benchmark results and flag regressions.
+
+    BASELINE: Results file to compare against
+    CURRENT: Results file to check
+    """
+    from .bench import suite
+
+    try:
+        comparisons = suite.compare_results(
+            suite.load_results(baseline), suite.load_results(current), threshold
+        )
+    except Exception as e:
+        error_msg = create_user_friendly_error(e)
+        click.echo(f"Error comparing benchmarks: {error_msg}", err=True)
+        ctx.exit(1)
+
+    for comparison in comparisons:
+        click.echo(suite.format_comparison(comparison))
+
+    regressions = [comparison for comparison in comparisons if comparison['regressed']]
+    if regressions:
+        click.echo(f"\n{len(regressions)} regression(s) above {threshold:.0%}", err=True)
+        ctx.exit(1)
+    click.echo(f"\nNo regressions above {threshold:.0%}")
+
+
 def main():
     """Entry point for the CLI application."""
     cli()
\ No newline at end of file
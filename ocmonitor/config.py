@@ -1,10 +1,9 @@
 """Configuration management for OpenCode Monitor."""
 
-import json
 import os
 import toml
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Any, List, Mapping, Optional, Union
 from pydantic import BaseModel, Field, validator
 from decimal import Decimal
 
@@ -12,14 +11,27 @@ from decimal import Decimal
 class PathsConfig(BaseModel):
     """Configuration for file paths."""
     messages_dir: str = Field(default="/Users/shelli/.local/share/opencode/storage/message")
+    # Storage roots analyzed together instead of messages_dir (e.g. mirrors of other machines)
+    messages_dirs: List[str] = Field(default_factory=list)
     opencode_storage_dir: str = Field(default="~/.local/share/opencode/storage")
     export_dir: str = Field(default="./exports")
+    cache_dir: str = Field(default="~/.cache/ocmonitor")
 
-    @validator('messages_dir', 'opencode_storage_dir', 'export_dir')
+    @validator('messages_dir', 'opencode_storage_dir', 'export_dir', 'cache_dir', always=True)
     def expand_path(cls, v):
         """Expand user paths and environment variables."""
         return os.path.expanduser(os.path.expandvars(v))
 
+    @validator('messages_dirs', each_item=True)
+    def expand_paths(cls, v):
+        """Expand user paths and environment variables in every storage root."""
+        return os.path.expanduser(os.path.expandvars(v))
+
+    @property
+    def storage_path(self) -> Union[str, List[str]]:
+        """Sessions reports read by default: ``messages_dirs`` when set, else ``messages_dir``."""
+        return list(self.messages_dirs) if self.messages_dirs else self.messages_dir
+
 
 class UIConfig(BaseModel):
     """Configuration for UI appearance."""
@@ -31,7 +43,7 @@ class UIConfig(BaseModel):
 
 class ExportConfig(BaseModel):
     """Configuration for data export."""
-    default_format: str = Field(default="csv", pattern="^(csv|json)$")
+    default_format: str = Field(default="csv", pattern="^(csv|json|sqlite)$")
     include_metadata: bool = Field(default=True)
     include_raw_data: bool = Field(default=False)
 
@@ -45,6 +57,17 @@ class AnalyticsConfig(BaseModel):
     """Configuration for analytics."""
     default_timeframe: str = Field(default="daily", pattern="^(daily|weekly|monthly)$")
     recent_sessions_limit: int = Field(default=50, ge=1, le=1000)
+    summary_cache: bool = Field(default=True)
+    daily_rollups: bool = Field(default=True)
+    interaction_cache: bool = Field(default=True)
+    timezone: str = Field(default="local")
+
+    @validator('timezone')
+    def validate_timezone(cls, v):
+        """Reject timezones that cannot be resolved."""
+        from .utils.time_utils import TimeUtils
+        TimeUtils.get_timezone(v)
+        return v
 
 
 class Config(BaseModel):
@@ -77,7 +100,7 @@ class ConfigManager:
         """
         self.config_path = config_path or self._find_config_file()
         self._config: Optional[Config] = None
-        self._pricing_data: Optional[Dict[str, ModelPricing]] = None
+        self._pricing_data: Optional[Mapping[str, ModelPricing]] = None
 
     def _find_config_file(self) -> str:
         """Find configuration file in standard locations."""
@@ -115,14 +138,16 @@ class ConfigManager:
         except (toml.TomlDecodeError, ValueError) as e:
             raise ValueError(f"Invalid configuration file {self.config_path}: {e}")
 
-    def load_pricing_data(self) -> Dict[str, ModelPricing]:
+    def load_pricing_data(self) -> Mapping[str, ModelPricing]:
         """Load model pricing data."""
         if self._pricing_data is None:
             self._pricing_data = self._load_pricing_data()
         return self._pricing_data
 
-    def _load_pricing_data(self) -> Dict[str, ModelPricing]:
-        """Load pricing data from JSON file."""
+    def _load_pricing_data(self) -> Mapping[str, ModelPricing]:
+        """Load pricing data from JSON file through the compiled pricing cache."""
+        from .utils.pricing_cache import PricingCache
+
         models_file = self.config.models.config_file
 
         # Try relative to config file first
@@ -137,17 +162,7 @@ class ConfigManager:
         if not os.path.exists(models_file):
             return {}
 
-        try:
-            with open(models_file, 'r') as f:
-                raw_data = json.load(f)
-
-            pricing_data = {}
-            for model_name, model_data in raw_data.items():
-                pricing_data[model_name] = ModelPricing(**model_data)
-
-            return pricing_data
-        except (json.JSONDecodeError, ValueError) as e:
-            raise ValueError(f"Invalid pricing file {models_file}: {e}")
+        return PricingCache(self.config.paths.cache_dir).load(models_file)
 
     def get_model_pricing(self, model_name: str) -> Optional[ModelPricing]:
         """Get pricing information for a specific model."""
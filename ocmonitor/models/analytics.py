@@ -1,123 +1,113 @@
 """Analytics data models for OpenCode Monitor."""
 
-from datetime import datetime, date, timedelta
-from typing import List, Dict, Any, Optional
+from bisect import bisect_left
+from datetime import datetime, date, timedelta, tzinfo
+from typing import Iterable, List, Dict, Any, Optional, Tuple, Union
 from decimal import Decimal
 from pydantic import BaseModel, Field, computed_field
 from collections import defaultdict
-from .session import SessionData, TokenUsage
+from .session import SessionData, TokenUsage, calculate_model_totals_cost
+from .records import TokenCounts
+from .timeline import SessionIndex, UsageTimeline
+from ..utils.instrumentation import instrumented
+from ..utils.time_utils import TimeUtils
 
+# Periods accepted by TimeframeAnalyzer.bucket_timeline
+TIMEFRAME_PERIODS = ("daily", "weekly", "monthly")
 
-class DailyUsage(BaseModel):
-    """Model for daily usage statistics."""
-    date: date
-    sessions: List[SessionData] = Field(default_factory=list)
 
-    @computed_field
-    @property
-    def total_tokens(self) -> TokenUsage:
-        """Calculate total tokens for the day."""
-        total = TokenUsage()
-        for session in self.sessions:
-            session_tokens = session.total_tokens
-            total.input += session_tokens.input
-            total.output += session_tokens.output
-            total.cache_write += session_tokens.cache_write
-            total.cache_read += session_tokens.cache_read
-        return total
+class DailyUsage(BaseModel):
+    """Model for daily usage statistics.
 
-    @computed_field
-    @property
-    def total_interactions(self) -> int:
-        """Calculate total interactions for the day."""
-        return sum(session.interaction_count for session in self.sessions)
+    Totals cover the interactions created on the day, so a session active on
+    several days counts towards each of them. Totals are computed once when
+    the breakdown is built; cost is derived from the per-model token totals
+    for the pricing passed in.
+    """
+    date: date
+    total_tokens: TokenUsage = Field(default_factory=TokenUsage)
+    total_sessions: int = Field(default=0)
+    total_interactions: int = Field(default=0)
+    # Model name -> [interactions, input, output, cache_write, cache_read]
+    model_totals: Dict[str, List[int]] = Field(default_factory=dict)
 
     @computed_field
     @property
     def models_used(self) -> List[str]:
         """Get unique models used on this day."""
-        models = set()
-        for session in self.sessions:
-            models.update(session.models_used)
-        return list(models)
+        return list(self.model_totals)
 
     def calculate_total_cost(self, pricing_data: Dict[str, Any]) -> Decimal:
         """Calculate total cost for the day."""
-        return sum((session.calculate_total_cost(pricing_data) for session in self.sessions), Decimal('0.0'))
+        return calculate_model_totals_cost(self.model_totals, pricing_data)
+
+    def get_model_totals(self) -> Dict[str, List[int]]:
+        """Get interactions and token counts per model for the day."""
+        return self.model_totals
 
 
 class WeeklyUsage(BaseModel):
-    """Model for weekly usage statistics."""
+    """Model for weekly usage statistics.
+
+    Totals cover the interactions created in the ISO week; a session counts
+    once per week it was active in.
+    """
     year: int
     week: int
     start_date: date
     end_date: date
-    daily_usage: List[DailyUsage] = Field(default_factory=list)
-
-    @computed_field
-    @property
-    def total_tokens(self) -> TokenUsage:
-        """Calculate total tokens for the week."""
-        total = TokenUsage()
-        for day in self.daily_usage:
-            day_tokens = day.total_tokens
-            total.input += day_tokens.input
-            total.output += day_tokens.output
-            total.cache_write += day_tokens.cache_write
-            total.cache_read += day_tokens.cache_read
-        return total
-
-    @computed_field
-    @property
-    def total_sessions(self) -> int:
-        """Calculate total sessions for the week."""
-        return sum(len(day.sessions) for day in self.daily_usage)
-
-    @computed_field
-    @property
-    def total_interactions(self) -> int:
-        """Calculate total interactions for the week."""
-        return sum(day.total_interactions for day in self.daily_usage)
+    total_tokens: TokenUsage = Field(default_factory=TokenUsage)
+    total_sessions: int = Field(default=0)
+    total_interactions: int = Field(default=0)
+    # Model name -> [interactions, input, output, cache_write, cache_read]
+    model_totals: Dict[str, List[int]] = Field(default_factory=dict)
 
     def calculate_total_cost(self, pricing_data: Dict[str, Any]) -> Decimal:
         """Calculate total cost for the week."""
-        return sum((day.calculate_total_cost(pricing_data) for day in self.daily_usage), Decimal('0.0'))
+        return calculate_model_totals_cost(self.model_totals, pricing_data)
+
+    def get_model_totals(self) -> Dict[str, List[int]]:
+        """Get interactions and token counts per model for the week."""
+        return self.model_totals
 
 
 class MonthlyUsage(BaseModel):
-    """Model for monthly usage statistics."""
+    """Model for monthly usage statistics.
+
+    Totals cover the interactions created in the calendar month; a session
+    counts once per month it was active in.
+    """
     year: int
     month: int
-    weekly_usage: List[WeeklyUsage] = Field(default_factory=list)
+    total_tokens: TokenUsage = Field(default_factory=TokenUsage)
+    total_sessions: int = Field(default=0)
+    total_interactions: int = Field(default=0)
+    # Model name -> [interactions, input, output, cache_write, cache_read]
+    model_totals: Dict[str, List[int]] = Field(default_factory=dict)
 
-    @computed_field
-    @property
-    def total_tokens(self) -> TokenUsage:
-        """Calculate total tokens for the month."""
-        total = TokenUsage()
-        for week in self.weekly_usage:
-            week_tokens = week.total_tokens
-            total.input += week_tokens.input
-            total.output += week_tokens.output
-            total.cache_write += week_tokens.cache_write
-            total.cache_read += week_tokens.cache_read
-        return total
+    def calculate_total_cost(self, pricing_data: Dict[str, Any]) -> Decimal:
+        """Calculate total cost for the month."""
+        return calculate_model_totals_cost(self.model_totals, pricing_data)
 
-    @computed_field
-    @property
-    def total_sessions(self) -> int:
-        """Calculate total sessions for the month."""
-        return sum(week.total_sessions for week in self.weekly_usage)
+    def get_model_totals(self) -> Dict[str, List[int]]:
+        """Get interactions and token counts per model for the month."""
+        return self.model_totals
 
-    @computed_field
-    @property
-    def total_interactions(self) -> int:
-        """Calculate total interactions for the month."""
-        return sum(week.total_interactions for week in self.weekly_usage)
 
-    def calculate_total_cost(self, pricing_data: Dict[str, Any]) -> Decimal:
-        """Calculate total cost for the month."""
-        return sum((week.calculate_total_cost(pricing_data) for week in self.weekly_usage), Decimal('0.0'))
+def _usage_fields(sessions: int, model_totals: Dict[str, List[int]]) -> Dict[str, Any]:
+    """Get one period's totals as ``DailyUsage``/``WeeklyUsage``/``MonthlyUsage`` fields."""
+    total = TokenCounts()
+    for _, input, output, cache_write, cache_read in model_totals.values():
+        total.input += input
+        total.output += output
+        total.cache_write += cache_write
+        total.cache_read += cache_read
+    return {
+        'total_tokens': total.to_model(),
+        'total_sessions': sessions,
+        'total_interactions': sum(totals[0] for totals in model_totals.values()),
+        'model_totals': model_totals,
+    }
 
 
 class ModelUsageStats(BaseModel):
@@ -148,13 +138,10 @@ class ModelBreakdownReport(BaseModel):
     @property
     def total_tokens(self) -> TokenUsage:
         """Calculate total tokens across all models."""
-        total = TokenUsage()
+        total = TokenCounts()
         for model in self.model_stats:
-            total.input += model.total_tokens.input
-            total.output += model.total_tokens.output
-            total.cache_write += model.total_tokens.cache_write
-            total.cache_read += model.total_tokens.cache_read
-        return total
+            total.add(model.total_tokens)
+        return total.to_model()
 
 
 class ProjectUsageStats(BaseModel):
@@ -186,99 +173,141 @@ class ProjectBreakdownReport(BaseModel):
     @property
     def total_tokens(self) -> TokenUsage:
         """Calculate total tokens across all projects."""
-        total = TokenUsage()
+        total = TokenCounts()
         for project in self.project_stats:
-            total.input += project.total_tokens.input
-            total.output += project.total_tokens.output
-            total.cache_write += project.total_tokens.cache_write
-            total.cache_read += project.total_tokens.cache_read
-        return total
+            total.add(project.total_tokens)
+        return total.to_model()
 
 
 class TimeframeAnalyzer:
     """Analyzer for different timeframe breakdowns."""
 
     @staticmethod
-    def create_daily_breakdown(sessions: List[SessionData]) -> List[DailyUsage]:
-        """Create daily breakdown from sessions."""
-        daily_data = defaultdict(list)
-
-        for session in sessions:
-            if session.start_time:
-                session_date = session.start_time.date()
-                daily_data[session_date].append(session)
-
-        return [
-            DailyUsage(date=date_key, sessions=sessions_list)
-            for date_key, sessions_list in sorted(daily_data.items())
-        ]
+    @instrumented("aggregate.daily")
+    def create_daily_breakdown(sessions: Iterable[SessionData],
+                               timezone: Optional[tzinfo] = None) -> List[DailyUsage]:
+        """Create daily breakdown from sessions by interaction creation date."""
+        return TimeframeAnalyzer.bucket_timeline(UsageTimeline.from_sessions(sessions), "daily", timezone)
 
     @staticmethod
-    def create_weekly_breakdown(daily_usage: List[DailyUsage]) -> List[WeeklyUsage]:
-        """Create weekly breakdown from daily usage."""
-        weekly_data = defaultdict(list)
-
-        for day in daily_usage:
-            # Get ISO week and year
-            year, week, _ = day.date.isocalendar()
-            weekly_data[(year, week)].append(day)
-
-        weekly_breakdown = []
-        for (year, week), days in sorted(weekly_data.items()):
-            # Calculate week start and end dates
-            jan_4 = date(year, 1, 4)
-            week_start = jan_4 - timedelta(days=jan_4.weekday()) + timedelta(weeks=week-1)
-            week_end = week_start + timedelta(days=6)
-
-            weekly_breakdown.append(WeeklyUsage(
-                year=year,
-                week=week,
-                start_date=week_start,
-                end_date=week_end,
-                daily_usage=days
-            ))
-
-        return weekly_breakdown
+    @instrumented("aggregate.weekly")
+    def create_weekly_breakdown(sessions: Iterable[SessionData],
+                                timezone: Optional[tzinfo] = None) -> List[WeeklyUsage]:
+        """Create ISO-week breakdown from sessions by interaction creation date."""
+        return TimeframeAnalyzer.bucket_timeline(UsageTimeline.from_sessions(sessions), "weekly", timezone)
 
     @staticmethod
-    def create_monthly_breakdown(weekly_usage: List[WeeklyUsage]) -> List[MonthlyUsage]:
-        """Create monthly breakdown from weekly usage."""
-        monthly_data = defaultdict(list)
+    @instrumented("aggregate.monthly")
+    def create_monthly_breakdown(sessions: Iterable[SessionData],
+                                 timezone: Optional[tzinfo] = None) -> List[MonthlyUsage]:
+        """Create monthly breakdown from sessions by interaction creation date."""
+        return TimeframeAnalyzer.bucket_timeline(UsageTimeline.from_sessions(sessions), "monthly", timezone)
 
-        for week in weekly_usage:
-            # Assign week to month based on start date
-            month_key = (week.start_date.year, week.start_date.month)
-            monthly_data[month_key].append(week)
+    @staticmethod
+    @instrumented("aggregate.timeframes")
+    def create_timeframe_breakdowns(
+        sessions: Iterable[SessionData],
+        timezone: Optional[tzinfo] = None
+    ) -> Tuple[List[DailyUsage], List[WeeklyUsage], List[MonthlyUsage]]:
+        """Create daily, weekly and monthly breakdowns from one timeline.
+
+        Args:
+            sessions: Sessions to aggregate
+            timezone: Timezone periods are taken in; None for local time
+
+        Returns:
+            Tuple of (daily, weekly, monthly) breakdowns sorted by period
+        """
+        timeline = UsageTimeline.from_sessions(sessions)
+        return (TimeframeAnalyzer.bucket_timeline(timeline, "daily", timezone),
+                TimeframeAnalyzer.bucket_timeline(timeline, "weekly", timezone),
+                TimeframeAnalyzer.bucket_timeline(timeline, "monthly", timezone))
 
-        return [
-            MonthlyUsage(year=year, month=month, weekly_usage=weeks)
-            for (year, month), weeks in sorted(monthly_data.items())
-        ]
+    @staticmethod
+    @instrumented("aggregate.buckets")
+    def bucket_timeline(timeline: UsageTimeline, period: str,
+                        timezone: Optional[tzinfo] = None,
+                        start_date: Optional[date] = None,
+                        end_date: Optional[date] = None) -> List[Any]:
+        """Bucket a usage timeline into days, ISO weeks or months.
+
+        The date range and each period are located by binary search on the
+        timeline's midnight boundaries, and the search jumps straight to the
+        period of the next entry, so only entries inside the range are
+        touched and empty periods are skipped. Sessions are counted once per
+        period they were active in.
+
+        Args:
+            timeline: Usage entries sorted by timestamp
+            period: ``"daily"``, ``"weekly"`` or ``"monthly"``
+            timezone: Timezone periods are taken in; None for local time
+            start_date: Only include interactions created on or after this date
+            end_date: Only include interactions created on or before this date
+
+        Returns:
+            List of DailyUsage, WeeklyUsage or MonthlyUsage objects sorted by period
+
+        Raises:
+            ValueError: If ``period`` is not one of ``TIMEFRAME_PERIODS``
+        """
+        if period not in TIMEFRAME_PERIODS:
+            raise ValueError(f"Invalid period '{period}'. Choose from: {', '.join(TIMEFRAME_PERIODS)}")
+
+        lo, end = timeline.slice(*TimeUtils.date_range_ms(start_date, end_date, timezone))
+        timestamps = timeline.timestamps
+        breakdown = []
+        while lo < end:
+            day = TimeUtils.timestamp_date(timestamps[lo], timezone)
+            if period == "daily":
+                period_start = day
+                period_end = day + timedelta(days=1)
+            elif period == "weekly":
+                period_start = day - timedelta(days=day.weekday())
+                period_end = period_start + timedelta(days=7)
+            else:
+                period_start = day.replace(day=1)
+                period_end = (period_start + timedelta(days=32)).replace(day=1)
+
+            # The entry at lo is inside the period, so the search starts past it
+            period_end_ms = int(TimeUtils.date_start_timestamp(period_end, timezone) * 1000)
+            hi = bisect_left(timestamps, period_end_ms, lo + 1, end)
+            fields = _usage_fields(*timeline.totals(lo, hi))
+            if period == "daily":
+                breakdown.append(DailyUsage(date=day, **fields))
+            elif period == "weekly":
+                year, week, _ = period_start.isocalendar()
+                breakdown.append(WeeklyUsage(year=year, week=week, start_date=period_start,
+                                             end_date=period_end - timedelta(days=1), **fields))
+            else:
+                breakdown.append(MonthlyUsage(year=period_start.year, month=period_start.month, **fields))
+            lo = hi
+
+        return breakdown
 
     @staticmethod
+    @instrumented("aggregate.models")
     def create_model_breakdown(
-        sessions: List[SessionData],
+        sessions: Union[List[SessionData], SessionIndex],
         pricing_data: Dict[str, Any],
         timeframe: str = "all",
         start_date: Optional[date] = None,
-        end_date: Optional[date] = None
+        end_date: Optional[date] = None,
+        timezone: Optional[tzinfo] = None
     ) -> ModelBreakdownReport:
-        """Create model usage breakdown."""
+        """Create model usage breakdown.
+
+        Sessions are filtered by start date through a ``SessionIndex``;
+        ``sessions`` may already be one.
+        """
         # Filter sessions by date range if specified
         filtered_sessions = sessions
         if start_date or end_date:
-            filtered_sessions = []
-            for session in sessions:
-                if session.start_time:
-                    session_date = session.start_time.date()
-                    if start_date and session_date < start_date:
-                        continue
-                    if end_date and session_date > end_date:
-                        continue
-                    filtered_sessions.append(session)
+            if not isinstance(sessions, SessionIndex):
+                sessions = SessionIndex(sessions)
+            filtered_sessions = sessions.select(*TimeUtils.date_range_ms(start_date, end_date, timezone))
 
         model_data = defaultdict(lambda: {
-            'tokens': TokenUsage(),
+            'tokens': TokenCounts(),
             'sessions': set(),
             'interactions': 0,
             'cost': Decimal('0.0'),
@@ -287,18 +316,14 @@ class TimeframeAnalyzer:
         })
 
         for session in filtered_sessions:
-            for model in session.models_used:
-                model_files = [f for f in session.files if f.model_id == model]
+            # Per-model totals; also available on session summaries without files
+            for model, usage in session.get_model_breakdown(pricing_data).items():
                 model_stats = model_data[model]
 
                 # Update token counts
-                for file in model_files:
-                    model_stats['tokens'].input += file.tokens.input
-                    model_stats['tokens'].output += file.tokens.output
-                    model_stats['tokens'].cache_write += file.tokens.cache_write
-                    model_stats['tokens'].cache_read += file.tokens.cache_read
-                    model_stats['interactions'] += 1
-                    model_stats['cost'] += file.calculate_cost(pricing_data)
+                model_stats['tokens'].add(usage['tokens'])
+                model_stats['interactions'] += usage['files']
+                model_stats['cost'] += usage['cost']
 
                 # Track sessions
                 model_stats['sessions'].add(session.session_id)
@@ -319,7 +344,7 @@ class TimeframeAnalyzer:
         for model_name, stats in model_data.items():
             model_stats.append(ModelUsageStats(
                 model_name=model_name,
-                total_tokens=stats['tokens'],
+                total_tokens=stats['tokens'].to_model(),
                 total_sessions=len(stats['sessions']),
                 total_interactions=stats['interactions'],
                 total_cost=stats['cost'],
@@ -338,29 +363,29 @@ class TimeframeAnalyzer:
         )
 
     @staticmethod
+    @instrumented("aggregate.projects")
     def create_project_breakdown(
-        sessions: List[SessionData],
+        sessions: Union[List[SessionData], SessionIndex],
         pricing_data: Dict[str, Any],
         timeframe: str = "all",
         start_date: Optional[date] = None,
-        end_date: Optional[date] = None
+        end_date: Optional[date] = None,
+        timezone: Optional[tzinfo] = None
     ) -> 'ProjectBreakdownReport':
-        """Create project usage breakdown."""
+        """Create project usage breakdown.
+
+        Sessions are filtered by start date through a ``SessionIndex``;
+        ``sessions`` may already be one.
+        """
         # Filter sessions by date range if specified
         filtered_sessions = sessions
         if start_date or end_date:
-            filtered_sessions = []
-            for session in sessions:
-                if session.start_time:
-                    session_date = session.start_time.date()
-                    if start_date and session_date < start_date:
-                        continue
-                    if end_date and session_date > end_date:
-                        continue
-                    filtered_sessions.append(session)
+            if not isinstance(sessions, SessionIndex):
+                sessions = SessionIndex(sessions)
+            filtered_sessions = sessions.select(*TimeUtils.date_range_ms(start_date, end_date, timezone))
 
         project_data = defaultdict(lambda: {
-            'tokens': TokenUsage(),
+            'tokens': TokenCounts(),
             'sessions': 0,
             'interactions': 0,
             'cost': Decimal('0.0'),
@@ -374,11 +399,7 @@ class TimeframeAnalyzer:
             project_stats = project_data[project_name]
             
             # Update aggregated data
-            session_tokens = session.total_tokens
-            project_stats['tokens'].input += session_tokens.input
-            project_stats['tokens'].output += session_tokens.output
-            project_stats['tokens'].cache_write += session_tokens.cache_write
-            project_stats['tokens'].cache_read += session_tokens.cache_read
+            project_stats['tokens'].add(session.total_tokens)
             
             project_stats['sessions'] += 1
             project_stats['interactions'] += session.interaction_count
@@ -401,7 +422,7 @@ class TimeframeAnalyzer:
         for project_name, stats in project_data.items():
             project_stats.append(ProjectUsageStats(
                 project_name=project_name,
-                total_tokens=stats['tokens'],
+                total_tokens=stats['tokens'].to_model(),
                 total_sessions=stats['sessions'],
                 total_interactions=stats['interactions'],
                 total_cost=stats['cost'],
@@ -0,0 +1,317 @@
+"""Usage cube for OpenCode Monitor.
+
+``UsageCube`` pre-aggregates usage over four dimensions, day x model x
+project x session, with interactions, the four token types and processing
+time as measures. Any pivot of those dimensions (usage by model within
+project within month, say) is then a single pass over the cube's cells
+instead of another scan of the sessions, and rolling up or drilling down is
+just asking again with fewer or more dimensions.
+
+Cells are stored as parallel arrays sorted by day, with models, projects and
+sessions dictionary-encoded as integer codes, so a date range is a pair of
+binary searches and the cube serializes to a few byte strings. Days follow
+the ``daily`` report: each interaction counts towards the day it was created
+on in the report timezone, and each session towards its most common
+project. Costs are computed from the token sums when a query runs, so
+pricing changes need no rebuild.
+"""
+
+from array import array
+from bisect import bisect_left
+from datetime import date, tzinfo
+from decimal import Decimal
+from typing import Any, Collection, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from pydantic import BaseModel, Field
+
+from .session import TokenUsage, calculate_model_totals_cost
+from .records import TokenCounts
+from ..utils.time_utils import TimeUtils
+
+# Dimensions a cube query can group or filter by, coarsest time level first
+CUBE_DIMENSIONS = ("year", "month", "week", "day", "model", "project", "session")
+
+# Orders accepted by UsageCube.query(sort_by=...)
+CUBE_SORT_KEYS = ("key", "cost", "tokens")
+
+# Integer columns of UsageCube, stored as raw bytes by to_dict()
+_CUBE_ARRAYS = ('days', 'models', 'projects', 'sessions', 'interactions', 'input', 'output',
+                'cache_write', 'cache_read', 'processing_ms')
+
+_TIME_LEVELS = ("year", "month", "week", "day")
+
+
+def _time_label(level: str, day: date) -> str:
+    """Get the label of the year, month, ISO week or day containing ``day``."""
+    if level == "day":
+        return day.isoformat()
+    if level == "week":
+        year, week, _ = day.isocalendar()
+        return f"{year}-W{week:02d}"
+    if level == "month":
+        return f"{day.year}-{day.month:02d}"
+    return str(day.year)
+
+
+class PivotRow(BaseModel):
+    """Model for one group of a usage cube query."""
+    keys: Dict[str, str] = Field(default_factory=dict)
+    total_tokens: TokenUsage = Field(default_factory=TokenUsage)
+    total_sessions: int = Field(default=0)
+    total_interactions: int = Field(default=0)
+    total_cost: Decimal = Field(default=Decimal('0.0'))
+    processing_ms: int = Field(default=0)
+    # Model name -> [interactions, input, output, cache_write, cache_read]
+    model_totals: Dict[str, List[int]] = Field(default_factory=dict)
+
+
+class UsageCube:
+    """Usage totals per day, model, project and session."""
+
+    __slots__ = ('model_names', 'project_names', 'session_ids') + _CUBE_ARRAYS
+
+    def __init__(self):
+        """Initialize an empty cube; use :meth:`from_sessions` to build one."""
+        self.model_names: List[str] = []
+        self.project_names: List[str] = []
+        self.session_ids: List[str] = []
+        self.days = array('q')
+        self.models = array('q')
+        self.projects = array('q')
+        self.sessions = array('q')
+        self.interactions = array('q')
+        self.input = array('q')
+        self.output = array('q')
+        self.cache_write = array('q')
+        self.cache_read = array('q')
+        self.processing_ms = array('q')
+
+    @classmethod
+    def from_slots(cls, sessions: Iterable[Tuple[str, str, Sequence[Sequence[Any]]]],
+                   timezone: Optional[tzinfo] = None) -> 'UsageCube':
+        """Build a cube from per-session time slots in one pass.
+
+        Args:
+            sessions: Tuples of (session ID, project name, time slot rows as
+                kept by ``SessionSummary.time_slots``)
+            timezone: Timezone days are taken in; None for local time
+
+        Returns:
+            UsageCube with one cell per day, model, project and session
+        """
+        cube = cls()
+        model_codes: Dict[str, int] = {}
+        project_codes: Dict[str, int] = {}
+        slot_days: Dict[int, int] = {}
+        cells: Dict[Tuple[int, int, int, int], List[int]] = {}
+
+        for session_code, (session_id, project_name, time_slots) in enumerate(sessions):
+            cube.session_ids.append(session_id)
+            project_code = project_codes.setdefault(project_name, len(project_codes))
+            for slot, model, interactions, input, output, cache_write, cache_read, processing_ms in time_slots:
+                day = slot_days.get(slot)
+                if day is None:
+                    day = slot_days[slot] = TimeUtils.timestamp_date(slot, timezone).toordinal()
+                key = (day, model_codes.setdefault(model, len(model_codes)), project_code, session_code)
+                cell = cells.get(key)
+                if cell is None:
+                    cells[key] = [interactions, input, output, cache_write, cache_read, processing_ms]
+                else:
+                    cell[0] += interactions
+                    cell[1] += input
+                    cell[2] += output
+                    cell[3] += cache_write
+                    cell[4] += cache_read
+                    cell[5] += processing_ms
+
+        cube.model_names = list(model_codes)
+        cube.project_names = list(project_codes)
+        keys = sorted(cells)
+        for index, name in enumerate(_CUBE_ARRAYS[:4]):
+            getattr(cube, name).extend([key[index] for key in keys])
+        for index, name in enumerate(_CUBE_ARRAYS[4:]):
+            getattr(cube, name).extend([cells[key][index] for key in keys])
+        return cube
+
+    @classmethod
+    def from_sessions(cls, sessions: Iterable[Any], timezone: Optional[tzinfo] = None) -> 'UsageCube':
+        """Build a cube from session summaries.
+
+        Args:
+            sessions: Objects with ``session_id``, ``project_name`` and
+                ``time_slots``, such as ``SessionSummary``
+            timezone: Timezone days are taken in; None for local time
+
+        Returns:
+            UsageCube with every session's usage
+        """
+        return cls.from_slots(
+            ((session.session_id, session.project_name, session.time_slots) for session in sessions),
+            timezone,
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'UsageCube':
+        """Rebuild a cube serialized by :meth:`to_dict`.
+
+        Args:
+            data: Serialized cube
+
+        Returns:
+            UsageCube object
+        """
+        cube = cls()
+        cube.model_names = data['model_names']
+        cube.project_names = data['project_names']
+        cube.session_ids = data['session_ids']
+        for name in _CUBE_ARRAYS:
+            getattr(cube, name).frombytes(data[name])
+        return cube
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the cube for caching (marshal-compatible)."""
+        data: Dict[str, Any] = {
+            'model_names': self.model_names,
+            'project_names': self.project_names,
+            'session_ids': self.session_ids,
+        }
+        for name in _CUBE_ARRAYS:
+            data[name] = getattr(self, name).tobytes()
+        return data
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+    def query(self, by: Sequence[str], pricing_data: Dict[str, Any],
+              start_date: Optional[date] = None, end_date: Optional[date] = None,
+              where: Optional[Mapping[str, Collection[str]]] = None,
+              sort_by: str = "key") -> List[PivotRow]:
+        """Aggregate the cube by some of its dimensions.
+
+        Dimensions left out of ``by`` are rolled up; adding one drills down
+        into it. Time can be grouped at any of the ``year``, ``month``,
+        ``week`` and ``day`` levels.
+
+        Args:
+            by: Dimensions to group by, from ``CUBE_DIMENSIONS``
+            pricing_data: Model pricing information
+            start_date: Only include usage on or after this date
+            end_date: Only include usage on or before this date
+            where: Only include cells whose label for a dimension is one of
+                the given values, e.g. ``{"project": ["api"], "month": ["2025-06"]}``
+            sort_by: ``"key"`` (group labels ascending), ``"cost"`` or
+                ``"tokens"`` (descending)
+
+        Returns:
+            One PivotRow per group with usage
+
+        Raises:
+            ValueError: If a dimension or ``sort_by`` is not recognized
+        """
+        where = where or {}
+        for dimension in list(by) + list(where):
+            if dimension not in CUBE_DIMENSIONS:
+                raise ValueError(f"Invalid dimension '{dimension}'. Choose from: {', '.join(CUBE_DIMENSIONS)}")
+        if sort_by not in CUBE_SORT_KEYS:
+            raise ValueError(f"Invalid sort order '{sort_by}'. Choose from: {', '.join(CUBE_SORT_KEYS)}")
+
+        time_by = [dimension for dimension in by if dimension in _TIME_LEVELS]
+        time_where = {dimension: set(values) for dimension, values in where.items()
+                      if dimension in _TIME_LEVELS}
+        allowed = {}
+        for dimension, names in (("model", self.model_names), ("project", self.project_names),
+                                 ("session", self.session_ids)):
+            if dimension in where:
+                values = set(where[dimension])
+                allowed[dimension] = {code for code, name in enumerate(names) if name in values}
+
+        lo = bisect_left(self.days, start_date.toordinal()) if start_date else 0
+        hi = bisect_left(self.days, end_date.toordinal() + 1, lo) if end_date else len(self.days)
+
+        columns = {"model": self.models, "project": self.projects, "session": self.sessions}
+        names = {"model": self.model_names, "project": self.project_names, "session": self.session_ids}
+        # Each part of a group key is a time label or a dictionary code
+        key_parts = [(True, time_by.index(dimension)) if dimension in _TIME_LEVELS
+                     else (False, columns[dimension]) for dimension in by]
+
+        # Time labels of each day in range, or None for days filtered out
+        day_labels: Dict[int, Optional[Tuple[str, ...]]] = {}
+        groups: Dict[Tuple[Any, ...], List[Any]] = {}
+        for index in range(lo, hi):
+            ordinal = self.days[index]
+            if ordinal not in day_labels:
+                day = date.fromordinal(ordinal)
+                if all(_time_label(level, day) in values for level, values in time_where.items()):
+                    day_labels[ordinal] = tuple(_time_label(level, day) for level in time_by)
+                else:
+                    day_labels[ordinal] = None
+            labels = day_labels[ordinal]
+            if labels is None:
+                continue
+            if any(columns[dimension][index] not in accepted for dimension, accepted in allowed.items()):
+                continue
+
+            key = tuple(labels[part] if is_time else part[index] for is_time, part in key_parts)
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = [{}, set(), 0]
+            model_name = self.model_names[self.models[index]]
+            totals = group[0].get(model_name)
+            if totals is None:
+                totals = group[0][model_name] = [0, 0, 0, 0, 0]
+            totals[0] += self.interactions[index]
+            totals[1] += self.input[index]
+            totals[2] += self.output[index]
+            totals[3] += self.cache_write[index]
+            totals[4] += self.cache_read[index]
+            group[1].add(self.sessions[index])
+            group[2] += self.processing_ms[index]
+
+        rows = []
+        for key, (model_totals, sessions, processing_ms) in groups.items():
+            tokens = TokenCounts()
+            for _, input, output, cache_write, cache_read in model_totals.values():
+                tokens.input += input
+                tokens.output += output
+                tokens.cache_write += cache_write
+                tokens.cache_read += cache_read
+            rows.append(PivotRow(
+                keys={dimension: names[dimension][value] if dimension in names else value
+                      for dimension, value in zip(by, key)},
+                total_tokens=tokens.to_model(),
+                total_sessions=len(sessions),
+                total_interactions=sum(totals[0] for totals in model_totals.values()),
+                total_cost=calculate_model_totals_cost(model_totals, pricing_data),
+                processing_ms=processing_ms,
+                model_totals=model_totals,
+            ))
+
+        rows.sort(key=lambda row: tuple(row.keys.values()))
+        if sort_by == "cost":
+            rows.sort(key=lambda row: row.total_cost, reverse=True)
+        elif sort_by == "tokens":
+            rows.sort(key=lambda row: row.total_tokens.total, reverse=True)
+        return rows
+
+    def drill_down(self, row: PivotRow, dimension: str, pricing_data: Dict[str, Any],
+                   sort_by: str = "key") -> List[PivotRow]:
+        """Split one query result by another dimension.
+
+        Args:
+            row: Row returned by :meth:`query`
+            dimension: Dimension to add, from ``CUBE_DIMENSIONS``
+            pricing_data: Model pricing information
+            sort_by: Order of the returned rows, see :meth:`query`
+
+        Returns:
+            Rows grouped by the row's dimensions plus ``dimension``,
+            restricted to the row's group
+        """
+        return self.query(list(row.keys) + [dimension], pricing_data,
+                          where={key: [value] for key, value in row.keys.items()}, sort_by=sort_by)
+
+    def date_range(self) -> Optional[Tuple[date, date]]:
+        """Get the first and last day with usage, or None for an empty cube."""
+        if not self.days:
+            return None
+        return date.fromordinal(self.days[0]), date.fromordinal(self.days[-1])
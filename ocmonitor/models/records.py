@@ -0,0 +1,519 @@
+"""Lightweight session records for OpenCode Monitor.
+
+The pydantic models in :mod:`ocmonitor.models.session` validate every field
+and recompute derived values on each access, which dominates CPU and memory
+when scanning many message files. The slotted records here carry the same
+attributes and methods the services and UI use, so they can flow through the
+load and aggregation path unchanged, and convert to the pydantic models with
+``to_model()`` where a validated object is needed.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .session import (
+    InteractionFile, SessionData, TimeData, TokenUsage, calculate_interaction_cost,
+    calculate_model_totals_cost, summarize_model_usage
+)
+from .timeline import interaction_entries, summarize_time_slots
+from ..utils.archive_storage import file_mtime, storage_root_of
+
+
+class TokenCounts:
+    """Token counts for an interaction or an aggregate."""
+
+    __slots__ = ('input', 'output', 'cache_write', 'cache_read')
+
+    def __init__(self, input: int = 0, output: int = 0, cache_write: int = 0, cache_read: int = 0):
+        self.input = input
+        self.output = output
+        self.cache_write = cache_write
+        self.cache_read = cache_read
+
+    @property
+    def total(self) -> int:
+        """Calculate total tokens."""
+        return self.input + self.output + self.cache_write + self.cache_read
+
+    def add(self, other: Any) -> None:
+        """Add another set of token counts in place.
+
+        Args:
+            other: TokenCounts, TokenUsage or any object with the same fields
+        """
+        self.input += other.input
+        self.output += other.output
+        self.cache_write += other.cache_write
+        self.cache_read += other.cache_read
+
+    def model_dump(self) -> Dict[str, int]:
+        """Serialize like ``TokenUsage.model_dump()``."""
+        return {
+            'input': self.input,
+            'output': self.output,
+            'cache_write': self.cache_write,
+            'cache_read': self.cache_read,
+            'total': self.total,
+        }
+
+    def to_model(self) -> TokenUsage:
+        """Convert to a validated ``TokenUsage``."""
+        return TokenUsage(input=self.input, output=self.output,
+                          cache_write=self.cache_write, cache_read=self.cache_read)
+
+    def __repr__(self) -> str:
+        return (f"TokenCounts(input={self.input}, output={self.output}, "
+                f"cache_write={self.cache_write}, cache_read={self.cache_read})")
+
+
+class TimeSpan:
+    """Creation and completion timestamps of an interaction in milliseconds."""
+
+    __slots__ = ('created', 'completed')
+
+    def __init__(self, created: Optional[int] = None, completed: Optional[int] = None):
+        self.created = created
+        self.completed = completed
+
+    @property
+    def duration_ms(self) -> Optional[int]:
+        """Calculate duration in milliseconds."""
+        if self.created is not None and self.completed is not None:
+            return self.completed - self.created
+        return None
+
+    @property
+    def created_datetime(self) -> Optional[datetime]:
+        """Get creation time as datetime object."""
+        if self.created is not None:
+            return datetime.fromtimestamp(self.created / 1000)
+        return None
+
+    @property
+    def completed_datetime(self) -> Optional[datetime]:
+        """Get completion time as datetime object."""
+        if self.completed is not None:
+            return datetime.fromtimestamp(self.completed / 1000)
+        return None
+
+    def model_dump(self) -> Dict[str, Any]:
+        """Serialize like ``TimeData.model_dump()``."""
+        return self.to_model().model_dump()
+
+    def to_model(self) -> TimeData:
+        """Convert to a validated ``TimeData``."""
+        return TimeData(created=self.created, completed=self.completed)
+
+
+class InteractionRecord:
+    """Single interaction file; unlike ``InteractionFile`` the raw JSON is not kept."""
+
+    __slots__ = ('file_path', 'session_id', 'model_id', 'tokens', 'time_data', 'project_path')
+
+    def __init__(self, file_path: Path, session_id: str, model_id: str = "unknown",
+                 tokens: Optional[TokenCounts] = None, time_data: Optional[TimeSpan] = None,
+                 project_path: Optional[str] = None):
+        self.file_path = file_path
+        self.session_id = session_id
+        self.model_id = model_id
+        self.tokens = tokens if tokens is not None else TokenCounts()
+        self.time_data = time_data
+        self.project_path = project_path
+
+    @property
+    def file_name(self) -> str:
+        """Get the file name."""
+        return self.file_path.name
+
+    @property
+    def modification_time(self) -> datetime:
+        """Get file modification time."""
+        return datetime.fromtimestamp(file_mtime(self.file_path))
+
+    @property
+    def project_name(self) -> str:
+        """Get project name from project path."""
+        if not self.project_path:
+            return "Unknown"
+        return Path(self.project_path).name
+
+    def calculate_cost(self, pricing_data: Dict[str, Any]) -> Decimal:
+        """Calculate cost for this interaction."""
+        return calculate_interaction_cost(self.model_id, self.tokens, pricing_data)
+
+    def model_dump(self, **kwargs) -> Dict[str, Any]:
+        """Serialize like ``InteractionFile.model_dump()``."""
+        return self.to_model().model_dump(**kwargs)
+
+    def to_model(self) -> InteractionFile:
+        """Convert to a validated ``InteractionFile``."""
+        return InteractionFile(
+            file_path=self.file_path,
+            session_id=self.session_id,
+            model_id=self.model_id,
+            tokens=self.tokens.to_model(),
+            time_data=self.time_data.to_model() if self.time_data else None,
+            project_path=self.project_path,
+        )
+
+
+class SessionDisplayMixin:
+    """Times and display values shared by ``SessionRecord`` and ``SessionSummary``.
+
+    Derived from the ``start_ms``, ``end_ms``, ``project_path``,
+    ``session_path``, ``session_id`` and ``session_title`` each class provides.
+    """
+
+    __slots__ = ()
+
+    @property
+    def start_time(self) -> Optional[datetime]:
+        """Get session start time (earliest file creation time)."""
+        if self.start_ms is None:
+            return None
+        return datetime.fromtimestamp(self.start_ms / 1000)
+
+    @property
+    def end_time(self) -> Optional[datetime]:
+        """Get session end time (latest file completion time)."""
+        if self.end_ms is None:
+            return None
+        return datetime.fromtimestamp(self.end_ms / 1000)
+
+    @property
+    def duration_ms(self) -> Optional[int]:
+        """Calculate total session duration in milliseconds."""
+        start_time, end_time = self.start_time, self.end_time
+        if start_time and end_time:
+            return int((end_time - start_time).total_seconds() * 1000)
+        return None
+
+    @property
+    def duration_hours(self) -> float:
+        """Calculate session duration in hours."""
+        duration_ms = self.duration_ms
+        if duration_ms:
+            return duration_ms / (1000 * 60 * 60)
+        return 0.0
+
+    @property
+    def duration_percentage(self) -> float:
+        """Calculate session duration as percentage of 5-hour maximum."""
+        max_hours = 5.0
+        return min(100.0, (self.duration_hours / max_hours) * 100.0)
+
+    @property
+    def storage_root(self) -> Path:
+        """Get the storage root (messages directory) this session was read from."""
+        return storage_root_of(self.session_path)
+
+    @property
+    def project_name(self) -> str:
+        """Get project name for this session based on most common project path."""
+        if not self.project_path:
+            return "Unknown"
+        return Path(self.project_path).name
+
+    @property
+    def display_title(self) -> str:
+        """Get display-friendly session title, with fallback to session ID."""
+        if self.session_title:
+            if len(self.session_title) > 50:
+                return self.session_title[:47] + "..."
+            return self.session_title
+        return self.session_id
+
+
+class SessionRecord(SessionDisplayMixin):
+    """Complete session built from interaction records.
+
+    Session-level totals and times are computed once on first access;
+    records are treated as read-only after loading.
+    """
+
+    __slots__ = ('session_id', 'session_path', 'files', 'session_title', '_summary')
+
+    def __init__(self, session_id: str, session_path: Path,
+                 files: Optional[List[InteractionRecord]] = None,
+                 session_title: Optional[str] = None):
+        self.session_id = session_id
+        self.session_path = session_path
+        self.files = files if files is not None else []
+        self.session_title = session_title
+        self._summary = None
+
+    def _get_summary(self) -> tuple:
+        """Compute token totals, start/end times, processing time and project once."""
+        if self._summary is None:
+            tokens = TokenCounts()
+            created = []
+            completed = []
+            processing_ms = 0
+            for file in self.files:
+                tokens.add(file.tokens)
+                time_data = file.time_data
+                if time_data:
+                    if time_data.created is not None:
+                        created.append(time_data.created)
+                    if time_data.completed is not None:
+                        completed.append(time_data.completed)
+                    duration = time_data.duration_ms
+                    if duration:
+                        processing_ms += duration
+            project_path = None
+            project_paths = [f.project_path for f in self.files if f.project_path]
+            if project_paths:
+                from collections import Counter
+                project_path = Counter(project_paths).most_common(1)[0][0]
+            self._summary = (
+                (tokens.input, tokens.output, tokens.cache_write, tokens.cache_read),
+                min(created) if created else None,
+                max(completed) if completed else None,
+                processing_ms,
+                project_path,
+            )
+        return self._summary
+
+    @property
+    def models_used(self) -> List[str]:
+        """Get list of unique models used in this session."""
+        return list(set(file.model_id for file in self.files))
+
+    @property
+    def total_tokens(self) -> TokenCounts:
+        """Calculate total token usage for the session."""
+        return TokenCounts(*self._get_summary()[0])
+
+    @property
+    def start_ms(self) -> Optional[int]:
+        """Get session start time as a millisecond timestamp."""
+        return self._get_summary()[1]
+
+    @property
+    def end_ms(self) -> Optional[int]:
+        """Get session end time as a millisecond timestamp."""
+        return self._get_summary()[2]
+
+    @property
+    def project_path(self) -> Optional[str]:
+        """Get the most common project path of the interactions."""
+        return self._get_summary()[4]
+
+    @property
+    def total_processing_time_ms(self) -> int:
+        """Calculate total processing time across all files."""
+        return self._get_summary()[3]
+
+    def calculate_total_cost(self, pricing_data: Dict[str, Any]) -> Decimal:
+        """Calculate total cost for the session."""
+        return Decimal(sum(file.calculate_cost(pricing_data) for file in self.files))
+
+    def get_model_totals(self) -> Dict[str, List[int]]:
+        """Get interactions and token counts per model."""
+        return summarize_model_usage(self.files)
+
+    def get_timeline_entries(self) -> List[Any]:
+        """Get (timestamp, model, totals) for each interaction with a timestamp."""
+        return interaction_entries(self.files)
+
+    def get_model_breakdown(self, pricing_data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """Get breakdown of usage and cost by model."""
+        breakdown = {}
+
+        for model in self.models_used:
+            model_files = [f for f in self.files if f.model_id == model]
+            model_tokens = TokenCounts()
+            model_cost = Decimal('0.0')
+
+            for file in model_files:
+                model_tokens.add(file.tokens)
+                model_cost += file.calculate_cost(pricing_data)
+
+            breakdown[model] = {
+                'files': len(model_files),
+                'tokens': model_tokens,
+                'cost': model_cost
+            }
+
+        return breakdown
+
+    @property
+    def interaction_count(self) -> int:
+        """Get number of interactions (files) in this session."""
+        return len(self.files)
+
+    @property
+    def non_zero_token_files(self) -> List[InteractionRecord]:
+        """Get files with non-zero token usage."""
+        return [file for file in self.files if file.tokens.total > 0]
+
+    def model_dump(self, **kwargs) -> Dict[str, Any]:
+        """Serialize like ``SessionData.model_dump()``."""
+        return self.to_model().model_dump(**kwargs)
+
+    def to_model(self) -> SessionData:
+        """Convert to a validated ``SessionData``."""
+        return SessionData(
+            session_id=self.session_id,
+            session_path=self.session_path,
+            files=[file.to_model() for file in self.files],
+            session_title=self.session_title,
+        )
+
+
+class SessionSummary(SessionDisplayMixin):
+    """Per-session totals without the interactions they were computed from.
+
+    Carries what summary-level reports read from a session (token totals and
+    interaction counts per model and per 15-minute time slot, start/end and
+    processing time, project) with the same attributes and methods as
+    ``SessionRecord``, minus ``files``. Costs are computed from the per-model token totals on access,
+    so a stored summary stays valid when pricing changes.
+    """
+
+    __slots__ = ('session_id', 'session_path', 'session_title', 'start_ms', 'end_ms',
+                 'processing_ms', 'project_path', 'models', 'time_slots')
+
+    def __init__(self, session_id: str, session_path: Path,
+                 models: Optional[Dict[str, List[int]]] = None,
+                 start_ms: Optional[int] = None, end_ms: Optional[int] = None,
+                 processing_ms: int = 0, project_path: Optional[str] = None,
+                 session_title: Optional[str] = None,
+                 time_slots: Optional[List[List[Any]]] = None):
+        """Initialize session summary.
+
+        Args:
+            session_id: Session ID
+            session_path: Path to session directory
+            models: Per model ``[interactions, input, output, cache_write, cache_read]``
+            start_ms: Earliest interaction creation time in milliseconds
+            end_ms: Latest interaction completion time in milliseconds
+            processing_ms: Total processing time across interactions
+            project_path: Most common project path of the interactions
+            session_title: Session title
+            time_slots: Rows of ``[slot start ms, model, interactions, input,
+                output, cache_write, cache_read, processing ms]`` sorted by slot
+        """
+        self.session_id = session_id
+        self.session_path = session_path
+        self.models = models if models is not None else {}
+        self.start_ms = start_ms
+        self.end_ms = end_ms
+        self.processing_ms = processing_ms
+        self.project_path = project_path
+        self.session_title = session_title
+        self.time_slots = time_slots if time_slots is not None else []
+
+    @classmethod
+    def from_record(cls, record: SessionRecord) -> 'SessionSummary':
+        """Summarize a loaded session.
+
+        Args:
+            record: SessionRecord to summarize
+
+        Returns:
+            SessionSummary with the record's totals
+        """
+        return cls(
+            session_id=record.session_id,
+            session_path=record.session_path,
+            models=summarize_model_usage(record.files),
+            start_ms=record.start_ms,
+            end_ms=record.end_ms,
+            processing_ms=record.total_processing_time_ms,
+            project_path=record.project_path,
+            session_title=record.session_title,
+            time_slots=summarize_time_slots(record.files),
+        )
+
+    @property
+    def models_used(self) -> List[str]:
+        """Get list of unique models used in this session."""
+        return list(set(model for model in self.models))
+
+    @property
+    def total_tokens(self) -> TokenCounts:
+        """Calculate total token usage for the session."""
+        tokens = TokenCounts()
+        for _, input, output, cache_write, cache_read in self.models.values():
+            tokens.input += input
+            tokens.output += output
+            tokens.cache_write += cache_write
+            tokens.cache_read += cache_read
+        return tokens
+
+    @property
+    def total_processing_time_ms(self) -> int:
+        """Calculate total processing time across all files."""
+        return self.processing_ms
+
+    def calculate_total_cost(self, pricing_data: Dict[str, Any]) -> Decimal:
+        """Calculate total cost for the session."""
+        return calculate_model_totals_cost(self.models, pricing_data)
+
+    def get_model_totals(self) -> Dict[str, List[int]]:
+        """Get interactions and token counts per model."""
+        return self.models
+
+    def get_timeline_entries(self) -> List[Any]:
+        """Get (slot start, model, totals) for each time slot."""
+        return [(row[0], row[1], row[2:7]) for row in self.time_slots]
+
+    def get_model_breakdown(self, pricing_data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """Get breakdown of usage and cost by model."""
+        breakdown = {}
+
+        for model in self.models_used:
+            totals = self.models[model]
+            model_tokens = TokenCounts(*totals[1:])
+            breakdown[model] = {
+                'files': totals[0],
+                'tokens': model_tokens,
+                'cost': Decimal('0.0') + calculate_interaction_cost(model, model_tokens, pricing_data)
+            }
+
+        return breakdown
+
+    @property
+    def interaction_count(self) -> int:
+        """Get number of interactions (files) in this session."""
+        return sum(totals[0] for totals in self.models.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the stored totals (not the title or path) for caching."""
+        return {
+            'session_id': self.session_id,
+            'models': self.models,
+            'start_ms': self.start_ms,
+            'end_ms': self.end_ms,
+            'processing_ms': self.processing_ms,
+            'project_path': self.project_path,
+            'time_slots': self.time_slots,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], session_path: Path,
+                  session_title: Optional[str] = None) -> 'SessionSummary':
+        """Rebuild a summary serialized by :meth:`to_dict`.
+
+        Args:
+            data: Serialized totals
+            session_path: Path to session directory
+            session_title: Session title
+
+        Returns:
+            SessionSummary object
+        """
+        return cls(
+            session_id=data['session_id'],
+            session_path=session_path,
+            models=data['models'],
+            start_ms=data['start_ms'],
+            end_ms=data['end_ms'],
+            processing_ms=data['processing_ms'],
+            project_path=data['project_path'],
+            session_title=session_title,
+            time_slots=data['time_slots'],
+        )
@@ -5,6 +5,8 @@ from typing import List, Optional, Dict, Any
 from pathlib import Path
 from decimal import Decimal
 from pydantic import BaseModel, Field, computed_field, validator
+from .timeline import interaction_entries
+from ..utils.archive_storage import file_mtime, storage_root_of
 
 
 class TokenUsage(BaseModel):
@@ -51,6 +53,96 @@ class TimeData(BaseModel):
         return None
 
 
+def calculate_interaction_cost(model_id: str, tokens: Any, pricing_data: Dict[str, Any]) -> Decimal:
+    """Calculate the cost of one interaction.
+
+    Args:
+        model_id: Model used for the interaction
+        tokens: Token counts with input, output, cache_write and cache_read
+        pricing_data: Model pricing information
+
+    Returns:
+        Interaction cost in USD
+    """
+    if model_id not in pricing_data:
+        return Decimal('0.0')
+
+    token_rates = getattr(pricing_data, 'token_rates', None)
+    if token_rates is not None:
+        # Compiled pricing table with precomputed per-token rates
+        input_rate, output_rate, cache_write_rate, cache_read_rate = token_rates(model_id)
+        cost = Decimal('0.0')
+        cost += Decimal(tokens.input) * input_rate
+        cost += Decimal(tokens.output) * output_rate
+        cost += Decimal(tokens.cache_write) * cache_write_rate
+        cost += Decimal(tokens.cache_read) * cache_read_rate
+        return cost
+
+    pricing = pricing_data[model_id]
+    cost = Decimal('0.0')
+
+    # Convert to cost per million tokens
+    million = Decimal('1000000')
+
+    cost += (Decimal(tokens.input) / million) * Decimal(str(pricing.input))
+    cost += (Decimal(tokens.output) / million) * Decimal(str(pricing.output))
+    cost += (Decimal(tokens.cache_write) / million) * Decimal(str(pricing.cache_write))
+    cost += (Decimal(tokens.cache_read) / million) * Decimal(str(pricing.cache_read))
+
+    return cost
+
+
+def calculate_model_totals_cost(model_totals: Dict[str, List[int]], pricing_data: Dict[str, Any]) -> Decimal:
+    """Calculate the cost of per-model token totals.
+
+    Cost is linear in token counts, so this equals the sum of the individual
+    interaction costs the totals were built from.
+
+    Args:
+        model_totals: Per model ``[interactions, input, output, cache_write, cache_read]``
+        pricing_data: Model pricing information
+
+    Returns:
+        Total cost in USD
+    """
+    cost = Decimal('0.0')
+    for model_id, totals in model_totals.items():
+        cost += calculate_interaction_cost(model_id, _TotalsTokens(totals), pricing_data)
+    return cost
+
+
+def summarize_model_usage(files: Any) -> Dict[str, List[int]]:
+    """Sum interactions and token counts per model.
+
+    Args:
+        files: Interactions with ``model_id`` and ``tokens``
+
+    Returns:
+        Per model ``[interactions, input, output, cache_write, cache_read]``
+    """
+    model_totals: Dict[str, List[int]] = {}
+    for file in files:
+        totals = model_totals.get(file.model_id)
+        if totals is None:
+            totals = model_totals[file.model_id] = [0, 0, 0, 0, 0]
+        tokens = file.tokens
+        totals[0] += 1
+        totals[1] += tokens.input
+        totals[2] += tokens.output
+        totals[3] += tokens.cache_write
+        totals[4] += tokens.cache_read
+    return model_totals
+
+
+class _TotalsTokens:
+    """Token-count view of a ``[interactions, input, output, cache_write, cache_read]`` row."""
+
+    __slots__ = ('input', 'output', 'cache_write', 'cache_read')
+
+    def __init__(self, totals: List[int]):
+        _, self.input, self.output, self.cache_write, self.cache_read = totals
+
+
 class InteractionFile(BaseModel):
     """Model for a single OpenCode interaction file."""
     file_path: Path
@@ -79,7 +171,7 @@ class InteractionFile(BaseModel):
     @property
     def modification_time(self) -> datetime:
         """Get file modification time."""
-        return datetime.fromtimestamp(self.file_path.stat().st_mtime)
+        return datetime.fromtimestamp(file_mtime(self.file_path))
 
     @computed_field
     @property
@@ -91,21 +183,7 @@ class InteractionFile(BaseModel):
 
     def calculate_cost(self, pricing_data: Dict[str, Any]) -> Decimal:
         """Calculate cost for this interaction."""
-        if self.model_id not in pricing_data:
-            return Decimal('0.0')
-
-        pricing = pricing_data[self.model_id]
-        cost = Decimal('0.0')
-
-        # Convert to cost per million tokens
-        million = Decimal('1000000')
-
-        cost += (Decimal(self.tokens.input) / million) * Decimal(str(pricing.input))
-        cost += (Decimal(self.tokens.output) / million) * Decimal(str(pricing.output))
-        cost += (Decimal(self.tokens.cache_write) / million) * Decimal(str(pricing.cache_write))
-        cost += (Decimal(self.tokens.cache_read) / million) * Decimal(str(pricing.cache_read))
-
-        return cost
+        return calculate_interaction_cost(self.model_id, self.tokens, pricing_data)
 
 
 class SessionData(BaseModel):
@@ -149,6 +227,13 @@ class SessionData(BaseModel):
                 if file.time_data and file.time_data.created_datetime]
         return min(times) if times else None
 
+    @property
+    def start_ms(self) -> Optional[int]:
+        """Get session start time as a millisecond timestamp."""
+        times = [file.time_data.created for file in self.files
+                 if file.time_data and file.time_data.created is not None]
+        return min(times) if times else None
+
     @computed_field
     @property
     def end_time(self) -> Optional[datetime]:
@@ -195,6 +280,14 @@ class SessionData(BaseModel):
         costs = [file.calculate_cost(pricing_data) for file in self.files]
         return Decimal(sum(costs))
 
+    def get_model_totals(self) -> Dict[str, List[int]]:
+        """Get interactions and token counts per model."""
+        return summarize_model_usage(self.files)
+
+    def get_timeline_entries(self) -> List[Any]:
+        """Get (timestamp, model, totals) for each interaction with a timestamp."""
+        return interaction_entries(self.files)
+
     def get_model_breakdown(self, pricing_data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
         """Get breakdown of usage and cost by model."""
         breakdown = {}
@@ -230,6 +323,11 @@ class SessionData(BaseModel):
         """Get files with non-zero token usage."""
         return [file for file in self.files if file.tokens.total > 0]
 
+    @property
+    def storage_root(self) -> Path:
+        """Get the storage root (messages directory) this session was read from."""
+        return storage_root_of(self.session_path)
+
     @computed_field
     @property
     def project_name(self) -> str:
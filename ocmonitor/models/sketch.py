@@ -0,0 +1,179 @@
+"""Distinct-count sketches for OpenCode Monitor.
+
+Team rollups (see :mod:`ocmonitor.models.team_rollup`) count sessions per day,
+model and project, and those counts must survive merging rollups from
+several machines without double counting a session that appears in more
+than one cell or file. ``HyperLogLog`` estimates the number of distinct
+values from a fixed array of small registers, and two sketches merge by
+taking the larger register of each pair, so merged counts cost the same
+whatever the number of sessions behind them.
+
+Most cells only ever see a handful of sessions, so a sketch starts sparse,
+storing just the registers that were set at a much finer precision
+(2 ** 25 registers, as in HyperLogLog++), which keeps counts exact in
+practice, and switches to the dense array once that would be smaller. Dense
+counts are typically within a few percent.
+"""
+
+import hashlib
+import math
+from typing import Dict, Iterable, Tuple, Union
+
+# Registers are 2 ** precision; 12 gives 4096 registers and ~1.6% standard error
+DEFAULT_PRECISION = 12
+
+# Index bits of the registers kept while a sketch is sparse
+SPARSE_PRECISION = 25
+
+# First byte of a serialized sketch
+_SPARSE = 0
+_DENSE = 1
+
+
+def _hash64(value: str) -> int:
+    """Hash a value to 64 bits, identically on every machine and Python version."""
+    return int.from_bytes(hashlib.blake2b(value.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+class HyperLogLog:
+    """Mergeable estimate of the number of distinct strings added."""
+
+    __slots__ = ('precision', 'registers')
+
+    def __init__(self, values: Iterable[str] = (), precision: int = DEFAULT_PRECISION):
+        """Initialize sketch.
+
+        Args:
+            values: Strings to add
+            precision: Number of index bits; sketches only merge with
+                sketches of the same precision
+        """
+        if not 4 <= precision <= 16:
+            raise ValueError(f"Invalid precision {precision}. Choose from 4 to 16")
+        self.precision = precision
+        # Register index -> rank while sparse, one byte per register when dense
+        self.registers: Union[Dict[int, int], bytearray] = {}
+        for value in values:
+            self.add(value)
+
+    @property
+    def size(self) -> int:
+        """Number of registers."""
+        return 1 << self.precision
+
+    def add(self, value: str) -> None:
+        """Add a string to the sketch."""
+        index, rank = _register(_hash64(value), SPARSE_PRECISION)
+        if isinstance(self.registers, dict):
+            self._set_sparse(index, rank)
+        else:
+            self._set_dense(*self._coarsen(index, rank))
+
+    def update(self, other: 'HyperLogLog') -> None:
+        """Merge another sketch into this one.
+
+        Raises:
+            ValueError: If the sketches have different precisions
+        """
+        if other.precision != self.precision:
+            raise ValueError(f"Cannot merge sketches with precision {other.precision} and {self.precision}")
+        if isinstance(other.registers, dict):
+            for index, rank in other.registers.items():
+                if isinstance(self.registers, dict):
+                    self._set_sparse(index, rank)
+                else:
+                    self._set_dense(*self._coarsen(index, rank))
+            return
+
+        if isinstance(self.registers, dict):
+            self._densify()
+        registers = self.registers
+        for index, rank in enumerate(other.registers):
+            if rank > registers[index]:
+                registers[index] = rank
+
+    def count(self) -> int:
+        """Estimate the number of distinct values added."""
+        if isinstance(self.registers, dict):
+            # Linear counting over the sparse registers, exact until they collide
+            size = 1 << SPARSE_PRECISION
+            empty = size - len(self.registers)
+            return int(round(size * math.log(size / empty)))
+
+        size = self.size
+        ranks = [rank for rank in self.registers if rank]
+        empty = size - len(ranks)
+        inverse_sum = empty + sum(2.0 ** -rank for rank in ranks)
+        alpha = 0.7213 / (1 + 1.079 / size)
+        estimate = alpha * size * size / inverse_sum
+        if estimate <= 2.5 * size and empty:
+            # Linear counting is more accurate while registers are still empty
+            estimate = size * math.log(size / empty)
+        return int(round(estimate))
+
+    def to_bytes(self) -> bytes:
+        """Serialize the sketch, sparse or dense, whichever it currently is."""
+        if isinstance(self.registers, dict):
+            entries = sorted((index << 6) | rank for index, rank in self.registers.items())
+            return bytes([_SPARSE, self.precision]) + b''.join(
+                entry.to_bytes(4, 'little') for entry in entries)
+        return bytes([_DENSE, self.precision]) + bytes(self.registers)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'HyperLogLog':
+        """Rebuild a sketch serialized by :meth:`to_bytes`.
+
+        Raises:
+            ValueError: If the data is not a serialized sketch
+        """
+        if len(data) < 2 or data[0] not in (_SPARSE, _DENSE):
+            raise ValueError("Invalid sketch data")
+        sketch = cls(precision=data[1])
+        payload = data[2:]
+        if data[0] == _DENSE:
+            if len(payload) != sketch.size:
+                raise ValueError("Invalid sketch data")
+            sketch.registers = bytearray(payload)
+            return sketch
+
+        if len(payload) % 4:
+            raise ValueError("Invalid sketch data")
+        for offset in range(0, len(payload), 4):
+            entry = int.from_bytes(payload[offset:offset + 4], 'little')
+            sketch._set_sparse(entry >> 6, entry & 0x3F)
+        return sketch
+
+    def _coarsen(self, index: int, rank: int) -> Tuple[int, int]:
+        """Convert a sparse register to the dense register it falls into."""
+        extra_bits = SPARSE_PRECISION - self.precision
+        low = index & ((1 << extra_bits) - 1)
+        if low:
+            return index >> extra_bits, extra_bits - low.bit_length() + 1
+        return index >> extra_bits, extra_bits + rank
+
+    def _set_sparse(self, index: int, rank: int) -> None:
+        """Raise one sparse register to at least ``rank``."""
+        registers = self.registers
+        if rank > registers.get(index, 0):
+            registers[index] = rank
+            # Four bytes per sparse entry against one per dense register
+            if len(registers) * 4 > self.size:
+                self._densify()
+
+    def _set_dense(self, index: int, rank: int) -> None:
+        """Raise one dense register to at least ``rank``."""
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def _densify(self) -> None:
+        """Switch from sparse to dense registers."""
+        sparse = self.registers
+        self.registers = bytearray(self.size)
+        for index, rank in sparse.items():
+            self._set_dense(*self._coarsen(index, rank))
+
+
+def _register(hashed: int, precision: int) -> Tuple[int, int]:
+    """Split a 64-bit hash into a register index and rank."""
+    bits = 64 - precision
+    return hashed >> bits, bits - (hashed & ((1 << bits) - 1)).bit_length() + 1
@@ -0,0 +1,376 @@
+"""Mergeable team rollups for OpenCode Monitor.
+
+Each developer machine keeps its own OpenCode storage. A ``TeamRollup``
+condenses one machine's usage into sums per day, model and project plus a
+``HyperLogLog`` sketch of the sessions behind each sum, which is all the
+``daily``, ``weekly``, ``monthly``, ``models`` and ``projects`` reports
+need. Rollups from many machines merge by adding the sums and merging the
+sketches cell by cell, so merging costs time proportional to the rollup
+files, never to the sessions or message files they summarize, and the
+result is itself a rollup that can be merged again.
+
+Days are taken in the timezone of the machine that wrote the rollup.
+Session counts are estimates from the sketches; token counts,
+interactions and processing time are exact, and costs are computed from
+the token sums with the pricing of the machine producing the report.
+"""
+
+import base64
+import gzip
+import json
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .analytics import (
+    DailyUsage, WeeklyUsage, MonthlyUsage, ModelBreakdownReport, ModelUsageStats,
+    ProjectBreakdownReport, ProjectUsageStats, _usage_fields
+)
+from .cube import UsageCube
+from .session import calculate_model_totals_cost
+from .sketch import DEFAULT_PRECISION, HyperLogLog
+
+TEAM_ROLLUP_FORMAT = "ocmonitor-team-rollup"
+
+# Bump when the layout of rollup files changes
+TEAM_ROLLUP_VERSION = 1
+
+# (day ordinal, model, project)
+CellKey = Tuple[int, str, str]
+
+
+class TeamRollup:
+    """Usage sums and session sketches per day, model and project."""
+
+    __slots__ = ('sources', 'timezones', 'precision', 'cells')
+
+    def __init__(self, sources: Iterable[str] = (), timezones: Iterable[str] = (),
+                 precision: int = DEFAULT_PRECISION):
+        """Initialize an empty rollup.
+
+        Args:
+            sources: Names of the machines the rollup covers
+            timezones: Timezones the days were taken in
+            precision: Precision of the session sketches
+        """
+        self.sources: List[str] = list(sources)
+        self.timezones: List[str] = list(timezones)
+        self.precision = precision
+        # Cell key -> [[interactions, input, output, cache_write, cache_read, processing ms], sketch]
+        self.cells: Dict[CellKey, List[Any]] = {}
+
+    @classmethod
+    def from_cube(cls, cube: UsageCube, source: str, timezone: str) -> 'TeamRollup':
+        """Condense a usage cube, dropping the session dimension into sketches.
+
+        Args:
+            cube: Usage cube of one machine
+            source: Name of the machine
+            timezone: Timezone the cube's days were taken in
+
+        Returns:
+            TeamRollup with one cell per day, model and project
+        """
+        rollup = cls([source], [timezone])
+        cells = rollup.cells
+        model_names, project_names, session_ids = cube.model_names, cube.project_names, cube.session_ids
+        for index in range(len(cube)):
+            key = (cube.days[index], model_names[cube.models[index]], project_names[cube.projects[index]])
+            cell = cells.get(key)
+            if cell is None:
+                cell = cells[key] = [[0, 0, 0, 0, 0, 0], HyperLogLog(precision=rollup.precision)]
+            sums = cell[0]
+            sums[0] += cube.interactions[index]
+            sums[1] += cube.input[index]
+            sums[2] += cube.output[index]
+            sums[3] += cube.cache_write[index]
+            sums[4] += cube.cache_read[index]
+            sums[5] += cube.processing_ms[index]
+            cell[1].add(session_ids[cube.sessions[index]])
+        return rollup
+
+    def merge(self, other: 'TeamRollup') -> None:
+        """Add another rollup into this one.
+
+        Args:
+            other: Rollup to merge; left unchanged
+
+        Raises:
+            ValueError: If the rollups use different sketch precisions, or
+                both cover the same machine, whose usage would be counted twice
+        """
+        if other.precision != self.precision:
+            raise ValueError(f"Cannot merge rollups with sketch precision {other.precision} and {self.precision}")
+        overlap = [source for source in other.sources if source in self.sources]
+        if overlap:
+            raise ValueError(f"Rollups both include {', '.join(overlap)}; merging would count their usage twice")
+        self.sources.extend(other.sources)
+        self.timezones.extend(timezone for timezone in other.timezones if timezone not in self.timezones)
+
+        cells = self.cells
+        for key, (sums, sketch) in other.cells.items():
+            cell = cells.get(key)
+            if cell is None:
+                cell = cells[key] = [[0, 0, 0, 0, 0, 0], HyperLogLog(precision=self.precision)]
+            cell_sums = cell[0]
+            for index, value in enumerate(sums):
+                cell_sums[index] += value
+            cell[1].update(sketch)
+
+    @classmethod
+    def merge_all(cls, rollups: Iterable['TeamRollup']) -> 'TeamRollup':
+        """Merge rollups into a new one.
+
+        Args:
+            rollups: Rollups to merge
+
+        Returns:
+            TeamRollup covering all of them
+        """
+        merged = None
+        for rollup in rollups:
+            if merged is None:
+                merged = cls(precision=rollup.precision)
+            merged.merge(rollup)
+        return merged if merged is not None else cls()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the rollup (JSON-compatible, models and projects dictionary-encoded)."""
+        model_codes: Dict[str, int] = {}
+        project_codes: Dict[str, int] = {}
+        cells = []
+        for key in sorted(self.cells):
+            day, model, project = key
+            sums, sketch = self.cells[key]
+            cells.append([
+                date.fromordinal(day).isoformat(),
+                model_codes.setdefault(model, len(model_codes)),
+                project_codes.setdefault(project, len(project_codes)),
+                *sums,
+                base64.b64encode(sketch.to_bytes()).decode('ascii'),
+            ])
+        return {
+            'format': TEAM_ROLLUP_FORMAT,
+            'version': TEAM_ROLLUP_VERSION,
+            'sources': self.sources,
+            'timezones': self.timezones,
+            'precision': self.precision,
+            'models': list(model_codes),
+            'projects': list(project_codes),
+            'cells': cells,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'TeamRollup':
+        """Rebuild a rollup serialized by :meth:`to_dict`.
+
+        Args:
+            data: Serialized rollup
+
+        Returns:
+            TeamRollup object
+
+        Raises:
+            ValueError: If the data is not a team rollup of a supported version,
+                or a cell's sketch precision differs from the rollup's
+        """
+        if not isinstance(data, dict) or data.get('format') != TEAM_ROLLUP_FORMAT:
+            raise ValueError("Not an ocmonitor team rollup")
+        if data.get('version') != TEAM_ROLLUP_VERSION:
+            raise ValueError(f"Unsupported team rollup version {data.get('version')} "
+                             f"(expected {TEAM_ROLLUP_VERSION})")
+
+        try:
+            rollup = cls(data['sources'], data['timezones'], data['precision'])
+            models, projects = data['models'], data['projects']
+            for day, model, project, *sums, sketch in data['cells']:
+                if len(sums) != 6:
+                    raise ValueError(f"expected 6 sums per cell, got {len(sums)}")
+                key = (date.fromisoformat(day).toordinal(), models[model], projects[project])
+                sketch = HyperLogLog.from_bytes(base64.b64decode(sketch))
+                if sketch.precision != rollup.precision:
+                    raise ValueError(f"sketch precision {sketch.precision} does not match "
+                                     f"rollup precision {rollup.precision}")
+                rollup.cells[key] = [[int(value) for value in sums], sketch]
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            raise ValueError(f"Corrupt team rollup: {e}")
+        return rollup
+
+    def write(self, path: str) -> None:
+        """Write the rollup as gzip-compressed JSON.
+
+        Args:
+            path: File to write
+        """
+        with gzip.open(path, 'wt', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, separators=(',', ':'))
+
+    @classmethod
+    def read(cls, path: str) -> 'TeamRollup':
+        """Read a rollup written by :meth:`write`.
+
+        Args:
+            path: File to read
+
+        Returns:
+            TeamRollup object
+
+        Raises:
+            ValueError: If the file is not a readable team rollup
+        """
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, EOFError, UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise ValueError(f"Cannot read team rollup {path}: {e}")
+        return cls.from_dict(data)
+
+    def date_range(self) -> Optional[Tuple[date, date]]:
+        """Get the first and last day with usage, or None for an empty rollup."""
+        if not self.cells:
+            return None
+        days = [key[0] for key in self.cells]
+        return date.fromordinal(min(days)), date.fromordinal(max(days))
+
+    def _group(self, group_key: Callable[[CellKey], Any], start_date: Optional[date],
+               end_date: Optional[date]) -> Dict[Any, List[Any]]:
+        """Combine the cells in a date range by a key.
+
+        Returns:
+            Key -> [per model ``[interactions, input, output, cache_write,
+            cache_read]``, session sketch]
+        """
+        first = start_date.toordinal() if start_date else None
+        last = end_date.toordinal() if end_date else None
+        groups: Dict[Any, List[Any]] = {}
+        for key, (sums, sketch) in self.cells.items():
+            day = key[0]
+            if (first is not None and day < first) or (last is not None and day > last):
+                continue
+            group_id = group_key(key)
+            group = groups.get(group_id)
+            if group is None:
+                group = groups[group_id] = [{}, HyperLogLog(precision=self.precision)]
+            totals = group[0].get(key[1])
+            if totals is None:
+                group[0][key[1]] = sums[:5]
+            else:
+                for index in range(5):
+                    totals[index] += sums[index]
+            group[1].update(sketch)
+        return groups
+
+    def daily_breakdown(self, start_date: Optional[date] = None,
+                        end_date: Optional[date] = None) -> List[DailyUsage]:
+        """Create daily usage breakdown.
+
+        Args:
+            start_date: Only include days on or after this date
+            end_date: Only include days on or before this date
+
+        Returns:
+            List of DailyUsage objects sorted by date
+        """
+        groups = self._group(lambda key: key[0], start_date, end_date)
+        return [
+            DailyUsage(date=date.fromordinal(day), **_usage_fields(sketch.count(), model_totals))
+            for day, (model_totals, sketch) in sorted(groups.items())
+        ]
+
+    def weekly_breakdown(self, start_date: Optional[date] = None,
+                         end_date: Optional[date] = None) -> List[WeeklyUsage]:
+        """Create ISO week usage breakdown.
+
+        Args:
+            start_date: Only include days on or after this date
+            end_date: Only include days on or before this date
+
+        Returns:
+            List of WeeklyUsage objects sorted by week
+        """
+        groups = self._group(lambda key: key[0] - date.fromordinal(key[0]).weekday(), start_date, end_date)
+        breakdown = []
+        for monday, (model_totals, sketch) in sorted(groups.items()):
+            week_start = date.fromordinal(monday)
+            year, week, _ = week_start.isocalendar()
+            breakdown.append(WeeklyUsage(year=year, week=week, start_date=week_start,
+                                         end_date=week_start + timedelta(days=6),
+                                         **_usage_fields(sketch.count(), model_totals)))
+        return breakdown
+
+    def monthly_breakdown(self, start_date: Optional[date] = None,
+                          end_date: Optional[date] = None) -> List[MonthlyUsage]:
+        """Create monthly usage breakdown.
+
+        Args:
+            start_date: Only include days on or after this date
+            end_date: Only include days on or before this date
+
+        Returns:
+            List of MonthlyUsage objects sorted by month
+        """
+        def month_of(key: CellKey) -> Tuple[int, int]:
+            day = date.fromordinal(key[0])
+            return day.year, day.month
+
+        groups = self._group(month_of, start_date, end_date)
+        return [
+            MonthlyUsage(year=year, month=month, **_usage_fields(sketch.count(), model_totals))
+            for (year, month), (model_totals, sketch) in sorted(groups.items())
+        ]
+
+    def model_breakdown(self, pricing_data: Dict[str, Any], start_date: Optional[date] = None,
+                        end_date: Optional[date] = None) -> ModelBreakdownReport:
+        """Create model usage breakdown.
+
+        Sessions count towards every model they used on a day in the range.
+
+        Args:
+            pricing_data: Model pricing information
+            start_date: Only include days on or after this date
+            end_date: Only include days on or before this date
+
+        Returns:
+            ModelBreakdownReport sorted by cost descending
+        """
+        groups = self._group(lambda key: key[1], start_date, end_date)
+        model_stats = []
+        for model_name, (model_totals, sketch) in groups.items():
+            fields = _usage_fields(sketch.count(), model_totals)
+            model_stats.append(ModelUsageStats(
+                model_name=model_name,
+                total_tokens=fields['total_tokens'],
+                total_sessions=fields['total_sessions'],
+                total_interactions=fields['total_interactions'],
+                total_cost=calculate_model_totals_cost(model_totals, pricing_data),
+            ))
+        model_stats.sort(key=lambda x: x.total_cost, reverse=True)
+        return ModelBreakdownReport(timeframe="all", start_date=start_date, end_date=end_date,
+                                    model_stats=model_stats)
+
+    def project_breakdown(self, pricing_data: Dict[str, Any], start_date: Optional[date] = None,
+                          end_date: Optional[date] = None) -> ProjectBreakdownReport:
+        """Create project usage breakdown.
+
+        Args:
+            pricing_data: Model pricing information
+            start_date: Only include days on or after this date
+            end_date: Only include days on or before this date
+
+        Returns:
+            ProjectBreakdownReport sorted by cost descending
+        """
+        groups = self._group(lambda key: key[2], start_date, end_date)
+        project_stats = []
+        for project_name, (model_totals, sketch) in groups.items():
+            fields = _usage_fields(sketch.count(), model_totals)
+            project_stats.append(ProjectUsageStats(
+                project_name=project_name,
+                total_tokens=fields['total_tokens'],
+                total_sessions=fields['total_sessions'],
+                total_interactions=fields['total_interactions'],
+                total_cost=calculate_model_totals_cost(model_totals, pricing_data),
+                models_used=sorted(model_totals),
+            ))
+        project_stats.sort(key=lambda x: x.total_cost, reverse=True)
+        return ProjectBreakdownReport(timeframe="all", start_date=start_date, end_date=end_date,
+                                      project_stats=project_stats)
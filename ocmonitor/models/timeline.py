@@ -0,0 +1,260 @@
+"""Interaction timeline for OpenCode Monitor.
+
+Time-based reports bucket usage by when each interaction was created rather
+than by when its session started, so a session running past midnight counts
+towards both days. ``UsageTimeline`` keeps usage entries as parallel arrays
+sorted by timestamp; the entries of a period are the slice between two
+``bisect`` positions, so a report only touches the entries inside its date
+range and bucketing costs one binary search per period.
+
+``SessionIndex`` does the same for whole sessions, sorted by start time, so
+filters by session start date are binary searches too.
+
+Entries are single interactions for loaded sessions, or per-session
+15-minute slots for session summaries and the rollup store. Timezone
+offsets in use are multiples of 15 minutes, so local midnight always falls
+on a slot boundary and slots bucket exactly like the interactions they were
+summed from, in any timezone.
+"""
+
+from array import array
+from bisect import bisect_left
+from operator import itemgetter
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Width of the time slots summaries keep per session
+TIME_SLOT_MS = 15 * 60 * 1000
+
+# Integer columns of UsageTimeline, stored as raw bytes by to_dict()
+_TIMELINE_ARRAYS = ('timestamps', 'interactions', 'input', 'output', 'cache_write', 'cache_read')
+
+# (timestamp in ms, model, [interactions, input, output, cache_write, cache_read])
+TimelineEntry = Tuple[int, str, Sequence[int]]
+
+
+def interaction_timestamp(time_data: Any) -> Optional[int]:
+    """Get the time an interaction counts towards.
+
+    Interactions without a creation time fall back to their completion time;
+    interactions without either belong to no period.
+
+    Args:
+        time_data: TimeSpan, TimeData or None
+
+    Returns:
+        Timestamp in milliseconds, or None
+    """
+    if time_data is None:
+        return None
+    return time_data.created if time_data.created is not None else time_data.completed
+
+
+def interaction_entries(files: Iterable[Any]) -> List[TimelineEntry]:
+    """Get one timeline entry per interaction.
+
+    Args:
+        files: Interactions with ``model_id``, ``tokens`` and ``time_data``
+
+    Returns:
+        List of (timestamp, model, totals) for interactions with a timestamp
+    """
+    entries = []
+    for file in files:
+        timestamp = interaction_timestamp(file.time_data)
+        if timestamp is not None:
+            tokens = file.tokens
+            entries.append((timestamp, file.model_id,
+                            (1, tokens.input, tokens.output, tokens.cache_write, tokens.cache_read)))
+    return entries
+
+
+def summarize_time_slots(files: Iterable[Any]) -> List[List[Any]]:
+    """Sum interactions, token counts and processing time per time slot and model.
+
+    Args:
+        files: Interactions with ``model_id``, ``tokens`` and ``time_data``
+
+    Returns:
+        Rows of ``[slot start ms, model, interactions, input, output,
+        cache_write, cache_read, processing ms]`` sorted by slot
+    """
+    slots: Dict[Tuple[int, str], List[Any]] = {}
+    for file in files:
+        time_data = file.time_data
+        timestamp = interaction_timestamp(time_data)
+        if timestamp is None:
+            continue
+        slot = timestamp - timestamp % TIME_SLOT_MS
+        tokens = file.tokens
+        processing_ms = time_data.duration_ms or 0
+        row = slots.get((slot, file.model_id))
+        if row is None:
+            slots[(slot, file.model_id)] = [slot, file.model_id, 1, tokens.input, tokens.output,
+                                            tokens.cache_write, tokens.cache_read, processing_ms]
+        else:
+            row[2] += 1
+            row[3] += tokens.input
+            row[4] += tokens.output
+            row[5] += tokens.cache_write
+            row[6] += tokens.cache_read
+            row[7] += processing_ms
+    return sorted(slots.values(), key=itemgetter(0))
+
+
+class UsageTimeline:
+    """Usage entries of many sessions, sorted by timestamp."""
+
+    __slots__ = ('timestamps', 'session_ids', 'models', 'interactions',
+                 'input', 'output', 'cache_write', 'cache_read')
+
+    def __init__(self, entries: Iterable[Tuple[int, str, str, Sequence[int]]] = ()):
+        """Initialize timeline.
+
+        Args:
+            entries: Tuples of (timestamp in ms, session ID, model,
+                [interactions, input, output, cache_write, cache_read]),
+                in any order
+        """
+        ordered = sorted(entries, key=itemgetter(0))
+        self.timestamps = array('q', [entry[0] for entry in ordered])
+        self.session_ids = [entry[1] for entry in ordered]
+        self.models = [entry[2] for entry in ordered]
+        self.interactions = array('q', [entry[3][0] for entry in ordered])
+        self.input = array('q', [entry[3][1] for entry in ordered])
+        self.output = array('q', [entry[3][2] for entry in ordered])
+        self.cache_write = array('q', [entry[3][3] for entry in ordered])
+        self.cache_read = array('q', [entry[3][4] for entry in ordered])
+
+    @classmethod
+    def from_sessions(cls, sessions: Iterable[Any]) -> 'UsageTimeline':
+        """Build a timeline from sessions, records or summaries.
+
+        Args:
+            sessions: Objects with ``session_id`` and ``get_timeline_entries()``
+
+        Returns:
+            UsageTimeline with every session's entries
+        """
+        return cls(
+            (timestamp, session.session_id, model, totals)
+            for session in sessions
+            for timestamp, model, totals in session.get_timeline_entries()
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'UsageTimeline':
+        """Rebuild a timeline serialized by :meth:`to_dict` without sorting again.
+
+        Args:
+            data: Serialized timeline
+
+        Returns:
+            UsageTimeline object
+        """
+        timeline = cls()
+        timeline.session_ids = data['session_ids']
+        timeline.models = data['models']
+        for name in _TIMELINE_ARRAYS:
+            getattr(timeline, name).frombytes(data[name])
+        return timeline
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the sorted arrays for caching (marshal-compatible)."""
+        data: Dict[str, Any] = {'session_ids': self.session_ids, 'models': self.models}
+        for name in _TIMELINE_ARRAYS:
+            data[name] = getattr(self, name).tobytes()
+        return data
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def slice(self, start_ms: Optional[int] = None, end_ms: Optional[int] = None) -> Tuple[int, int]:
+        """Find the entries with ``start_ms <= timestamp < end_ms``.
+
+        Args:
+            start_ms: Inclusive lower bound, or None for the first entry
+            end_ms: Exclusive upper bound, or None for past the last entry
+
+        Returns:
+            Tuple of (lo, hi) indexes of the matching entries
+        """
+        lo = bisect_left(self.timestamps, start_ms) if start_ms is not None else 0
+        hi = bisect_left(self.timestamps, end_ms, lo) if end_ms is not None else len(self.timestamps)
+        return lo, hi
+
+    def totals(self, lo: int, hi: int) -> Tuple[int, Dict[str, List[int]]]:
+        """Sum the entries in ``[lo, hi)``.
+
+        Args:
+            lo: First entry index
+            hi: Index past the last entry
+
+        Returns:
+            Tuple of (distinct sessions, per model ``[interactions, input,
+            output, cache_write, cache_read]``)
+        """
+        model_totals: Dict[str, List[int]] = {}
+        for model, interactions, input, output, cache_write, cache_read in zip(
+            self.models[lo:hi], self.interactions[lo:hi], self.input[lo:hi],
+            self.output[lo:hi], self.cache_write[lo:hi], self.cache_read[lo:hi]
+        ):
+            totals = model_totals.get(model)
+            if totals is None:
+                model_totals[model] = [interactions, input, output, cache_write, cache_read]
+            else:
+                totals[0] += interactions
+                totals[1] += input
+                totals[2] += output
+                totals[3] += cache_write
+                totals[4] += cache_read
+        return len(set(self.session_ids[lo:hi])), model_totals
+
+
+class SessionIndex:
+    """Sessions sorted by start time.
+
+    Built once over a loaded list of sessions; every date-range query is
+    then a pair of binary searches instead of a pass that recomputes each
+    session's start time. Selected sessions are returned in their original
+    order, so results match a linear filter exactly.
+    """
+
+    __slots__ = ('sessions', 'start_ms', 'positions')
+
+    def __init__(self, sessions: Iterable[Any]):
+        """Initialize index.
+
+        Args:
+            sessions: Sessions, records or summaries with ``start_ms``;
+                sessions without a start time are never selected
+        """
+        self.sessions = list(sessions)
+        keyed = []
+        for position, session in enumerate(self.sessions):
+            start_ms = session.start_ms
+            if start_ms is not None:
+                keyed.append((start_ms, position))
+        keyed.sort()
+        self.start_ms = array('q', [key[0] for key in keyed])
+        self.positions = array('q', [key[1] for key in keyed])
+
+    def __iter__(self):
+        return iter(self.sessions)
+
+    def __len__(self) -> int:
+        return len(self.sessions)
+
+    def select(self, start_ms: Optional[int] = None, end_ms: Optional[int] = None) -> List[Any]:
+        """Get the sessions that started in ``[start_ms, end_ms)``.
+
+        Args:
+            start_ms: Inclusive lower bound, or None for no lower bound
+            end_ms: Exclusive upper bound, or None for no upper bound
+
+        Returns:
+            Matching sessions in their original order
+        """
+        lo = bisect_left(self.start_ms, start_ms) if start_ms is not None else 0
+        hi = bisect_left(self.start_ms, end_ms, lo) if end_ms is not None else len(self.start_ms)
+        sessions = self.sessions
+        return [sessions[position] for position in sorted(self.positions[lo:hi])]
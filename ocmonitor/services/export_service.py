@@ -3,25 +3,96 @@
 import csv
 import json
 import os
+import sqlite3
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union
-from datetime import datetime
+from typing import List, Dict, Any, Optional, Union, Tuple
+from datetime import datetime, tzinfo
 
 from ..utils.formatting import DataFormatter
+from ..utils.instrumentation import instrumented
+from ..utils.time_utils import TimeUtils
+
+
+# Hive convention for rows whose partition value is unknown
+HIVE_DEFAULT_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
+# Schema for the normalized SQLite export
+SQLITE_SCHEMA = """
+CREATE TABLE metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE models (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    input_price REAL,
+    output_price REAL,
+    cache_write_price REAL,
+    cache_read_price REAL
+);
+CREATE TABLE projects (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE,
+    name TEXT NOT NULL
+);
+CREATE TABLE sessions (
+    id INTEGER PRIMARY KEY,
+    session_id TEXT NOT NULL UNIQUE,
+    title TEXT,
+    project_id INTEGER REFERENCES projects(id),
+    start_ms INTEGER,
+    end_ms INTEGER,
+    interaction_count INTEGER NOT NULL
+);
+CREATE TABLE interactions (
+    id INTEGER PRIMARY KEY,
+    session_id INTEGER NOT NULL REFERENCES sessions(id),
+    model_id INTEGER NOT NULL REFERENCES models(id),
+    project_id INTEGER REFERENCES projects(id),
+    file_name TEXT NOT NULL,
+    created_ms INTEGER,
+    completed_ms INTEGER,
+    created_date TEXT,
+    duration_ms INTEGER,
+    input_tokens INTEGER NOT NULL,
+    output_tokens INTEGER NOT NULL,
+    cache_write_tokens INTEGER NOT NULL,
+    cache_read_tokens INTEGER NOT NULL,
+    total_tokens INTEGER NOT NULL,
+    cost REAL NOT NULL
+);
+"""
+
+# Indexes are created after the bulk load, which is much faster than
+# maintaining them row by row
+SQLITE_INDEXES = """
+CREATE INDEX idx_interactions_created ON interactions(created_ms);
+CREATE INDEX idx_interactions_date ON interactions(created_date);
+CREATE INDEX idx_interactions_model ON interactions(model_id);
+CREATE INDEX idx_interactions_project ON interactions(project_id);
+CREATE INDEX idx_interactions_session ON interactions(session_id);
+CREATE INDEX idx_sessions_start ON sessions(start_ms);
+CREATE INDEX idx_sessions_project ON sessions(project_id);
+"""
 
 
 class ExportService:
     """Service for exporting data to various formats."""
 
-    def __init__(self, export_dir: str = "./exports"):
+    def __init__(self, export_dir: str = "./exports", timezone: Optional[tzinfo] = None):
         """Initialize export service.
 
         Args:
             export_dir: Directory to save exported files
+            timezone: Timezone interaction dates are taken in; None for local time
         """
         self.export_dir = Path(export_dir)
+        self.timezone = timezone
         self.export_dir.mkdir(parents=True, exist_ok=True)
 
+    @instrumented("export.csv")
     def export_to_csv(self, data: List[Dict[str, Any]], filename: str,
                      include_metadata: bool = True) -> str:
         """Export data to CSV format.
@@ -56,34 +127,14 @@ class ExportService:
                     csvfile.write(f"# Records: {len(data)}\n")
                     csvfile.write("#\n")
 
-                # Get all unique keys from the data
-                fieldnames = set()
-                for row in data:
-                    fieldnames.update(row.keys())
-                fieldnames = sorted(list(fieldnames))
-
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-
-                # Write data rows, sanitizing values
-                for row in data:
-                    sanitized_row = {}
-                    for key in fieldnames:
-                        value = row.get(key)
-                        if value is None:
-                            sanitized_row[key] = ""
-                        elif isinstance(value, (list, dict)):
-                            # Convert complex types to string representation
-                            sanitized_row[key] = str(value)
-                        else:
-                            sanitized_row[key] = DataFormatter.sanitize_for_csv(value)
-                    writer.writerow(sanitized_row)
+                self._write_csv_rows(csvfile, data, self._collect_fieldnames(data))
 
         except IOError as e:
             raise IOError(f"Failed to write CSV file: {e}")
 
         return str(output_path)
 
+    @instrumented("export.json")
     def export_to_json(self, data: Union[List[Dict[str, Any]], Dict[str, Any]], filename: str,
                       include_metadata: bool = True, indent: int = 2) -> str:
         """Export data to JSON format.
@@ -143,6 +194,379 @@ class ExportService:
 
         return str(output_path)
 
+    def _collect_fieldnames(self, data: List[Dict[str, Any]]) -> List[str]:
+        """Get the sorted union of keys across all rows.
+
+        Args:
+            data: List of row dictionaries
+
+        Returns:
+            Sorted list of column names
+        """
+        fieldnames = set()
+        for row in data:
+            fieldnames.update(row.keys())
+        return sorted(list(fieldnames))
+
+    def _write_csv_rows(self, csvfile, data: List[Dict[str, Any]], fieldnames: List[str]):
+        """Write a header and sanitized data rows to an open CSV file.
+
+        Args:
+            csvfile: Open text file handle
+            data: List of row dictionaries
+            fieldnames: Column names in output order
+        """
+        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        writer.writeheader()
+
+        # Write data rows, sanitizing values
+        for row in data:
+            sanitized_row = {}
+            for key in fieldnames:
+                value = row.get(key)
+                if value is None:
+                    sanitized_row[key] = ""
+                elif isinstance(value, (list, dict)):
+                    # Convert complex types to string representation
+                    sanitized_row[key] = str(value)
+                else:
+                    sanitized_row[key] = DataFormatter.sanitize_for_csv(value)
+            writer.writerow(sanitized_row)
+
+    @instrumented("export.rows")
+    def build_interaction_rows(self, sessions: List[Any],
+                               pricing_data: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Flatten sessions into one export row per interaction.
+
+        Args:
+            sessions: Sessions to flatten
+            pricing_data: Model pricing used to fill the cost column (optional)
+
+        Returns:
+            List of interaction row dictionaries
+        """
+        rows = []
+        for session in sessions:
+            session_title = session.session_title
+            project_name = session.project_name
+            for file in session.files:
+                row = {
+                    'session_id': session.session_id,
+                    'session_title': session_title,
+                    'project_name': project_name,
+                    'file_name': file.file_name,
+                    'model_id': file.model_id,
+                    'input_tokens': file.tokens.input,
+                    'output_tokens': file.tokens.output,
+                    'cache_write_tokens': file.tokens.cache_write,
+                    'cache_read_tokens': file.tokens.cache_read,
+                    'total_tokens': file.tokens.total,
+                    'created_time': file.time_data.created if file.time_data else None,
+                    'completed_time': file.time_data.completed if file.time_data else None,
+                    'duration_ms': file.time_data.duration_ms if file.time_data else None
+                }
+                if pricing_data is not None:
+                    row['cost'] = float(file.calculate_cost(pricing_data))
+                rows.append(row)
+        return rows
+
+    @instrumented("export.partitioned")
+    def export_partitioned(self, data: List[Dict[str, Any]], dataset_name: str,
+                           format_type: str = "csv", partition_by: str = "month",
+                           timestamp_field: str = "created_time", include_metadata: bool = True,
+                           max_workers: Optional[int] = None, rows_per_file: int = 100000) -> str:
+        """Export rows into a Hive-style partitioned directory tree.
+
+        Rows are routed by the millisecond timestamp in ``timestamp_field``
+        into ``year=YYYY/month=MM[/day=DD]/part-NNNN.<ext>`` files. Each
+        partition is written by a worker thread, and a ``_manifest.json``
+        describing every partition is written at the top of the tree.
+
+        Args:
+            data: List of row dictionaries
+            dataset_name: Name of the output directory
+            format_type: File format for partition files ("csv" or "json")
+            partition_by: Partition granularity ("year", "month" or "day")
+            timestamp_field: Row key holding the timestamp in milliseconds
+            include_metadata: Whether to write the manifest file
+            max_workers: Number of writer threads (None for default)
+            rows_per_file: Maximum rows per part file
+
+        Returns:
+            Path to the dataset directory
+
+        Raises:
+            ValueError: If data, format or partitioning is invalid
+            IOError: If files cannot be written
+        """
+        if not data:
+            raise ValueError("No data to export")
+        if format_type not in ["csv", "json"]:
+            raise ValueError(f"Unsupported partitioned export format: {format_type}")
+        if partition_by not in ["year", "month", "day"]:
+            raise ValueError(f"Unsupported partition granularity: {partition_by}")
+        if rows_per_file < 1:
+            raise ValueError("rows_per_file must be at least 1")
+
+        dataset_dir = self.export_dir / dataset_name
+        if dataset_dir.exists() and any(dataset_dir.iterdir()):
+            raise ValueError(f"Export directory is not empty: {dataset_dir}")
+
+        # Route rows into partitions
+        partitions: Dict[Tuple[str, ...], List[Dict[str, Any]]] = defaultdict(list)
+        for row in data:
+            partitions[self._partition_values(row.get(timestamp_field), partition_by)].append(row)
+
+        # Use one schema for every partition so part files line up
+        fieldnames = self._collect_fieldnames(data)
+        columns = self._partition_columns(partition_by)
+        extension = "csv" if format_type == "csv" else "jsonl"
+
+        def write_partition(values: Tuple[str, ...]) -> Dict[str, Any]:
+            rows = partitions[values]
+            relative_dir = Path(*[f"{column}={value}" for column, value in zip(columns, values)])
+            partition_dir = dataset_dir / relative_dir
+            partition_dir.mkdir(parents=True, exist_ok=True)
+
+            files = []
+            for part, offset in enumerate(range(0, len(rows), rows_per_file)):
+                chunk = rows[offset:offset + rows_per_file]
+                file_path = partition_dir / f"part-{part:04d}.{extension}"
+                with open(file_path, 'w', newline='', encoding='utf-8') as output:
+                    if format_type == "csv":
+                        self._write_csv_rows(output, chunk, fieldnames)
+                    else:
+                        for row in chunk:
+                            output.write(json.dumps(row, default=self._json_serializer,
+                                                    ensure_ascii=False))
+                            output.write("\n")
+                files.append({
+                    'path': (relative_dir / file_path.name).as_posix(),
+                    'rows': len(chunk),
+                    'size_bytes': file_path.stat().st_size
+                })
+
+            timestamps = [row[timestamp_field] for row in rows if row.get(timestamp_field) is not None]
+            return {
+                'path': relative_dir.as_posix(),
+                'values': dict(zip(columns, values)),
+                'rows': len(rows),
+                'files': files,
+                'min_timestamp': min(timestamps) if timestamps else None,
+                'max_timestamp': max(timestamps) if timestamps else None
+            }
+
+        try:
+            dataset_dir.mkdir(parents=True, exist_ok=True)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                manifest_partitions = list(executor.map(write_partition, sorted(partitions.keys())))
+
+            if include_metadata:
+                manifest = {
+                    'generated_by': 'OpenCode Monitor',
+                    'generated_at': datetime.now().isoformat(),
+                    'version': '1.0.0',
+                    'format': format_type,
+                    'partition_by': partition_by,
+                    'partition_columns': columns,
+                    'timestamp_field': timestamp_field,
+                    'columns': fieldnames,
+                    'total_rows': len(data),
+                    'partitions': manifest_partitions
+                }
+                with open(dataset_dir / "_manifest.json", 'w', encoding='utf-8') as manifest_file:
+                    json.dump(manifest, manifest_file, indent=2, ensure_ascii=False)
+
+        except (IOError, OSError) as e:
+            raise IOError(f"Failed to write partitioned export: {e}")
+
+        return str(dataset_dir)
+
+    @instrumented("export.sqlite")
+    def export_to_sqlite(self, sessions: List[Any], filename: str,
+                         pricing_data: Optional[Dict[str, Any]] = None,
+                         include_metadata: bool = True, batch_size: int = 50000) -> str:
+        """Export sessions to a normalized SQLite database.
+
+        The database has ``sessions``, ``interactions``, ``models`` and
+        ``projects`` tables, indexed on interaction time, model and
+        project. Rows are inserted with batched ``executemany`` calls
+        inside a single transaction, and the file is only moved into
+        place once the load has committed.
+
+        Args:
+            sessions: Sessions to export
+            filename: Output filename (without extension)
+            pricing_data: Model pricing used to fill costs and the models table
+            include_metadata: Whether to fill the metadata table
+            batch_size: Number of interaction rows per executemany batch
+
+        Returns:
+            Path to exported database
+
+        Raises:
+            ValueError: If there are no sessions to export
+            IOError: If the database cannot be written
+        """
+        if not sessions:
+            raise ValueError("No data to export")
+
+        pricing_data = pricing_data or {}
+
+        # Ensure filename has .db extension
+        if not filename.endswith(('.db', '.sqlite', '.sqlite3')):
+            filename += '.db'
+
+        output_path = self.export_dir / filename
+        temp_path = output_path.with_name(output_path.name + '.tmp')
+        if temp_path.exists():
+            temp_path.unlink()
+
+        model_ids: Dict[str, int] = {}
+        project_ids: Dict[Optional[str], int] = {}
+
+        def model_key(name: str) -> int:
+            if name not in model_ids:
+                pricing = pricing_data.get(name)
+                cursor = connection.execute(
+                    "INSERT INTO models (name, input_price, output_price, cache_write_price, cache_read_price) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (name,
+                     float(pricing.input) if pricing else None,
+                     float(pricing.output) if pricing else None,
+                     float(pricing.cache_write) if pricing else None,
+                     float(pricing.cache_read) if pricing else None)
+                )
+                model_ids[name] = cursor.lastrowid
+            return model_ids[name]
+
+        def project_key(project_path: Optional[str]) -> Optional[int]:
+            if not project_path:
+                return None
+            if project_path not in project_ids:
+                cursor = connection.execute(
+                    "INSERT INTO projects (path, name) VALUES (?, ?)",
+                    (project_path, Path(project_path).name or "Unknown")
+                )
+                project_ids[project_path] = cursor.lastrowid
+            return project_ids[project_path]
+
+        insert_interaction = (
+            "INSERT INTO interactions (session_id, model_id, project_id, file_name, created_ms, "
+            "completed_ms, created_date, duration_ms, input_tokens, output_tokens, cache_write_tokens, "
+            "cache_read_tokens, total_tokens, cost) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+        )
+
+        try:
+            connection = sqlite3.connect(str(temp_path), isolation_level=None)
+            try:
+                # The database is private until it is renamed into place, so
+                # durability during the load buys nothing
+                connection.execute("PRAGMA journal_mode = OFF")
+                connection.execute("PRAGMA synchronous = OFF")
+                connection.executescript(SQLITE_SCHEMA)
+                connection.execute("BEGIN")
+
+                batch = []
+                interaction_total = 0
+                for session in sessions:
+                    files = session.files
+                    created = [f.time_data.created for f in files
+                               if f.time_data and f.time_data.created is not None]
+                    completed = [f.time_data.completed for f in files
+                                 if f.time_data and f.time_data.completed is not None]
+                    session_project_paths = [f.project_path for f in files if f.project_path]
+                    session_project = (max(set(session_project_paths), key=session_project_paths.count)
+                                       if session_project_paths else None)
+
+                    cursor = connection.execute(
+                        "INSERT INTO sessions (session_id, title, project_id, start_ms, end_ms, interaction_count) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (session.session_id, session.session_title, project_key(session_project),
+                         min(created) if created else None, max(completed) if completed else None,
+                         len(files))
+                    )
+                    session_key = cursor.lastrowid
+
+                    for file in files:
+                        time_data = file.time_data
+                        created_ms = time_data.created if time_data else None
+                        created_date = None
+                        if created_ms is not None:
+                            created_date = TimeUtils.timestamp_date(created_ms, self.timezone).isoformat()
+                        tokens = file.tokens
+                        batch.append((
+                            session_key, model_key(file.model_id), project_key(file.project_path),
+                            file.file_name, created_ms, time_data.completed if time_data else None,
+                            created_date, time_data.duration_ms if time_data else None,
+                            tokens.input, tokens.output, tokens.cache_write, tokens.cache_read,
+                            tokens.total, float(file.calculate_cost(pricing_data))
+                        ))
+
+                        if len(batch) >= batch_size:
+                            connection.executemany(insert_interaction, batch)
+                            interaction_total += len(batch)
+                            batch = []
+
+                if batch:
+                    connection.executemany(insert_interaction, batch)
+                    interaction_total += len(batch)
+
+                # executescript() would commit early, so run index statements one by one
+                for statement in SQLITE_INDEXES.split(';'):
+                    if statement.strip():
+                        connection.execute(statement)
+
+                if include_metadata:
+                    connection.executemany(
+                        "INSERT INTO metadata (key, value) VALUES (?, ?)",
+                        [('generated_by', 'OpenCode Monitor'),
+                         ('generated_at', datetime.now().isoformat()),
+                         ('version', '1.0.0'),
+                         ('session_count', str(len(sessions))),
+                         ('interaction_count', str(interaction_total))]
+                    )
+
+                connection.execute("COMMIT")
+            finally:
+                connection.close()
+
+            os.replace(temp_path, output_path)
+
+        except (sqlite3.Error, OSError) as e:
+            if temp_path.exists():
+                temp_path.unlink()
+            raise IOError(f"Failed to write SQLite database: {e}")
+
+        return str(output_path)
+
+    def _partition_columns(self, partition_by: str) -> List[str]:
+        """Get the partition column names for a granularity."""
+        columns = ["year", "month", "day"]
+        return columns[:columns.index(partition_by) + 1]
+
+    def _partition_values(self, timestamp_ms: Optional[int], partition_by: str) -> Tuple[str, ...]:
+        """Get the partition values for a millisecond timestamp.
+
+        Args:
+            timestamp_ms: Timestamp in milliseconds (None if unknown)
+            partition_by: Partition granularity
+
+        Returns:
+            Tuple of partition values, one per partition column
+        """
+        depth = len(self._partition_columns(partition_by))
+        if timestamp_ms is None:
+            return (HIVE_DEFAULT_PARTITION,) * depth
+
+        try:
+            moment = TimeUtils.timestamp_date(timestamp_ms, self.timezone)
+        except (ValueError, OSError, OverflowError):
+            return (HIVE_DEFAULT_PARTITION,) * depth
+
+        values = (f"{moment.year:04d}", f"{moment.month:02d}", f"{moment.day:02d}")
+        return values[:depth]
+
     def export_report_data(self, report_data: Dict[str, Any], report_type: str,
                           format_type: str, output_filename: Optional[str] = None,
                           include_metadata: bool = True) -> str:
@@ -178,6 +602,57 @@ class ExportService:
         else:
             return self.export_to_json(export_data, output_filename, include_metadata)
 
+    @instrumented("export.bundle")
+    def export_bundle(self, bundle: Dict[str, Dict[str, Any]], format_type: str,
+                      bundle_name: str, include_metadata: bool = True,
+                      max_workers: Optional[int] = None) -> Dict[str, str]:
+        """Export several reports into one directory using writer threads.
+
+        Args:
+            bundle: Mapping of report type to report data (see
+                ReportGenerator.generate_report_bundle)
+            format_type: Export format ("csv" or "json")
+            bundle_name: Name of the output directory
+            include_metadata: Whether to include metadata
+            max_workers: Number of writer threads (None for one per report)
+
+        Returns:
+            Dictionary mapping report type to exported file path; reports
+            without data are skipped
+
+        Raises:
+            ValueError: If format is invalid
+            IOError: If export fails
+        """
+        if format_type not in ["csv", "json"]:
+            raise ValueError(f"Unsupported export format: {format_type}")
+
+        (self.export_dir / bundle_name).mkdir(parents=True, exist_ok=True)
+
+        # Extract rows up front so writer threads only do I/O
+        exports = {}
+        for report_type, report_data in bundle.items():
+            # A bundled 'session' report carries interaction detail for every session
+            extract_type = "interactions" if report_type == "session" else report_type
+            export_data = self._extract_export_data(report_data, extract_type)
+            if export_data:
+                exports[report_type] = export_data
+
+        def write_report(report_type: str) -> str:
+            filename = str(Path(bundle_name) / report_type)
+            if format_type == "csv":
+                return self.export_to_csv(exports[report_type], filename, include_metadata)
+            return self.export_to_json(exports[report_type], filename, include_metadata)
+
+        if not exports:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=max_workers or len(exports)) as executor:
+            paths = list(executor.map(write_report, exports.keys()))
+
+        return dict(zip(exports.keys(), paths))
+
+    @instrumented("export.extract")
     def _extract_export_data(self, report_data: Dict[str, Any], report_type: str) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
         """Extract exportable data from report data.
 
@@ -212,6 +687,10 @@ class ExportService:
                 ]
             return []
 
+        elif report_type == "interactions":
+            # For interaction detail across many sessions, export one row per file
+            return self.build_interaction_rows(report_data.get('sessions', []))
+
         elif report_type == "sessions":
             # For sessions summary, export session-level data
             sessions = report_data.get('sessions', [])
@@ -244,7 +723,7 @@ class ExportService:
             return [
                 {
                     'date': day.date.isoformat(),
-                    'sessions_count': len(day.sessions),
+                    'sessions_count': day.total_sessions,
                     'total_interactions': day.total_interactions,
                     'input_tokens': day.total_tokens.input,
                     'output_tokens': day.total_tokens.output,
@@ -390,10 +869,14 @@ class ExportService:
             }
 
             # Add format-specific information
-            if path.suffix.lower() == '.csv':
+            if path.is_dir():
+                summary.update(self._get_partitioned_info(path))
+            elif path.suffix.lower() == '.csv':
                 summary.update(self._get_csv_info(path))
             elif path.suffix.lower() == '.json':
                 summary.update(self._get_json_info(path))
+            elif path.suffix.lower() in ['.db', '.sqlite', '.sqlite3']:
+                summary.update(self._get_sqlite_info(path))
 
             return summary
 
@@ -432,6 +915,59 @@ class ExportService:
         except Exception:
             return {'rows': 'unknown', 'columns': 'unknown', 'has_header': 'unknown'}
 
+    def _get_sqlite_info(self, file_path: Path) -> Dict[str, Any]:
+        """Get SQLite-specific information.
+
+        Args:
+            file_path: Path to SQLite database
+
+        Returns:
+            SQLite information
+        """
+        try:
+            connection = sqlite3.connect(f"file:{file_path}?mode=ro", uri=True)
+            try:
+                tables = {}
+                for table in ['sessions', 'interactions', 'models', 'projects']:
+                    tables[table] = connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            finally:
+                connection.close()
+
+            return {
+                'rows': tables['interactions'],
+                'tables': tables
+            }
+
+        except sqlite3.Error:
+            return {'rows': 'unknown', 'tables': 'unknown'}
+
+    def _get_partitioned_info(self, dataset_dir: Path) -> Dict[str, Any]:
+        """Get information about a partitioned export directory.
+
+        Args:
+            dataset_dir: Path to the dataset directory
+
+        Returns:
+            Partitioned dataset information
+        """
+        manifest_path = dataset_dir / "_manifest.json"
+        total_size = sum(f.stat().st_size for f in dataset_dir.rglob("*") if f.is_file())
+        info = {
+            'format': 'partitioned',
+            'size_bytes': total_size,
+            'size_human': self._format_file_size(total_size)
+        }
+
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as manifest_file:
+                manifest = json.load(manifest_file)
+            info['rows'] = manifest.get('total_rows', 'unknown')
+            info['partitions'] = len(manifest.get('partitions', []))
+        except Exception:
+            info['partitions'] = 'unknown'
+
+        return info
+
     def _get_json_info(self, file_path: Path) -> Dict[str, Any]:
         """Get JSON-specific information.
 
@@ -506,7 +1042,7 @@ class ExportService:
 
         exports = []
         for file_path in self.export_dir.iterdir():
-            if file_path.is_file() and file_path.suffix.lower() in ['.csv', '.json']:
+            if file_path.is_file() and file_path.suffix.lower() in ['.csv', '.json', '.db']:
                 summary = self.get_export_summary(str(file_path))
                 exports.append(summary)
 
@@ -2,13 +2,13 @@
 
 import time
 from datetime import datetime
-from pathlib import Path
 from typing import Optional, Dict, Any
 from rich.live import Live
 from rich.console import Console
 
 from ..models.session import SessionData, InteractionFile
-from ..utils.file_utils import FileProcessor
+from ..utils.archive_storage import is_archive
+from ..utils.file_utils import FileProcessor, StoragePath, storage_roots
 from ..ui.dashboard import DashboardUI
 from ..config import ModelPricing
 
@@ -27,18 +27,19 @@ class LiveMonitor:
         self.console = console or Console()
         self.dashboard_ui = DashboardUI(console)
 
-    def start_monitoring(self, base_path: str, refresh_interval: int = 5):
+    def start_monitoring(self, base_path: StoragePath, refresh_interval: int = 5):
         """Start live monitoring of the most recent session.
 
         Args:
-            base_path: Path to directory containing sessions
+            base_path: Path to directory containing sessions, or a list of storage roots
             refresh_interval: Update interval in seconds
         """
         try:
             # Find the most recent session
             recent_session = FileProcessor.get_most_recent_session(base_path)
             if not recent_session:
-                self.console.print(f"[red]No sessions found in {base_path}[/red]")
+                roots = ', '.join(str(root) for root in storage_roots(base_path))
+                self.console.print(f"[red]No sessions found in {roots}[/red]")
                 return
 
             self.console.print(f"[green]Starting live monitoring of session: {recent_session.session_id}[/green]")
@@ -126,11 +127,11 @@ class LiveMonitor:
 
         return 0.0
 
-    def get_session_status(self, base_path: str) -> Dict[str, Any]:
+    def get_session_status(self, base_path: StoragePath) -> Dict[str, Any]:
         """Get current status of the most recent session.
 
         Args:
-            base_path: Path to directory containing sessions
+            base_path: Path to directory containing sessions, or a list of storage roots
 
         Returns:
             Dictionary with session status information
@@ -180,11 +181,11 @@ class LiveMonitor:
             } if recent_file else None
         }
 
-    def monitor_single_update(self, base_path: str) -> Optional[Dict[str, Any]]:
+    def monitor_single_update(self, base_path: StoragePath) -> Optional[Dict[str, Any]]:
         """Get a single update of the monitoring data.
 
         Args:
-            base_path: Path to directory containing sessions
+            base_path: Path to directory containing sessions, or a list of storage roots
 
         Returns:
             Monitoring data or None if no session found
@@ -251,11 +252,11 @@ class LiveMonitor:
             'usage_percentage': min(100.0, usage_percentage)
         }
 
-    def validate_monitoring_setup(self, base_path: str) -> Dict[str, Any]:
+    def validate_monitoring_setup(self, base_path: StoragePath) -> Dict[str, Any]:
         """Validate that monitoring can be set up properly.
 
         Args:
-            base_path: Path to directory containing sessions
+            base_path: Path to directory containing sessions, or a list of storage roots
 
         Returns:
             Validation results
@@ -263,18 +264,15 @@ class LiveMonitor:
         issues = []
         warnings = []
 
-        # Check if base path exists
-        base_path_obj = Path(base_path)
-        if not base_path_obj.exists():
-            issues.append(f"Base path does not exist: {base_path}")
-            return {
-                'valid': False,
-                'issues': issues,
-                'warnings': warnings
-            }
-
-        if not base_path_obj.is_dir():
-            issues.append(f"Base path is not a directory: {base_path}")
+        # Check if every storage root exists
+        for base_path_obj in storage_roots(base_path):
+            if not base_path_obj.exists():
+                issues.append(f"Base path does not exist: {base_path_obj}")
+            elif is_archive(base_path_obj):
+                issues.append(f"Live monitoring needs a live directory, not a snapshot archive: {base_path_obj}")
+            elif not base_path_obj.is_dir():
+                issues.append(f"Base path is not a directory: {base_path_obj}")
+        if issues:
             return {
                 'valid': False,
                 'issues': issues,
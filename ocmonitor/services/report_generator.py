@@ -1,15 +1,25 @@
 """Report generation service for OpenCode Monitor."""
 
 from typing import List, Dict, Any, Optional
-from datetime import date
+from datetime import date, datetime
 from rich.console import Console
 from rich.panel import Panel
 
 from ..models.session import SessionData
-from ..models.analytics import DailyUsage, WeeklyUsage, MonthlyUsage, ModelBreakdownReport, ProjectBreakdownReport
+from ..models.cube import PivotRow
+from ..models.team_rollup import TeamRollup
+from ..models.analytics import (
+    DailyUsage, WeeklyUsage, MonthlyUsage, ModelBreakdownReport, ProjectBreakdownReport, TimeframeAnalyzer
+)
 from ..ui.tables import TableFormatter
 from ..services.session_analyzer import SessionAnalyzer
 from ..config import ModelPricing
+from ..utils.file_utils import StoragePath
+from ..utils.instrumentation import instrumented, span
+
+
+# Reports ReportGenerator.generate_merged_report can build from a team rollup
+MERGED_REPORT_TYPES = ("daily", "weekly", "monthly", "models", "projects")
 
 
 class ReportGenerator:
@@ -26,17 +36,21 @@ class ReportGenerator:
         self.table_formatter = TableFormatter(console)
         self.console = console or Console()
 
-    def generate_single_session_report(self, session_path: str, output_format: str = "table") -> Optional[Dict[str, Any]]:
+    def generate_single_session_report(self, session_path: str, output_format: str = "table",
+                                       since: Optional[datetime] = None,
+                                       until: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
         """Generate report for a single session.
 
         Args:
             session_path: Path to session directory
             output_format: Output format ("table", "json", "csv")
+            since: Only include interactions created at or after this time
+            until: Only include interactions created before this time
 
         Returns:
             Report data or None if session not found
         """
-        session = self.analyzer.analyze_single_session(session_path)
+        session = self.analyzer.analyze_single_session(session_path, since, until)
         if not session:
             return None
 
@@ -60,19 +74,30 @@ class ReportGenerator:
 
         return report_data
 
-    def generate_sessions_summary_report(self, base_path: str, limit: Optional[int] = None,
-                                       output_format: str = "table") -> Dict[str, Any]:
+    def generate_sessions_summary_report(self, base_path: StoragePath, limit: Optional[int] = None,
+                                       output_format: str = "table",
+                                       since: Optional[datetime] = None,
+                                       until: Optional[datetime] = None,
+                                       sort_by: str = "recent",
+                                       sessions: Optional[List[Any]] = None) -> Dict[str, Any]:
         """Generate summary report for all sessions.
 
         Args:
-            base_path: Path to directory containing sessions
+            base_path: Path to directory containing sessions, or a list of storage roots
             limit: Maximum number of sessions to analyze
             output_format: Output format ("table", "json", "csv")
+            since: Only include interactions created at or after this time
+            until: Only include interactions created before this time
+            sort_by: Which sessions ``limit`` keeps ("recent", "cost", "tokens")
+            sessions: Already loaded sessions; skips loading from ``base_path``
 
         Returns:
             Report data
         """
-        sessions = self.analyzer.analyze_all_sessions(base_path, limit)
+        if sessions is None:
+            sessions = self.analyzer.analyze_all_sessions(
+                base_path, limit, since=since, until=until, sort_by=sort_by, summaries=True
+            )
         summary = self.analyzer.get_sessions_summary(sessions)
 
         report_data = {
@@ -90,30 +115,32 @@ class ReportGenerator:
 
         return report_data
 
-    def generate_daily_report(self, base_path: str, month: Optional[str] = None,
-                            output_format: str = "table") -> Dict[str, Any]:
+    def generate_daily_report(self, base_path: StoragePath, month: Optional[str] = None,
+                            output_format: str = "table",
+                            since: Optional[datetime] = None,
+                            until: Optional[datetime] = None) -> Dict[str, Any]:
         """Generate daily breakdown report.
 
         Args:
-            base_path: Path to directory containing sessions
+            base_path: Path to directory containing sessions, or a list of storage roots
             month: Optional month filter (YYYY-MM format)
             output_format: Output format ("table", "json", "csv")
+            since: Only include interactions created at or after this time
+            until: Only include interactions created before this time
 
         Returns:
             Report data
         """
-        sessions = self.analyzer.analyze_all_sessions(base_path)
-
-        # Apply month filter if specified
+        # Apply month filter if specified; the range is pushed down into loading
+        start_date = end_date = None
         if month:
             from ..utils.time_utils import TimeUtils
             month_data = TimeUtils.parse_month_string(month)
             if month_data:
                 year, month_num = month_data
                 start_date, end_date = TimeUtils.get_month_range(year, month_num)
-                sessions = self.analyzer.filter_sessions_by_date(sessions, start_date, end_date)
 
-        daily_usage = self.analyzer.create_daily_breakdown(sessions)
+        daily_usage = self._bucket_usage(base_path, "daily", start_date, end_date, since, until)
 
         report_data = {
             'type': 'daily_breakdown',
@@ -130,27 +157,29 @@ class ReportGenerator:
 
         return report_data
 
-    def generate_weekly_report(self, base_path: str, year: Optional[int] = None,
-                             output_format: str = "table") -> Dict[str, Any]:
+    def generate_weekly_report(self, base_path: StoragePath, year: Optional[int] = None,
+                             output_format: str = "table",
+                             since: Optional[datetime] = None,
+                             until: Optional[datetime] = None) -> Dict[str, Any]:
         """Generate weekly breakdown report.
 
         Args:
-            base_path: Path to directory containing sessions
+            base_path: Path to directory containing sessions, or a list of storage roots
             year: Optional year filter
             output_format: Output format ("table", "json", "csv")
+            since: Only include interactions created at or after this time
+            until: Only include interactions created before this time
 
         Returns:
             Report data
         """
-        sessions = self.analyzer.analyze_all_sessions(base_path)
-
-        # Apply year filter if specified
+        # Apply year filter if specified; the range is pushed down into loading
+        start_date = end_date = None
         if year:
             from ..utils.time_utils import TimeUtils
             start_date, end_date = TimeUtils.get_year_range(year)
-            sessions = self.analyzer.filter_sessions_by_date(sessions, start_date, end_date)
 
-        weekly_usage = self.analyzer.create_weekly_breakdown(sessions)
+        weekly_usage = self._bucket_usage(base_path, "weekly", start_date, end_date, since, until)
 
         report_data = {
             'type': 'weekly_breakdown',
@@ -167,27 +196,29 @@ class ReportGenerator:
 
         return report_data
 
-    def generate_monthly_report(self, base_path: str, year: Optional[int] = None,
-                              output_format: str = "table") -> Dict[str, Any]:
+    def generate_monthly_report(self, base_path: StoragePath, year: Optional[int] = None,
+                              output_format: str = "table",
+                              since: Optional[datetime] = None,
+                              until: Optional[datetime] = None) -> Dict[str, Any]:
         """Generate monthly breakdown report.
 
         Args:
-            base_path: Path to directory containing sessions
+            base_path: Path to directory containing sessions, or a list of storage roots
             year: Optional year filter
             output_format: Output format ("table", "json", "csv")
+            since: Only include interactions created at or after this time
+            until: Only include interactions created before this time
 
         Returns:
             Report data
         """
-        sessions = self.analyzer.analyze_all_sessions(base_path)
-
-        # Apply year filter if specified
+        # Apply year filter if specified; the range is pushed down into loading
+        start_date = end_date = None
         if year:
             from ..utils.time_utils import TimeUtils
             start_date, end_date = TimeUtils.get_year_range(year)
-            sessions = self.analyzer.filter_sessions_by_date(sessions, start_date, end_date)
 
-        monthly_usage = self.analyzer.create_monthly_breakdown(sessions)
+        monthly_usage = self._bucket_usage(base_path, "monthly", start_date, end_date, since, until)
 
         report_data = {
             'type': 'monthly_breakdown',
@@ -204,28 +235,59 @@ class ReportGenerator:
 
         return report_data
 
-    def generate_models_report(self, base_path: str, timeframe: str = "all",
+    def _bucket_usage(self, base_path: StoragePath, period: str, start_date: Optional[date],
+                      end_date: Optional[date], since: Optional[datetime],
+                      until: Optional[datetime]) -> List[Any]:
+        """Get the daily, weekly or monthly breakdown for a report.
+
+        Interactions are bucketed by creation date; the date range selects
+        interactions, not sessions, so a session crossing a range boundary
+        contributes only the part inside it.
+
+        Args:
+            base_path: Path to directory containing sessions, or a list of storage roots
+            period: ``"daily"``, ``"weekly"`` or ``"monthly"``
+            start_date: Only include interactions created on or after this date
+            end_date: Only include interactions created on or before this date
+            since: Only include interactions created at or after this time
+            until: Only include interactions created before this time
+
+        Returns:
+            List of DailyUsage, WeeklyUsage or MonthlyUsage objects sorted by period
+        """
+        timeline = self.analyzer.load_usage_timeline(base_path, start_date, since, until)
+        return TimeframeAnalyzer.bucket_timeline(timeline, period, self.analyzer.timezone,
+                                                 start_date, end_date)
+
+    def generate_models_report(self, base_path: StoragePath, timeframe: str = "all",
                              start_date: Optional[str] = None, end_date: Optional[str] = None,
-                             output_format: str = "table") -> Dict[str, Any]:
+                             output_format: str = "table",
+                             since: Optional[datetime] = None,
+                             until: Optional[datetime] = None) -> Dict[str, Any]:
         """Generate model usage breakdown report.
 
         Args:
-            base_path: Path to directory containing sessions
+            base_path: Path to directory containing sessions, or a list of storage roots
             timeframe: Timeframe for analysis
             start_date: Start date (YYYY-MM-DD format)
             end_date: End date (YYYY-MM-DD format)
             output_format: Output format ("table", "json", "csv")
+            since: Only include interactions created at or after this time
+            until: Only include interactions created before this time
 
         Returns:
             Report data
         """
-        sessions = self.analyzer.analyze_all_sessions(base_path)
-
         # Parse date filters
         from ..utils.time_utils import TimeUtils
         parsed_start_date = TimeUtils.parse_date_string(start_date) if start_date else None
         parsed_end_date = TimeUtils.parse_date_string(end_date) if end_date else None
 
+        sessions = self.analyzer.analyze_all_sessions(
+            base_path, start_date=parsed_start_date, end_date=parsed_end_date, since=since, until=until,
+            summaries=True
+        )
+
         model_breakdown = self.analyzer.create_model_breakdown(
             sessions, timeframe, parsed_start_date, parsed_end_date
         )
@@ -249,28 +311,35 @@ class ReportGenerator:
 
         return report_data
 
-    def generate_projects_report(self, base_path: str, timeframe: str = "all",
+    def generate_projects_report(self, base_path: StoragePath, timeframe: str = "all",
                                start_date: Optional[str] = None, end_date: Optional[str] = None,
-                               output_format: str = "table") -> Dict[str, Any]:
+                               output_format: str = "table",
+                               since: Optional[datetime] = None,
+                               until: Optional[datetime] = None) -> Dict[str, Any]:
         """Generate project usage breakdown report.
 
         Args:
-            base_path: Path to directory containing sessions
+            base_path: Path to directory containing sessions, or a list of storage roots
             timeframe: Timeframe for analysis
             start_date: Start date (YYYY-MM-DD format)
             end_date: End date (YYYY-MM-DD format)
             output_format: Output format ("table", "json", "csv")
+            since: Only include interactions created at or after this time
+            until: Only include interactions created before this time
 
         Returns:
             Report data
         """
-        sessions = self.analyzer.analyze_all_sessions(base_path)
-
         # Parse date filters
         from ..utils.time_utils import TimeUtils
         parsed_start_date = TimeUtils.parse_date_string(start_date) if start_date else None
         parsed_end_date = TimeUtils.parse_date_string(end_date) if end_date else None
 
+        sessions = self.analyzer.analyze_all_sessions(
+            base_path, start_date=parsed_start_date, end_date=parsed_end_date, since=since, until=until,
+            summaries=True
+        )
+
         project_breakdown = self.analyzer.create_project_breakdown(
             sessions, timeframe, parsed_start_date, parsed_end_date
         )
@@ -294,7 +363,184 @@ class ReportGenerator:
 
         return report_data
 
+    def generate_pivot_report(self, base_path: StoragePath, by: List[str],
+                              start_date: Optional[str] = None, end_date: Optional[str] = None,
+                              where: Optional[Dict[str, List[str]]] = None,
+                              sort_by: str = "key", limit: Optional[int] = None,
+                              output_format: str = "table") -> Dict[str, Any]:
+        """Generate a pivot of the usage cube.
+
+        Args:
+            base_path: Path to directory containing sessions, or a list of storage roots
+            by: Dimensions to group by, from ``CUBE_DIMENSIONS``
+            start_date: Start date (YYYY-MM-DD format)
+            end_date: End date (YYYY-MM-DD format)
+            where: Only include these labels per dimension
+            sort_by: ``"key"``, ``"cost"`` or ``"tokens"``
+            limit: Maximum number of rows to show
+            output_format: Output format ("table", "json")
+
+        Returns:
+            Report data
+        """
+        from ..utils.time_utils import TimeUtils
+        parsed_start_date = TimeUtils.parse_date_string(start_date) if start_date else None
+        parsed_end_date = TimeUtils.parse_date_string(end_date) if end_date else None
+
+        cube = self.analyzer.load_usage_cube(base_path)
+        with span("aggregate.pivot"):
+            rows = cube.query(by, self.analyzer.pricing_data, parsed_start_date, parsed_end_date,
+                              where, sort_by)
+            totals = cube.query([], self.analyzer.pricing_data, parsed_start_date, parsed_end_date, where)
+        if limit:
+            rows = rows[:limit]
+        total = totals[0] if totals else PivotRow()
+
+        report_data = {
+            'type': 'pivot',
+            'rows': rows,
+            'total': total,
+            'filter': {
+                'by': by,
+                'start_date': start_date,
+                'end_date': end_date,
+                'where': where or {}
+            }
+        }
+
+        if output_format == "table":
+            self._display_pivot_table(rows, by, total)
+        elif output_format == "json":
+            return self._format_pivot_json(rows, by, total, report_data['filter'])
+
+        return report_data
+
+    def generate_merged_report(self, rollup: TeamRollup, report_type: str,
+                               start_date: Optional[str] = None, end_date: Optional[str] = None,
+                               output_format: str = "table") -> Dict[str, Any]:
+        """Generate a daily, weekly, monthly, models or projects report from a team rollup.
+
+        Args:
+            rollup: Merged team rollup
+            report_type: One of ``MERGED_REPORT_TYPES``
+            start_date: Start date (YYYY-MM-DD format)
+            end_date: End date (YYYY-MM-DD format)
+            output_format: Output format ("table", "json")
+
+        Returns:
+            Report data
+
+        Raises:
+            ValueError: If ``report_type`` is not one of ``MERGED_REPORT_TYPES``
+        """
+        if report_type not in MERGED_REPORT_TYPES:
+            raise ValueError(f"Invalid report type '{report_type}'. Choose from: {', '.join(MERGED_REPORT_TYPES)}")
+
+        from ..utils.time_utils import TimeUtils
+        parsed_start_date = TimeUtils.parse_date_string(start_date) if start_date else None
+        parsed_end_date = TimeUtils.parse_date_string(end_date) if end_date else None
+        pricing_data = self.analyzer.pricing_data
+
+        if report_type == "daily":
+            result = rollup.daily_breakdown(parsed_start_date, parsed_end_date)
+            report_data = {'type': 'daily_breakdown', 'daily_usage': result}
+            display, format_json = self._display_daily_breakdown_table, self._format_daily_breakdown_json
+        elif report_type == "weekly":
+            result = rollup.weekly_breakdown(parsed_start_date, parsed_end_date)
+            report_data = {'type': 'weekly_breakdown', 'weekly_usage': result}
+            display, format_json = self._display_weekly_breakdown_table, self._format_weekly_breakdown_json
+        elif report_type == "monthly":
+            result = rollup.monthly_breakdown(parsed_start_date, parsed_end_date)
+            report_data = {'type': 'monthly_breakdown', 'monthly_usage': result}
+            display, format_json = self._display_monthly_breakdown_table, self._format_monthly_breakdown_json
+        elif report_type == "models":
+            result = rollup.model_breakdown(pricing_data, parsed_start_date, parsed_end_date)
+            report_data = {'type': 'models_breakdown', 'model_breakdown': result}
+            display, format_json = self._display_models_breakdown_table, self._format_models_breakdown_json
+        else:
+            result = rollup.project_breakdown(pricing_data, parsed_start_date, parsed_end_date)
+            report_data = {'type': 'projects_breakdown', 'project_breakdown': result}
+            display, format_json = self._display_projects_breakdown_table, self._format_projects_breakdown_json
+        report_data['sources'] = rollup.sources
+
+        if output_format == "table":
+            display(result)
+        elif output_format == "json":
+            return {'sources': rollup.sources, 'timezones': rollup.timezones, **format_json(result)}
+
+        return report_data
+
+    def generate_report_bundle(self, base_path: StoragePath, report_types: List[str],
+                               since: Optional[datetime] = None,
+                               until: Optional[datetime] = None) -> Dict[str, Dict[str, Any]]:
+        """Generate raw report data for several report types from one scan.
+
+        Sessions are loaded once and every requested report is computed
+        from that single in-memory dataset. Days, weeks and months are
+        bucketed from one timeline, taken from the same source as the
+        standalone reports so both give identical breakdowns.
+
+        Args:
+            base_path: Path to directory containing sessions, or a list of storage roots
+            report_types: Report types to build ("session", "sessions",
+                "daily", "weekly", "monthly", "models", "projects")
+            since: Only include interactions created at or after this time
+            until: Only include interactions created before this time
+
+        Returns:
+            Dictionary mapping report type to report data
+        """
+        sessions = self.analyzer.analyze_all_sessions(base_path, since=since, until=until)
+        bundle = {}
+
+        daily_usage = weekly_usage = monthly_usage = None
+        if {'daily', 'weekly', 'monthly'} & set(report_types):
+            # One timeline serves all three timeframes
+            timeline = self.analyzer.load_usage_timeline(base_path, None, since, until, sessions)
+            daily_usage, weekly_usage, monthly_usage = (
+                TimeframeAnalyzer.bucket_timeline(timeline, period, self.analyzer.timezone)
+                for period in ('daily', 'weekly', 'monthly')
+            )
+
+        for report_type in report_types:
+            if report_type == 'session':
+                # Interaction-level detail for every session
+                bundle[report_type] = {'type': 'interactions', 'sessions': sessions}
+            elif report_type == 'sessions':
+                bundle[report_type] = {
+                    'type': 'sessions_summary',
+                    'sessions': sessions,
+                    'summary': self.analyzer.get_sessions_summary(sessions)
+                }
+            elif report_type == 'daily':
+                bundle[report_type] = {'type': 'daily_breakdown', 'daily_usage': daily_usage, 'filter': None}
+            elif report_type == 'weekly':
+                bundle[report_type] = {'type': 'weekly_breakdown', 'weekly_usage': weekly_usage, 'filter': None}
+            elif report_type == 'monthly':
+                bundle[report_type] = {
+                    'type': 'monthly_breakdown',
+                    'monthly_usage': monthly_usage,
+                    'filter': None
+                }
+            elif report_type == 'models':
+                bundle[report_type] = {
+                    'type': 'models_breakdown',
+                    'model_breakdown': self.analyzer.create_model_breakdown(sessions),
+                    'filter': {'timeframe': 'all', 'start_date': None, 'end_date': None}
+                }
+            elif report_type == 'projects':
+                bundle[report_type] = {
+                    'type': 'projects_breakdown',
+                    'project_breakdown': self.analyzer.create_project_breakdown(sessions),
+                    'filter': {'timeframe': 'all', 'start_date': None, 'end_date': None}
+                }
+            else:
+                raise ValueError(f"Unsupported report type for bundle: {report_type}")
+
+        return bundle
+
     # Table display methods
+    @instrumented("render.session")
     def _display_single_session_table(self, session: SessionData, stats: Dict[str, Any], health: Dict[str, Any]):
         """Display single session report as table."""
         # Create session details table
@@ -311,6 +557,7 @@ class ReportGenerator:
             warning_panel = Panel(warning_text, title="Warnings", border_style="yellow")
             self.console.print(warning_panel)
 
+    @instrumented("render.sessions")
     def _display_sessions_summary_table(self, sessions: List[SessionData], summary: Dict[str, Any]):
         """Display sessions summary as table."""
         table = self.table_formatter.create_sessions_table(sessions, self.analyzer.pricing_data)
@@ -319,11 +566,13 @@ class ReportGenerator:
         summary_panel = self.table_formatter.create_summary_panel(sessions, self.analyzer.pricing_data)
         self.console.print(summary_panel)
 
+    @instrumented("render.daily")
     def _display_daily_breakdown_table(self, daily_usage: List[DailyUsage]):
         """Display daily breakdown as table."""
         table = self.table_formatter.create_daily_table(daily_usage, self.analyzer.pricing_data)
         self.console.print(table)
 
+    @instrumented("render.weekly")
     def _display_weekly_breakdown_table(self, weekly_usage: List[WeeklyUsage]):
         """Display weekly breakdown as table."""
         # Create a table similar to daily but for weeks
@@ -348,6 +597,7 @@ class ReportGenerator:
 
         self.console.print(table)
 
+    @instrumented("render.monthly")
     def _display_monthly_breakdown_table(self, monthly_usage: List[MonthlyUsage]):
         """Display monthly breakdown as table."""
         from rich.table import Table
@@ -371,11 +621,13 @@ class ReportGenerator:
 
         self.console.print(table)
 
+    @instrumented("render.models")
     def _display_models_breakdown_table(self, model_breakdown: ModelBreakdownReport):
         """Display models breakdown as table."""
         table = self.table_formatter.create_model_breakdown_table(model_breakdown.model_stats)
         self.console.print(table)
 
+    @instrumented("render.projects")
     def _display_projects_breakdown_table(self, project_breakdown: ProjectBreakdownReport):
         """Display projects breakdown as table."""
         from rich.table import Table
@@ -417,6 +669,41 @@ class ReportGenerator:
         summary_panel = Panel(summary_text, title="Summary", border_style="green")
         self.console.print(summary_panel)
 
+    @instrumented("render.pivot")
+    def _display_pivot_table(self, rows: List[PivotRow], by: List[str], total: PivotRow):
+        """Display a usage cube pivot as table."""
+        from rich.table import Table
+        table = Table(title=f"Usage by {' / '.join(by)}" if by else "Usage", show_header=True)
+
+        for dimension in by:
+            table.add_column(dimension.capitalize(), style="cyan")
+        table.add_column("Sessions", justify="right", style="green")
+        table.add_column("Interactions", justify="right", style="green")
+        table.add_column("Total Tokens", justify="right", style="bold blue")
+        table.add_column("Cost", justify="right", style="red")
+        table.add_column("Processing", justify="right", style="dim")
+
+        for row in rows:
+            table.add_row(
+                *[row.keys[dimension] for dimension in by],
+                f"{row.total_sessions}",
+                f"{row.total_interactions}",
+                f"{row.total_tokens.total:,}",
+                f"${row.total_cost:.4f}",
+                self.table_formatter._format_duration(row.processing_ms)
+            )
+
+        self.console.print(table)
+
+        summary_text = (
+            f"Total: {len(rows)} rows, "
+            f"{total.total_sessions} sessions, "
+            f"{total.total_interactions} interactions, "
+            f"{total.total_tokens.total:,} tokens, "
+            f"${total.total_cost:.2f}"
+        )
+        self.console.print(Panel(summary_text, title="Summary", border_style="green"))
+
     # JSON formatting methods
     def _format_single_session_json(self, session: SessionData, stats: Dict[str, Any], health: Dict[str, Any]) -> Dict[str, Any]:
         """Format single session data as JSON."""
@@ -458,6 +745,7 @@ class ReportGenerator:
                     'session_id': session.session_id,
                     'session_title': session.session_title,
                     'project_name': session.project_name,
+                    'storage_root': str(session.storage_root),
                     'interaction_count': session.interaction_count,
                     'total_tokens': session.total_tokens.model_dump(),
                     'total_cost': float(session.calculate_total_cost(self.analyzer.pricing_data)),
@@ -475,7 +763,7 @@ class ReportGenerator:
             'daily_breakdown': [
                 {
                     'date': day.date.isoformat(),
-                    'sessions': len(day.sessions),
+                    'sessions': day.total_sessions,
                     'interactions': day.total_interactions,
                     'tokens': day.total_tokens.model_dump(),
                     'cost': float(day.calculate_total_cost(self.analyzer.pricing_data)),
@@ -541,6 +829,28 @@ class ReportGenerator:
             ]
         }
 
+    def _format_pivot_json(self, rows: List[PivotRow], by: List[str], total: PivotRow,
+                           filters: Dict[str, Any]) -> Dict[str, Any]:
+        """Format a usage cube pivot as JSON."""
+        return {
+            'filter': filters,
+            'total_sessions': total.total_sessions,
+            'total_interactions': total.total_interactions,
+            'total_tokens': total.total_tokens.model_dump(),
+            'total_cost': float(total.total_cost),
+            'rows': [
+                {
+                    **row.keys,
+                    'sessions': row.total_sessions,
+                    'interactions': row.total_interactions,
+                    'tokens': row.total_tokens.model_dump(),
+                    'cost': float(row.total_cost),
+                    'processing_ms': row.processing_ms
+                }
+                for row in rows
+            ]
+        }
+
     # CSV formatting methods (returning data structures for export service)
     def _format_single_session_csv(self, session: SessionData, stats: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Format single session data for CSV export."""
@@ -590,7 +900,7 @@ class ReportGenerator:
         return [
             {
                 'date': day.date.isoformat(),
-                'sessions': len(day.sessions),
+                'sessions': day.total_sessions,
                 'interactions': day.total_interactions,
                 'input_tokens': day.total_tokens.input,
                 'output_tokens': day.total_tokens.output,
@@ -1,56 +1,164 @@
 """Session analysis service for OpenCode Monitor."""
 
+import heapq
 import time
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-from datetime import datetime, date
+from typing import List, Dict, Any, Optional, Union
+from datetime import datetime, date, tzinfo
 from decimal import Decimal
 
 from ..models.session import SessionData, InteractionFile, TokenUsage
+from ..models.records import SessionRecord, SessionSummary, TokenCounts
+from ..models.cube import UsageCube
+from ..models.team_rollup import TeamRollup
+from ..models.timeline import SessionIndex, UsageTimeline
 from ..models.analytics import (
     DailyUsage, WeeklyUsage, MonthlyUsage, ModelUsageStats,
     ModelBreakdownReport, ProjectBreakdownReport, TimeframeAnalyzer
 )
-from ..utils.file_utils import FileProcessor
+from ..utils.file_utils import FileProcessor, MTIME_PRUNE_SLACK_SECONDS, StoragePath
 from ..utils.time_utils import TimeUtils
+from ..utils.instrumentation import instrumented, span
 from ..config import ModelPricing
 
+# Orders accepted by analyze_all_sessions(sort_by=...)
+SESSION_SORT_KEYS = ("recent", "cost", "tokens")
+
 
 class SessionAnalyzer:
     """Service for analyzing OpenCode sessions."""
 
-    def __init__(self, pricing_data: Dict[str, ModelPricing]):
+    def __init__(self, pricing_data: Dict[str, ModelPricing], summary_cache=None, rollup_store=None,
+                 timezone: Optional[tzinfo] = None, interaction_cache=None):
         """Initialize session analyzer.
 
         Args:
             pricing_data: Model pricing information
+            summary_cache: Optional ``SessionSummaryCache`` used when only
+                session summaries are requested
+            rollup_store: Optional ``DailyRollupStore`` serving usage timelines
+            timezone: Timezone days, weeks and months are taken in; None for
+                local time
+            interaction_cache: Optional ``InteractionCache`` serving
+                ``since``/``until`` windows
         """
         self.pricing_data = pricing_data
+        self.summary_cache = summary_cache
+        self.rollup_store = rollup_store
+        self.timezone = timezone
+        self.interaction_cache = interaction_cache
 
-    def analyze_single_session(self, session_path: str) -> Optional[SessionData]:
+    def analyze_single_session(self, session_path: str, since: Optional[datetime] = None,
+                               until: Optional[datetime] = None) -> Optional[SessionData]:
         """Analyze a single session directory.
 
         Args:
             session_path: Path to session directory
+            since: Only include interactions created at or after this time
+            until: Only include interactions created before this time
 
         Returns:
             SessionData object or None if analysis failed
         """
         path = Path(session_path)
-        return FileProcessor.load_session_data(path)
+        return FileProcessor.load_session_data(path, since, until)
 
-    def analyze_all_sessions(self, base_path: str, limit: Optional[int] = None) -> List[SessionData]:
+    def analyze_all_sessions(self, base_path: StoragePath, limit: Optional[int] = None,
+                             start_date: Optional[date] = None,
+                             end_date: Optional[date] = None,
+                             since: Optional[datetime] = None,
+                             until: Optional[datetime] = None,
+                             sort_by: str = "recent",
+                             summaries: bool = False) -> List[Union[SessionRecord, SessionSummary]]:
         """Analyze all sessions in a directory.
 
+        Sessions are loaded as lightweight records; call ``to_model()`` on a
+        record where a validated ``SessionData`` is needed.
+
+        With a start date, session directories last modified before that day
+        are skipped without parsing: a message's creation time never exceeds
+        the time its file was added to the directory, so such a session must
+        have started before the range. The loaded sessions are then filtered
+        exactly as :meth:`filter_sessions_by_date` does, so sessions spanning
+        a range boundary are kept or dropped by their start time as before.
+        When summaries are read and a rollup store is configured, its sorted
+        index of session start times selects the sessions in the range by
+        binary search, and only those are loaded.
+
+        ``since``/``until`` select interactions rather than sessions: only
+        interactions created inside the window are loaded, session
+        directories and message files last modified before ``since`` are
+        skipped unparsed, and sessions without interactions in the window
+        are omitted.
+
+        Sessions are streamed newest first. With ``limit`` and the default
+        ``"recent"`` order, scanning stops as soon as ``limit`` sessions with
+        data have been found; for ``"cost"`` or ``"tokens"`` every session is
+        scanned but only the ``limit`` largest are kept, in a bounded heap.
+
+        With ``summaries`` the caller only needs session-level totals, so
+        sessions are returned as ``SessionSummary`` objects read through the
+        summary cache when one is configured. Interaction windows need the
+        individual interactions, so ``since``/``until`` summaries come from
+        the interaction cache when one is configured and are otherwise
+        built from records loaded for the window.
+
         Args:
-            base_path: Path to directory containing sessions
-            limit: Maximum number of sessions to analyze
+            base_path: Path to directory containing sessions, or a list of storage roots
+            limit: Maximum number of sessions to return
+            start_date: Only include sessions starting on or after this date
+            end_date: Only include sessions starting on or before this date
+            since: Only include interactions created at or after this time
+            until: Only include interactions created before this time
+            sort_by: ``"recent"`` (directory modification time), ``"cost"``
+                or ``"tokens"``, descending
 
         Returns:
-            List of SessionData objects
+            List of SessionRecord objects
+
+        Raises:
+            ValueError: If ``sort_by`` is not one of ``SESSION_SORT_KEYS``
         """
-        return FileProcessor.load_all_sessions(base_path, limit)
+        if sort_by not in SESSION_SORT_KEYS:
+            raise ValueError(f"Invalid sort order '{sort_by}'. Choose from: {', '.join(SESSION_SORT_KEYS)}")
+
+        start_ms, end_ms = TimeUtils.date_range_ms(start_date, end_date, self.timezone)
+        modified_since = None
+        if start_ms is not None:
+            modified_since = start_ms / 1000 - MTIME_PRUNE_SLACK_SECONDS
+
+        sessions = None
+        if summaries and self.summary_cache is not None and since is None and until is None:
+            session_dirs = None
+            if self.rollup_store is not None and (start_date or end_date):
+                session_dirs = self.rollup_store.sessions_between(base_path, start_ms, end_ms)
+            sessions = self.summary_cache.iter_summaries(base_path, modified_since, session_dirs)
+        elif summaries and self.interaction_cache is not None and (since is not None or until is not None):
+            sessions = self.interaction_cache.iter_summaries(base_path, since, until)
+        if sessions is None:
+            sessions = FileProcessor.iter_session_records(base_path, modified_since, since, until)
+        if start_date or end_date:
+            sessions = (
+                session for session in sessions
+                if session.start_ms is not None
+                and (start_ms is None or session.start_ms >= start_ms)
+                and (end_ms is None or session.start_ms < end_ms)
+            )
+
+        with span("load.all_sessions"):
+            if sort_by == "recent":
+                return list(islice(sessions, limit or None))
+
+            if sort_by == "cost":
+                key = lambda session: session.calculate_total_cost(self.pricing_data)
+            else:
+                key = lambda session: session.total_tokens.total
+            if limit:
+                return heapq.nlargest(limit, sessions, key=key)
+            return sorted(sessions, key=key, reverse=True)
 
+    @instrumented("aggregate.summary")
     def get_sessions_summary(self, sessions: List[SessionData]) -> Dict[str, Any]:
         """Generate summary statistics for multiple sessions.
 
@@ -70,7 +178,7 @@ class SessionAnalyzer:
                 'date_range': 'No sessions'
             }
 
-        total_tokens = TokenUsage()
+        total_tokens = TokenCounts()
         total_cost = Decimal('0.0')
         total_interactions = 0
         models_used = set()
@@ -78,11 +186,7 @@ class SessionAnalyzer:
         end_times = []
 
         for session in sessions:
-            session_tokens = session.total_tokens
-            total_tokens.input += session_tokens.input
-            total_tokens.output += session_tokens.output
-            total_tokens.cache_write += session_tokens.cache_write
-            total_tokens.cache_read += session_tokens.cache_read
+            total_tokens.add(session.total_tokens)
 
             total_cost += session.calculate_total_cost(self.pricing_data)
             total_interactions += session.interaction_count
@@ -106,7 +210,7 @@ class SessionAnalyzer:
         return {
             'total_sessions': len(sessions),
             'total_interactions': total_interactions,
-            'total_tokens': total_tokens,
+            'total_tokens': total_tokens.to_model(),
             'total_cost': total_cost,
             'models_used': sorted(list(models_used)),
             'date_range': date_range,
@@ -115,7 +219,7 @@ class SessionAnalyzer:
         }
 
     def create_daily_breakdown(self, sessions: List[SessionData]) -> List[DailyUsage]:
-        """Create daily usage breakdown.
+        """Create daily usage breakdown by interaction creation date.
 
         Args:
             sessions: List of sessions to analyze
@@ -123,10 +227,10 @@ class SessionAnalyzer:
         Returns:
             List of DailyUsage objects
         """
-        return TimeframeAnalyzer.create_daily_breakdown(sessions)
+        return TimeframeAnalyzer.create_daily_breakdown(sessions, self.timezone)
 
     def create_weekly_breakdown(self, sessions: List[SessionData]) -> List[WeeklyUsage]:
-        """Create weekly usage breakdown.
+        """Create weekly usage breakdown by interaction creation date.
 
         Args:
             sessions: List of sessions to analyze
@@ -134,11 +238,10 @@ class SessionAnalyzer:
         Returns:
             List of WeeklyUsage objects
         """
-        daily_usage = self.create_daily_breakdown(sessions)
-        return TimeframeAnalyzer.create_weekly_breakdown(daily_usage)
+        return TimeframeAnalyzer.create_weekly_breakdown(sessions, self.timezone)
 
     def create_monthly_breakdown(self, sessions: List[SessionData]) -> List[MonthlyUsage]:
-        """Create monthly usage breakdown.
+        """Create monthly usage breakdown by interaction creation date.
 
         Args:
             sessions: List of sessions to analyze
@@ -146,9 +249,87 @@ class SessionAnalyzer:
         Returns:
             List of MonthlyUsage objects
         """
-        daily_usage = self.create_daily_breakdown(sessions)
-        weekly_usage = TimeframeAnalyzer.create_weekly_breakdown(daily_usage)
-        return TimeframeAnalyzer.create_monthly_breakdown(weekly_usage)
+        return TimeframeAnalyzer.create_monthly_breakdown(sessions, self.timezone)
+
+    def load_usage_timeline(self, base_path: StoragePath, start_date: Optional[date] = None,
+                            since: Optional[datetime] = None,
+                            until: Optional[datetime] = None,
+                            sessions: Optional[List[SessionRecord]] = None) -> UsageTimeline:
+        """Load the usage timeline for time-based breakdowns.
+
+        Served from the rollup store when one is configured, otherwise built
+        from session summaries or, for ``since``/``until`` windows, from the
+        interaction cache or the interactions inside the window. Sessions
+        are not filtered by start date: a session that started before
+        ``start_date`` still contributes its later interactions, and only
+        directories last modified before ``start_date`` are skipped.
+
+        Args:
+            base_path: Path to directory containing sessions, or a list of storage roots
+            start_date: Earliest date the caller will bucket
+            since: Only include interactions created at or after this time
+            until: Only include interactions created before this time
+            sessions: Records the caller already loaded for the same window,
+                used instead of reading them again when the timeline would be
+                built from records
+
+        Returns:
+            UsageTimeline for :meth:`TimeframeAnalyzer.bucket_timeline`
+        """
+        if self.rollup_store is not None and since is None and until is None:
+            return self.rollup_store.timeline(base_path)
+        if self.interaction_cache is not None and (since is not None or until is not None):
+            timeline = self.interaction_cache.timeline(base_path, since, until)
+            if timeline is not None:
+                return timeline
+
+        modified_since = None
+        if start_date:
+            modified_since = (TimeUtils.date_start_timestamp(start_date, self.timezone)
+                              - MTIME_PRUNE_SLACK_SECONDS)
+
+        if self.summary_cache is not None and since is None and until is None:
+            sessions = self.summary_cache.iter_summaries(base_path, modified_since)
+        elif sessions is None:
+            sessions = FileProcessor.iter_session_records(base_path, modified_since, since, until)
+        with span("load.all_sessions"):
+            return UsageTimeline.from_sessions(sessions)
+
+    def load_usage_cube(self, base_path: StoragePath) -> UsageCube:
+        """Load the usage cube for pivot reports.
+
+        Served from the rollup store when one is configured, which keeps the
+        cube on disk between runs; otherwise built from session summaries.
+
+        Args:
+            base_path: Path to directory containing sessions, or a list of storage roots
+
+        Returns:
+            UsageCube with every session's usage, days in the analyzer's timezone
+        """
+        if self.rollup_store is not None:
+            return self.rollup_store.cube(base_path, self.timezone)
+
+        if self.summary_cache is not None:
+            sessions = self.summary_cache.iter_summaries(base_path)
+        else:
+            sessions = (SessionSummary.from_record(record)
+                        for record in FileProcessor.iter_session_records(base_path))
+        with span("load.all_sessions"):
+            return UsageCube.from_sessions(sessions, self.timezone)
+
+    def build_team_rollup(self, base_path: StoragePath, source: str) -> TeamRollup:
+        """Condense this machine's usage into a mergeable team rollup.
+
+        Args:
+            base_path: Path to directory containing sessions, or a list of storage roots
+            source: Name recorded for this machine
+
+        Returns:
+            TeamRollup with days in the analyzer's timezone
+        """
+        timezone = str(self.timezone) if self.timezone is not None else f"local ({time.tzname[0]})"
+        return TeamRollup.from_cube(self.load_usage_cube(base_path), source, timezone)
 
     def create_model_breakdown(self, sessions: List[SessionData],
                              timeframe: str = "all",
@@ -166,7 +347,7 @@ class SessionAnalyzer:
             ModelBreakdownReport object
         """
         return TimeframeAnalyzer.create_model_breakdown(
-            sessions, self.pricing_data, timeframe, start_date, end_date
+            sessions, self.pricing_data, timeframe, start_date, end_date, self.timezone
         )
 
     def create_project_breakdown(self, sessions: List[SessionData],
@@ -185,33 +366,32 @@ class SessionAnalyzer:
             ProjectBreakdownReport object
         """
         return TimeframeAnalyzer.create_project_breakdown(
-            sessions, self.pricing_data, timeframe, start_date, end_date
+            sessions, self.pricing_data, timeframe, start_date, end_date, self.timezone
         )
 
-    def filter_sessions_by_date(self, sessions: List[SessionData],
+    def filter_sessions_by_date(self, sessions: Union[List[SessionData], SessionIndex],
                                start_date: Optional[date] = None,
                                end_date: Optional[date] = None) -> List[SessionData]:
-        """Filter sessions by date range.
+        """Filter sessions by start date.
+
+        Selection is a binary search on a ``SessionIndex``; pass one built
+        with ``SessionIndex(sessions)`` to filter the same sessions by
+        several ranges without sorting them again.
 
         Args:
-            sessions: List of sessions to filter
+            sessions: List of sessions or SessionIndex to filter
             start_date: Start date (inclusive)
             end_date: End date (inclusive)
 
         Returns:
-            Filtered list of sessions
+            Filtered list of sessions, in their original order
         """
         if not start_date and not end_date:
-            return sessions
-
-        filtered = []
-        for session in sessions:
-            if session.start_time:
-                session_date = session.start_time.date()
-                if TimeUtils.date_in_range(session_date, start_date, end_date):
-                    filtered.append(session)
+            return list(sessions) if isinstance(sessions, SessionIndex) else sessions
 
-        return filtered
+        if not isinstance(sessions, SessionIndex):
+            sessions = SessionIndex(sessions)
+        return sessions.select(*TimeUtils.date_range_ms(start_date, end_date, self.timezone))
 
     def filter_sessions_by_model(self, sessions: List[SessionData], models: List[str]) -> List[SessionData]:
         """Filter sessions by models used.
@@ -233,11 +413,11 @@ class SessionAnalyzer:
 
         return filtered
 
-    def get_most_recent_session(self, base_path: str) -> Optional[SessionData]:
+    def get_most_recent_session(self, base_path: StoragePath) -> Optional[SessionData]:
         """Get the most recently modified session.
 
         Args:
-            base_path: Path to search for sessions
+            base_path: Path to search for sessions, or a list of storage roots
 
         Returns:
             Most recent SessionData or None
@@ -321,7 +501,7 @@ class SessionAnalyzer:
         # Calculate total tokens in recent files
         total_tokens = 0
         for json_file, _ in recent_files:
-            interaction = FileProcessor.parse_interaction_file(json_file, path.name)
+            interaction = FileProcessor.parse_interaction_record(json_file, path.name)
             if interaction:
                 total_tokens += interaction.tokens.total
 
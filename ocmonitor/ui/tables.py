@@ -12,6 +12,7 @@ from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn
 from ..models.session import SessionData, TokenUsage
 from ..models.analytics import DailyUsage, WeeklyUsage, MonthlyUsage, ModelUsageStats
 from ..utils.time_utils import TimeUtils
+from ..utils.instrumentation import instrumented
 
 
 class TableFormatter:
@@ -55,6 +56,7 @@ class TableFormatter:
         else:
             return "green"
 
+    @instrumented("table.sessions")
     def create_sessions_table(self, sessions: List[SessionData], pricing_data: Dict[str, Any]) -> Table:
         """Create a table for multiple sessions."""
         table = Table(
@@ -148,6 +150,7 @@ class TableFormatter:
 
         return table
 
+    @instrumented("table.session")
     def create_session_table(self, session: SessionData, pricing_data: Dict[str, Any]) -> Table:
         """Create a table for a single session."""
         table = Table(
@@ -213,6 +216,7 @@ class TableFormatter:
 
         return table
 
+    @instrumented("table.daily")
     def create_daily_table(self, daily_usage: List[DailyUsage], pricing_data: Dict[str, Any]) -> Table:
         """Create a table for daily usage breakdown."""
         table = Table(
@@ -241,7 +245,7 @@ class TableFormatter:
             day_cost = day.calculate_total_cost(pricing_data)
             day_tokens = day.total_tokens
 
-            total_sessions += len(day.sessions)
+            total_sessions += day.total_sessions
             total_interactions += day.total_interactions
             total_tokens.input += day_tokens.input
             total_tokens.output += day_tokens.output
@@ -257,7 +261,7 @@ class TableFormatter:
 
             table.add_row(
                 day.date.strftime('%Y-%m-%d'),
-                self.format_number(len(day.sessions)),
+                self.format_number(day.total_sessions),
                 self.format_number(day.total_interactions),
                 self.format_number(day_tokens.input),
                 self.format_number(day_tokens.output),
@@ -281,6 +285,7 @@ class TableFormatter:
 
         return table
 
+    @instrumented("table.models")
     def create_model_breakdown_table(self, model_stats: List[ModelUsageStats]) -> Table:
         """Create a table for model usage breakdown."""
         table = Table(
@@ -329,6 +334,7 @@ class TableFormatter:
         """Format duration in milliseconds to hours and minutes format."""
         return TimeUtils.format_duration_hm(milliseconds)
 
+    @instrumented("table.summary_panel")
     def create_summary_panel(self, sessions: List[SessionData], pricing_data: Dict[str, Any]) -> Panel:
         """Create a summary panel with key metrics."""
         if not sessions:
@@ -0,0 +1,658 @@
+"""Storage snapshots read from tar and zip archives for OpenCode Monitor.
+
+Backups of OpenCode storage are tarballs or zip files of hundreds of
+thousands of small message files, and extracting them costs far more than
+the reports that read them. An archive can instead be used as a storage root
+directly: :class:`ArchiveSnapshot` groups its message members by the
+``ses_*`` directory they belong to, together with the session titles found
+under ``session/``. A tarball is streamed in one sequential pass, so a
+``.tar.gz`` is decompressed once, and each message is parsed as it goes by
+into the few fields a record needs; a zip is indexed by its central
+directory and its members are read when asked for.
+
+Sessions inside an archive get virtual paths below the archive path
+(``backup.tar.gz/ses_abc/msg_1.json``). :class:`~.file_utils.FileProcessor`
+and the summary cache resolve such paths through :func:`archive_of`, so
+archived sessions load into the same ``SessionData`` and records as a
+directory scan. Only the most recently used snapshot stays open unless a
+caller asks for more, and it is read again once its archive changes on disk.
+
+``ocmonitor archive`` (see :mod:`.session_packs`) writes such zips itself:
+per-month packs of cold sessions under ``<messages dir>/ocmonitor-packs``.
+A pack starts with an index member holding the titles of its sessions and
+the exact modification times of its sessions and files, which zip
+timestamps round to two seconds. :func:`list_packed_sessions` lists a
+messages directory's packed sessions from those indexes, and packed sessions
+are fingerprinted and titled from them, without reading the packs themselves.
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .instrumentation import instrumented
+
+# File name endings of archives accepted as storage roots
+ARCHIVE_SUFFIXES = ('.tar', '.tar.gz', '.tgz', '.zip')
+
+# Snapshots kept open at once, unless a caller asks for more
+ARCHIVE_CACHE_SIZE = 1
+
+# Directory of session packs inside a messages directory, and the pack index member
+PACK_DIRECTORY = 'ocmonitor-packs'
+PACK_INDEX = 'ocmonitor-index.json'
+
+# Bump when the layout of pack indexes changes
+PACK_VERSION = 1
+
+# Parsed message file: (model ID, (input, output, cache write, cache read
+# tokens), (created, completed) timestamps or None, project path)
+InteractionFields = Tuple[str, Tuple[int, int, int, int], Optional[Tuple[Any, Any]], Optional[str]]
+
+# Where a zip member is stored: (name, header offset, compressed size, size,
+# compression method, CRC, flag bits), enough to read it without its ZipInfo
+ZipLocation = Tuple[str, int, int, int, int, int, int]
+
+# Open snapshots by archive path, least recently used first, for resolving
+# virtual paths, and the number of snapshots kept open
+_opened: 'OrderedDict[str, ArchiveSnapshot]' = OrderedDict()
+_retained = ARCHIVE_CACHE_SIZE
+_opened_lock = threading.Lock()
+
+
+def is_archive(path: Path) -> bool:
+    """Check whether a path is a storage snapshot archive.
+
+    The name is checked first, so paths of ordinary session directories and
+    message files cost no filesystem access.
+    """
+    return os.fspath(path).lower().endswith(ARCHIVE_SUFFIXES) and os.path.isfile(path)
+
+
+def archive_of(path: Path) -> Optional['ArchiveSnapshot']:
+    """Get the snapshot a virtual session directory points into.
+
+    Resolves to the open snapshot of the archive, so the files of a scanned
+    session are looked up without statting the archive each time.
+
+    Args:
+        path: Session directory, possibly below an archive
+
+    Returns:
+        ArchiveSnapshot when ``path`` is inside an archive, None for real
+        session directories
+    """
+    archive_path = os.fspath(path.parent)
+    if not archive_path.lower().endswith(ARCHIVE_SUFFIXES):
+        return None
+    with _opened_lock:
+        snapshot = _opened.get(archive_path)
+        if snapshot is not None:
+            _opened.move_to_end(archive_path)
+    if snapshot is None and os.path.isfile(archive_path):
+        snapshot = ArchiveSnapshot.open(path.parent)
+    return snapshot
+
+
+def file_mtime(file_path: Path) -> float:
+    """Get the modification time of a message file, inside an archive or not.
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    snapshot = archive_of(file_path.parent)
+    if snapshot is None:
+        return file_path.stat().st_mtime
+    member = snapshot.sessions.get(file_path.parent.name, {}).get(file_path.name)
+    if member is None:
+        raise FileNotFoundError(f"No such file in storage snapshot: {file_path}")
+    return member[0]
+
+
+def read_pack_index(pack_path: Path) -> Dict[str, List]:
+    """Read the index of a session pack written by ``ocmonitor archive``.
+
+    Args:
+        pack_path: Pack zip
+
+    Returns:
+        Dictionary of session directory name -> [directory mtime,
+        {message file name: mtime}]; empty for zips without a pack index
+
+    Raises:
+        ValueError: If the pack cannot be read
+    """
+    return _read_pack_index(*_pack_key(pack_path))[0]
+
+
+def packed_session_files(session_path: Path) -> Optional[Dict[str, float]]:
+    """Get the message files of a packed session from its pack index.
+
+    Lets a packed session be fingerprinted without opening its pack.
+
+    Args:
+        session_path: Session directory, possibly inside a pack
+
+    Returns:
+        Dictionary of message file name -> mtime, or None if ``session_path``
+        is not listed in the index of a pack
+    """
+    pack_path = session_path.parent
+    if pack_path.parent.name != PACK_DIRECTORY:
+        return None
+    try:
+        entry = read_pack_index(pack_path).get(session_path.name)
+    except ValueError:
+        return None
+    return entry[1] if entry is not None else None
+
+
+def read_archive_titles(archive_path: Path) -> Dict[str, str]:
+    """Get the session titles stored in an archive.
+
+    Packs written by ``ocmonitor archive`` carry their titles in the pack
+    index, and only the title members of other zips are read, so looking up
+    the title of a packed session does not open its pack as a snapshot.
+
+    Args:
+        archive_path: Archive path
+
+    Returns:
+        Dictionary of session ID -> title
+
+    Raises:
+        ValueError: If the archive cannot be read
+    """
+    if not os.fspath(archive_path).lower().endswith('.zip'):
+        return ArchiveSnapshot.open(archive_path).titles
+    key = _pack_key(archive_path)
+    if archive_path.parent.name == PACK_DIRECTORY:
+        titles = _read_pack_index(*key)[1]
+        if titles is not None:
+            return titles
+    return _read_zip_titles(*key)
+
+
+def list_packed_sessions(base_dir: Path, modified_since: Optional[float] = None) -> List[Tuple[float, str]]:
+    """List the packed sessions of a messages directory from the pack indexes.
+
+    Args:
+        base_dir: Messages directory holding a ``PACK_DIRECTORY``
+        modified_since: Skip sessions last modified before this POSIX timestamp
+
+    Returns:
+        List of (negated directory mtime, session path relative to ``base_dir``)
+    """
+    listing = []
+    try:
+        with os.scandir(base_dir / PACK_DIRECTORY) as entries:
+            packs = sorted(entry.name for entry in entries
+                           if entry.name.endswith('.zip') and entry.is_file())
+    except OSError:
+        return listing
+
+    for pack in packs:
+        for name, (mtime, _) in read_pack_index(base_dir / PACK_DIRECTORY / pack).items():
+            if modified_since is not None and mtime < modified_since:
+                continue
+            listing.append((-mtime, f"{PACK_DIRECTORY}/{pack}/{name}"))
+    return listing
+
+
+def find_packed_session(session_path: Path) -> Optional[Path]:
+    """Find the packed copy of a session directory that no longer exists.
+
+    Args:
+        session_path: ``<messages dir>/ses_*`` path of a pruned session
+
+    Returns:
+        Path of the session inside its most recently modified pack, or None
+        if no pack of the messages directory holds it
+    """
+    base_dir = session_path.parent
+    packed = [(negated_mtime, relative) for negated_mtime, relative in list_packed_sessions(base_dir)
+              if relative.rsplit('/', 1)[-1] == session_path.name]
+    if not packed:
+        return None
+    return base_dir / min(packed)[1]
+
+
+def storage_root_of(session_path: Path) -> Path:
+    """Get the storage root a session directory was listed under.
+
+    Packed sessions live in ``<root>/ocmonitor-packs/<month>.zip``, so
+    their root is the messages directory holding the pack.
+    """
+    parent = session_path.parent
+    if parent.parent.name == PACK_DIRECTORY:
+        return parent.parent.parent
+    return parent
+
+
+class ArchiveSnapshot:
+    """Message files and session titles of one storage snapshot archive."""
+
+    __slots__ = ('path', 'stamp', 'sessions', 'directory_mtimes', 'titles', '_zip', '_zip_lock')
+
+    def __init__(self, path: Path, stamp: Tuple[int, int] = (0, 0)):
+        """Initialize an empty snapshot; use :meth:`open` to read one.
+
+        Args:
+            path: Archive path
+            stamp: Modification time in ns and size the archive was read at
+        """
+        self.path = path
+        self.stamp = stamp
+        # Session directory name -> message file name -> (mtime, member); the
+        # member is the ZipLocation to read on demand for zips, and the parsed
+        # InteractionFields (None if unparseable) for tarballs
+        self.sessions: Dict[str, Dict[str, Tuple[float, Any]]] = {}
+        # Session directory mtimes, for archives that store directory entries
+        self.directory_mtimes: Dict[str, float] = {}
+        self.titles: Dict[str, str] = {}
+        self._zip = None
+        self._zip_lock = threading.Lock()
+
+    @staticmethod
+    def open(path: Path, retain: int = ARCHIVE_CACHE_SIZE) -> 'ArchiveSnapshot':
+        """Get the snapshot of an archive, reading it unless an unchanged copy is open.
+
+        Only the most recently used snapshots stay open, one by default. A
+        caller reading several archives side by side asks to retain more,
+        which then holds for the rest of the process.
+
+        Args:
+            path: Archive path
+            retain: Number of snapshots to keep open, at least
+
+        Returns:
+            ArchiveSnapshot with every session in the archive
+
+        Raises:
+            ValueError: If the archive cannot be read
+        """
+        global _retained
+        try:
+            stat = os.stat(path)
+        except OSError as e:
+            raise ValueError(f"Cannot read storage snapshot {path}: {e}")
+        key = os.fspath(path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        with _opened_lock:
+            _retained = max(_retained, retain)
+            snapshot = _opened.get(key)
+            if snapshot is not None and snapshot.stamp == stamp:
+                _opened.move_to_end(key)
+                return snapshot
+
+        snapshot = ArchiveSnapshot(Path(path), stamp)
+        snapshot._read()
+        with _opened_lock:
+            _opened[key] = snapshot
+            _opened.move_to_end(key)
+            while len(_opened) > _retained:
+                # A pack replaces the one its directory's loader opened before,
+                # rather than an archive another root's loader still reads
+                siblings = [other for other, opened in _opened.items()
+                            if other != key and opened.path.parent == snapshot.path.parent]
+                del _opened[siblings[0] if siblings else next(iter(_opened))]
+        return snapshot
+
+    def list_sessions(self, modified_since: Optional[float] = None) -> List[Tuple[float, str]]:
+        """List sessions like ``FileProcessor._scan_session_directories``.
+
+        A session's modification time is that of its directory entry or of
+        its newest message file, whichever is later.
+
+        Args:
+            modified_since: Skip sessions last modified before this POSIX timestamp
+
+        Returns:
+            List of (negated mtime, session directory name)
+        """
+        listing = []
+        for name, files in self.sessions.items():
+            mtime = max(self.directory_mtimes.get(name, 0.0), max(mtime for mtime, _ in files.values()))
+            if modified_since is not None and mtime < modified_since:
+                continue
+            listing.append((-mtime, name))
+        return listing
+
+    def json_files(self, session_path: Path, modified_since: Optional[float] = None) -> List[Path]:
+        """List a session's message files like ``FileProcessor.find_json_files``.
+
+        Args:
+            session_path: Virtual session directory below the archive
+            modified_since: Skip files last modified before this POSIX timestamp
+
+        Returns:
+            Virtual message file paths, newest first
+        """
+        files = [
+            (mtime, name) for name, (mtime, _) in self.sessions.get(session_path.name, {}).items()
+            if modified_since is None or mtime >= modified_since
+        ]
+        files.sort(key=lambda item: item[0], reverse=True)
+        return [session_path / name for _, name in files]
+
+    def read(self, file_path: Path) -> Optional[bytes]:
+        """Get the contents of a virtual message file.
+
+        Tarball members are parsed while streaming and their contents are not
+        kept, so this only reads zips; use :meth:`interaction_fields` instead.
+
+        Returns:
+            File contents, or None if the file is not in the archive or the
+            archive is a tarball
+
+        Raises:
+            ValueError: If the member cannot be read
+        """
+        member = self.sessions.get(file_path.parent.name, {}).get(file_path.name)
+        if member is None or self._zip is None:
+            return None
+        import zipfile
+        import zlib
+
+        try:
+            with self._zip_lock:
+                return self._zip.read(_zip_info(member[1]))
+        except (zipfile.BadZipFile, zlib.error, EOFError, OSError) as e:
+            raise ValueError(f"Cannot read storage snapshot {self.path}: {e}")
+
+    def interaction_fields(self, file_path: Path) -> Optional[InteractionFields]:
+        """Get the parsed fields of a virtual message file.
+
+        Returns:
+            InteractionFields, or None if the file is not in the archive or
+            cannot be parsed
+
+        Raises:
+            ValueError: If the member cannot be read
+        """
+        member = self.sessions.get(file_path.parent.name, {}).get(file_path.name)
+        if member is None:
+            return None
+        if self._zip is None:
+            return member[1]
+        return _parse_interaction(self.read(file_path), {})
+
+    def fingerprint(self, session_name: str) -> Optional[Tuple[int, int]]:
+        """Fingerprint a session like ``SessionSummaryCache.fingerprint``.
+
+        Returns:
+            Tuple of (message file count, newest mtime in ns), or None if
+            the archive holds no such session
+        """
+        files = self.sessions.get(session_name)
+        if not files:
+            return None
+        return len(files), int(max(mtime for mtime, _ in files.values()) * 1_000_000_000)
+
+    @instrumented("load.archive")
+    def _read(self) -> None:
+        """Index every member in one pass, keeping message files and session titles.
+
+        Raises:
+            ValueError: If the archive is corrupt or not a tar or zip file
+        """
+        # Imported here so commands that never read archives do not pay for them
+        import tarfile
+        import zipfile
+        import zlib
+
+        try:
+            if self.path.name.lower().endswith('.zip'):
+                archive = zipfile.ZipFile(self.path)
+                try:
+                    index = _pack_index(archive)[0]
+                    # Exact times from a pack index over the rounded zip timestamps
+                    exact = {
+                        f"{name}/{file_name}": mtime
+                        for name, (_, files) in index.items() for file_name, mtime in files.items()
+                    }
+                    for info in archive.infolist():
+                        if info.filename == PACK_INDEX:
+                            continue
+                        mtime = exact.get(info.filename) or time.mktime(info.date_time + (0, 0, -1))
+                        self._add(info.filename, mtime, info.is_dir(),
+                                  functools.partial(archive.read, info), lambda: _zip_location(info))
+                    for name, (mtime, _) in index.items():
+                        if name in self.sessions:
+                            self.directory_mtimes[name] = mtime
+                except BaseException:
+                    archive.close()
+                    raise
+                # Kept open for reading message files on demand, from their
+                # locations rather than the archive's list of every member
+                archive.filelist = []
+                archive.NameToInfo = {}
+                self._zip = archive
+            else:
+                # Stream mode reads members strictly in order, decompressing once
+                strings: Dict[str, str] = {}
+                with tarfile.open(self.path, 'r|*') as archive:
+                    for member in archive:
+                        if not member.isfile() and not member.isdir():
+                            continue
+                        self._add(member.name, float(member.mtime), member.isdir(),
+                                  lambda: archive.extractfile(member).read(),
+                                  lambda: _parse_interaction(archive.extractfile(member).read(), strings))
+                        # A stream cannot seek back, so drop the member list tarfile keeps
+                        archive.members = []
+        except (tarfile.TarError, zipfile.BadZipFile, zlib.error, EOFError, OSError) as e:
+            raise ValueError(f"Cannot read storage snapshot {self.path}: {e}")
+
+    def _add(self, member_name: str, mtime: float, is_dir: bool,
+             read: Callable[[], bytes], keep: Callable[[], Any]) -> None:
+        """Keep one archive member if it is a session directory, message file or session title.
+
+        Args:
+            member_name: Path of the member in the archive
+            mtime: Modification time of the member
+            is_dir: Whether the member is a directory
+            read: Function reading the member's contents
+            keep: Function giving what to keep for a message file
+        """
+        parts = [part for part in member_name.split('/') if part and part != '.']
+        if not parts:
+            return
+
+        if is_dir:
+            if parts[-1].startswith('ses_'):
+                self.directory_mtimes[parts[-1]] = mtime
+            return
+
+        if len(parts) < 2 or not parts[-1].endswith('.json'):
+            return
+        if parts[-2].startswith('ses_'):
+            self.sessions.setdefault(parts[-2], {})[parts[-1]] = (mtime, keep())
+        else:
+            _add_title(self.titles, parts, read)
+
+
+def _add_title(titles: Dict[str, str], parts: List[str], read: Callable[[], bytes]) -> None:
+    """Keep the title of a ``<storage>/session/<project>/<session id>.json`` member."""
+    if len(parts) < 3 or parts[-3] != 'session' or not parts[-1].startswith('ses_'):
+        return
+    try:
+        data = json.loads(read())
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return
+    if isinstance(data, dict) and 'title' in data:
+        titles.setdefault(parts[-1][:-len('.json')], data['title'])
+
+
+def _zip_location(info) -> ZipLocation:
+    """Get the location of a zip member, which takes far less memory than its ZipInfo."""
+    return (info.orig_filename, info.header_offset, info.compress_size, info.file_size,
+            info.compress_type, info.CRC, info.flag_bits)
+
+
+def _zip_info(location: ZipLocation):
+    """Rebuild the ZipInfo of a member from its location, for reading it."""
+    import zipfile
+
+    info = zipfile.ZipInfo(location[0])
+    (info.header_offset, info.compress_size, info.file_size,
+     info.compress_type, info.CRC, info.flag_bits) = location[1:]
+    return info
+
+
+def _parse_interaction(contents: Optional[bytes], strings: Dict[str, str]) -> Optional[InteractionFields]:
+    """Parse a message file like ``FileProcessor.parse_interaction_record``.
+
+    Args:
+        contents: Raw message file
+        strings: Model IDs and project paths seen so far, shared between
+            the records of one archive instead of kept once per file
+
+    Returns:
+        InteractionFields, or None if the file cannot be parsed
+    """
+    # Imported here because file_utils resolves archived paths through this module
+    from .file_utils import FileProcessor
+
+    if contents is None:
+        return None
+    try:
+        data = json.loads(contents)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    if not data:
+        return None
+    try:
+        model_id, tokens, time_data, project_path = FileProcessor._extract_interaction_fields(data)
+    except (KeyError, ValueError, TypeError, AttributeError):
+        return None
+
+    if isinstance(model_id, str):
+        model_id = strings.setdefault(model_id, model_id)
+    if isinstance(project_path, str):
+        project_path = strings.setdefault(project_path, project_path)
+    return (
+        model_id,
+        (tokens.input, tokens.output, tokens.cache_write, tokens.cache_read),
+        (time_data.created, time_data.completed) if time_data is not None else None,
+        project_path,
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _read_zip_titles(path: str, mtime_ns: int, size: int) -> Dict[str, str]:
+    """Read the session titles of a zip; cached by path, modification time and size."""
+    import zipfile
+    import zlib
+
+    titles: Dict[str, str] = {}
+    try:
+        with zipfile.ZipFile(path) as archive:
+            for info in archive.infolist():
+                if info.is_dir() or not info.filename.endswith('.json'):
+                    continue
+                parts = [part for part in info.filename.split('/') if part and part != '.']
+                _add_title(titles, parts, functools.partial(archive.read, info))
+    except (zipfile.BadZipFile, zlib.error, EOFError, OSError) as e:
+        raise ValueError(f"Cannot read storage snapshot {path}: {e}")
+    return titles
+
+
+def _pack_key(path: Path) -> Tuple[str, int, int]:
+    """Get the absolute path, modification time and size a zip's cached contents are keyed by.
+
+    Raises:
+        ValueError: If the zip cannot be statted
+    """
+    try:
+        stat = os.stat(path)
+    except OSError as e:
+        raise ValueError(f"Cannot read session pack {path}: {e}")
+    return os.path.abspath(path), stat.st_mtime_ns, stat.st_size
+
+
+@functools.lru_cache(maxsize=256)
+def _read_pack_index(path: str, mtime_ns: int,
+                     size: int) -> Tuple[Dict[str, List], Optional[Dict[str, str]]]:
+    """Read a pack index; cached by path, modification time and size.
+
+    Returns:
+        Tuple of (sessions, titles or None for packs that predate them)
+    """
+    import zipfile
+    import zlib
+
+    try:
+        # Written first, so a scan reads it without the central directory
+        contents = _read_first_member(path, PACK_INDEX)
+        if contents is None:
+            with zipfile.ZipFile(path) as archive:
+                return _pack_index(archive)
+        return _parse_pack_index(contents, path)
+    except (zipfile.BadZipFile, zlib.error, EOFError, OSError) as e:
+        raise ValueError(f"Cannot read session pack {path}: {e}")
+
+
+def _read_first_member(path: str, name: str) -> Optional[bytes]:
+    """Read the first member of a zip from its local header, if it is ``name``.
+
+    Returns:
+        Member contents, or None if the first member is another one or is
+        not stored in a way this reads, so the caller falls back to ZipFile
+    """
+    import struct
+    import zlib
+
+    with open(path, 'rb') as f:
+        header = f.read(30)
+        if len(header) < 30:
+            return None
+        (signature, _, flags, method, _, _, crc, compressed_size, size,
+         name_length, extra_length) = struct.unpack('<4sHHHHHIIIHH', header)
+        # Encrypted members and sizes given after the data are left to ZipFile
+        if signature != b'PK\x03\x04' or flags & 0x09 or method not in (0, 8) \
+                or compressed_size == 0xFFFFFFFF:
+            return None
+        if f.read(name_length) != name.encode('utf-8'):
+            return None
+        f.seek(extra_length, os.SEEK_CUR)
+        data = f.read(compressed_size)
+
+    contents = zlib.decompress(data, -zlib.MAX_WBITS) if method == 8 else data
+    if len(contents) != size or zlib.crc32(contents) != crc:
+        return None
+    return contents
+
+
+def _pack_index(archive) -> Tuple[Dict[str, List], Optional[Dict[str, str]]]:
+    """Get the sessions and titles in an open zip's pack index, if it has a current one."""
+    try:
+        contents = archive.read(PACK_INDEX)
+    except KeyError:
+        contents = None
+    return _parse_pack_index(contents, archive.filename)
+
+
+def _parse_pack_index(contents: Optional[bytes],
+                      path: str) -> Tuple[Dict[str, List], Optional[Dict[str, str]]]:
+    """Parse a pack index member, if the pack has a current one.
+
+    Returns:
+        Tuple of (sessions, titles or None for packs that predate them)
+
+    Raises:
+        ValueError: If the index is not valid JSON
+    """
+    if contents is None:
+        return {}, None
+    try:
+        data = json.loads(contents)
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid session pack index in {path}: {e}")
+    if not isinstance(data, dict) or data.get('version') != PACK_VERSION:
+        return {}, None
+    return data.get('sessions', {}), data.get('titles')
@@ -0,0 +1,90 @@
+"""Cache file helpers for OpenCode Monitor.
+
+The pricing table, session summary, rollup and interaction caches keep
+versioned marshal files in the cache directory, named after a hash of the
+paths they were built from. Files are written to a temporary name and moved
+into place, so a crash or a concurrent run never leaves a partial file
+behind, and a file written by another version is treated as missing.
+"""
+
+import hashlib
+import marshal
+import os
+from contextlib import contextmanager
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, Optional, Union
+
+PathLike = Union[str, 'os.PathLike[str]']
+
+
+def cache_key(paths: Iterable[PathLike]) -> str:
+    """Get a short, stable key for the absolute paths a cache file covers.
+
+    Args:
+        paths: Source files or directories, in a stable order
+
+    Returns:
+        16 hex digits of the SHA-1 of the newline-joined absolute paths
+    """
+    joined = '\n'.join(os.path.abspath(path) for path in paths)
+    return hashlib.sha1(joined.encode('utf-8')).hexdigest()[:16]
+
+
+def read_versioned(path: PathLike, version: int) -> Optional[Dict[str, Any]]:
+    """Read a marshal cache file, ignoring missing, corrupt or stale files.
+
+    Args:
+        path: Cache file
+        version: Layout version the file must carry under ``'version'``
+
+    Returns:
+        Stored dictionary, or None if the file cannot be used
+    """
+    try:
+        with open(path, 'rb') as f:
+            data = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+    if not isinstance(data, dict) or data.get('version') != version:
+        return None
+    return data
+
+
+def write_atomic(path: PathLike, data: Dict[str, Any]) -> None:
+    """Write a marshal cache file atomically; failures are not fatal.
+
+    Args:
+        path: Cache file; missing parent directories are created
+        data: Marshal-compatible dictionary, including its ``'version'``
+    """
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with atomic_file(path) as f:
+            marshal.dump(data, f)
+    except OSError:
+        pass
+
+
+@contextmanager
+def atomic_file(path: PathLike) -> Iterator[BinaryIO]:
+    """Open a temporary file that replaces ``path`` once the block completes.
+
+    The temporary file is removed and the error re-raised if the block fails.
+
+    Args:
+        path: File to replace
+
+    Yields:
+        Binary file opened for writing
+    """
+    temp_path = f"{os.fspath(path)}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, 'wb') as f:
+            yield f
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
@@ -1,59 +1,318 @@
 """File utility functions for OpenCode Monitor."""
 
+import heapq
 import json
 import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Generator
+from typing import Dict, List, Optional, Any, Callable, Generator, Iterator, Sequence, Tuple, TypeVar, Union
 from datetime import datetime
 
-from ..models.session import SessionData, InteractionFile, TokenUsage, TimeData
+from ..models.session import SessionData, InteractionFile
+from ..models.records import InteractionRecord, SessionRecord, TimeSpan, TokenCounts
+from ..models.timeline import interaction_timestamp
+from .archive_storage import (
+    PACK_DIRECTORY, ArchiveSnapshot, archive_of, is_archive, list_packed_sessions, read_archive_titles, storage_root_of
+)
+from .instrumentation import instrumented, span
+
+# Margin applied when pruning directories and files by mtime, covering coarse
+# filesystem timestamps and small clock adjustments
+MTIME_PRUNE_SLACK_SECONDS = 3600
+
+# Loaded sessions a storage root's worker may run ahead of the consumer
+ROOT_PREFETCH = 32
+
+# One session directory (storage root) or several, scanned together
+StoragePath = Union[str, Sequence[str]]
+
+T = TypeVar('T')
+
+
+def storage_roots(base_path: StoragePath) -> List[Path]:
+    """Split a base path into its storage roots, dropping repeated roots.
+
+    Args:
+        base_path: Session directory, or a list of session directories
+
+    Returns:
+        Storage roots in the order given
+    """
+    if isinstance(base_path, (str, os.PathLike)):
+        return [Path(base_path)]
+    roots = []
+    for root in base_path:
+        root = Path(root)
+        if root not in roots:
+            roots.append(root)
+    return roots
+
+
+def _token_count(value: Any) -> int:
+    """Coerce a token count like ``TokenUsage`` validation does."""
+    count = int(value)
+    if (isinstance(value, float) and count != value) or count < 0:
+        raise ValueError(f"Invalid token count: {value!r}")
+    return count
+
+
+def _timestamp(value: Any) -> Optional[int]:
+    """Coerce an optional millisecond timestamp like ``TimeData`` validation does."""
+    if value is None:
+        return None
+    timestamp = int(value)
+    if isinstance(value, float) and timestamp != value:
+        raise ValueError(f"Invalid timestamp: {value!r}")
+    return timestamp
+
+
+def _window_bounds(since: Optional[datetime], until: Optional[datetime]) -> tuple:
+    """Convert an optional time window to millisecond bounds."""
+    return (
+        int(since.timestamp() * 1000) if since else None,
+        int(until.timestamp() * 1000) if until else None,
+    )
+
+
+def _in_window(time_data: Any, since_ms: Optional[int], until_ms: Optional[int]) -> bool:
+    """Check whether an interaction's creation time lies in ``[since, until)``.
+
+    Interactions without a creation time fall back to their completion time;
+    interactions without either are outside every window.
+    """
+    timestamp = interaction_timestamp(time_data)
+    if timestamp is None:
+        return False
+    return (since_ms is None or timestamp >= since_ms) and (until_ms is None or timestamp < until_ms)
 
 
 class FileProcessor:
     """Handles file processing and session discovery."""
 
     @staticmethod
-    def find_session_directories(base_path: str) -> List[Path]:
+    @instrumented("discovery.sessions")
+    def find_session_directories(base_path: StoragePath, modified_since: Optional[float] = None) -> List[Path]:
         """Find all session directories in the base path.
 
         Args:
-            base_path: Path to search for session directories
+            base_path: Path to search for session directories, or a list of storage roots
+            modified_since: Skip directories last modified before this POSIX
+                timestamp (a session directory's mtime changes whenever a
+                message file is added, so older directories hold no newer messages)
 
         Returns:
             List of session directory paths sorted by modification time (newest first)
         """
-        base_dir = Path(base_path)
+        roots = storage_roots(base_path)
+        session_dirs = FileProcessor.scan_storage_roots(roots, modified_since)
+
+        # Sort by modification time (most recent first, ties by name)
+        session_dirs.sort()
+        return [roots[root] / name for _, name, root in session_dirs]
+
+    @staticmethod
+    def iter_session_directories(base_path: StoragePath, modified_since: Optional[float] = None) -> Iterator[Path]:
+        """Yield session directories newest first without sorting them all.
+
+        The directories are heapified once and popped lazily, so a consumer
+        that stops after a few sessions pays O(n + k log n) instead of a
+        full sort.
+
+        Args:
+            base_path: Path to search for session directories, or a list of storage roots
+            modified_since: Skip directories last modified before this POSIX timestamp
+
+        Yields:
+            Session directory paths in the same order as :meth:`find_session_directories`
+        """
+        roots = storage_roots(base_path)
+        with span("discovery.sessions"):
+            heap = FileProcessor.scan_storage_roots(roots, modified_since)
+            heapq.heapify(heap)
+
+        while heap:
+            _, name, root = heapq.heappop(heap)
+            yield roots[root] / name
+
+    @staticmethod
+    def scan_storage_roots(roots: List[Path],
+                           modified_since: Optional[float] = None) -> List[Tuple[float, str, int]]:
+        """List the session directories of several storage roots without sorting them.
+
+        Roots are usually mirrors of other machines on separate mounts, so
+        each is listed by its own worker thread. A session ID found under
+        more than one root is kept once, from the root where its directory
+        was modified last (the first listed root on a tie), so sessions
+        mirrored twice are not counted twice.
+
+        Args:
+            roots: Storage roots, as returned by :func:`storage_roots`
+            modified_since: Skip sessions last modified before this POSIX timestamp
+
+        Returns:
+            List of (negated directory mtime, session path relative to its
+            root, index of the root in ``roots``); ``roots[index] / path``
+            is the session directory, and the path of a packed session runs
+            through its pack
+        """
+        if len(roots) == 1:
+            return [(negated_mtime, name, 0)
+                    for negated_mtime, name in FileProcessor._scan_session_directories(roots[0], modified_since)]
+
+        with ThreadPoolExecutor(max_workers=len(roots)) as executor:
+            listings = list(executor.map(
+                lambda root: FileProcessor._scan_session_directories(root, modified_since, len(roots)), roots
+            ))
+
+        newest: Dict[str, Tuple[float, str, int]] = {}
+        for root, listing in enumerate(listings):
+            for negated_mtime, name in listing:
+                # Packed sessions are listed by their path below the root
+                session_id = name.rsplit('/', 1)[-1]
+                seen = newest.get(session_id)
+                if seen is None or negated_mtime < seen[0]:
+                    newest[session_id] = (negated_mtime, name, root)
+        return list(newest.values())
+
+    @staticmethod
+    def load_by_root(session_dirs: List[Path], load: Callable[[Path], T]) -> Iterator[T]:
+        """Load session directories in order, one worker thread per storage root.
+
+        Each root's directories are loaded by its own worker, at most
+        ``ROOT_PREFETCH`` ahead of the consumer, so roots on separate devices
+        are read in parallel while results still come back in the order of
+        ``session_dirs``. Directories from a single root are loaded lazily on
+        the calling thread. Workers stop once the consumer stops iterating.
+        Packed sessions belong to the root holding their pack; callers that
+        need no particular order pass them grouped by pack, so each pack is
+        opened once.
+
+        Args:
+            session_dirs: Session directories, in the order results are wanted
+            load: Function loading one session directory
+
+        Yields:
+            ``load`` results, one per directory
+        """
+        by_root: Dict[Path, List[Path]] = {}
+        for session_dir in session_dirs:
+            by_root.setdefault(storage_root_of(session_dir), []).append(session_dir)
+        if len(by_root) <= 1:
+            for session_dir in session_dirs:
+                yield load(session_dir)
+            return
+
+        stop = threading.Event()
+        results = {root: queue.Queue(ROOT_PREFETCH) for root in by_root}
+
+        def put(root: Path, item: Tuple[Any, Optional[BaseException]]) -> bool:
+            while not stop.is_set():
+                try:
+                    results[root].put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def work(root: Path) -> None:
+            for session_dir in by_root[root]:
+                try:
+                    item = (load(session_dir), None)
+                except Exception as error:
+                    put(root, (None, error))
+                    return
+                if not put(root, item):
+                    return
+
+        executor = ThreadPoolExecutor(max_workers=len(by_root), thread_name_prefix="ocmonitor-root")
+        try:
+            for root in by_root:
+                executor.submit(work, root)
+            for session_dir in session_dirs:
+                result, error = results[storage_root_of(session_dir)].get()
+                if error is not None:
+                    raise error
+                yield result
+        finally:
+            stop.set()
+            executor.shutdown(wait=True)
+
+    @staticmethod
+    def _scan_session_directories(base_dir: Path, modified_since: Optional[float],
+                                  roots_scanned: int = 1) -> List[Tuple[float, str]]:
+        """List session directories as (negated mtime, name), statting each once.
+
+        Sessions packed by ``ocmonitor archive`` are listed by their path
+        below ``base_dir`` (``ocmonitor-packs/2024-05.zip/ses_abc``) instead.
+        An archive root stays open while as many roots as are scanned
+        together are loaded side by side.
+        """
         if not base_dir.exists():
             return []
+        if is_archive(base_dir):
+            return ArchiveSnapshot.open(base_dir, roots_scanned).list_sessions(modified_since)
 
         # Find all directories that start with 'ses_'
-        session_dirs = [
-            d for d in base_dir.iterdir()
-            if d.is_dir() and d.name.startswith('ses_')
-        ]
-
-        # Sort by modification time (most recent first)
-        session_dirs.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-        return session_dirs
+        session_dirs = []
+        has_packs = False
+        with os.scandir(base_dir) as entries:
+            for entry in entries:
+                if not entry.name.startswith('ses_') or not entry.is_dir():
+                    has_packs = has_packs or entry.name == PACK_DIRECTORY
+                    continue
+                mtime = entry.stat().st_mtime
+                if modified_since is not None and mtime < modified_since:
+                    continue
+                session_dirs.append((-mtime, entry.name))
+        if not has_packs:
+            return session_dirs
+
+        # A packed session is read from its pack unless its directory was
+        # modified after packing; pruned sessions only exist in packs
+        listing = {name: (negated_mtime, name) for negated_mtime, name in session_dirs}
+        for negated_mtime, packed_name in list_packed_sessions(base_dir, modified_since):
+            session_id = packed_name.rsplit('/', 1)[-1]
+            listed = listing.get(session_id)
+            if listed is None or negated_mtime <= listed[0]:
+                listing[session_id] = (negated_mtime, packed_name)
+        return list(listing.values())
 
     @staticmethod
-    def find_json_files(directory: Path) -> List[Path]:
+    @instrumented("discovery.files")
+    def find_json_files(directory: Path, modified_since: Optional[float] = None) -> List[Path]:
         """Find all JSON files in a directory.
 
         Args:
             directory: Directory to search
+            modified_since: Skip files last modified before this POSIX timestamp
 
         Returns:
             List of JSON file paths sorted by modification time (newest first)
         """
+        snapshot = archive_of(directory)
+        if snapshot is not None:
+            return snapshot.json_files(directory, modified_since)
         if not directory.exists() or not directory.is_dir():
             return []
 
-        json_files = list(directory.glob("*.json"))
-        json_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-        return json_files
+        json_files = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not entry.name.endswith('.json'):
+                    continue
+                mtime = entry.stat().st_mtime
+                if modified_since is not None and mtime < modified_since:
+                    continue
+                json_files.append((mtime, directory / entry.name))
+
+        json_files.sort(key=lambda item: item[0], reverse=True)
+        return [path for _, path in json_files]
 
     @staticmethod
+    @instrumented("load.parse_json")
     def load_json_file(file_path: Path) -> Optional[Dict[str, Any]]:
         """Load and parse a JSON file.
 
@@ -63,7 +322,11 @@ class FileProcessor:
         Returns:
             Parsed JSON data or None if failed
         """
+        snapshot = archive_of(file_path.parent)
         try:
+            if snapshot is not None:
+                contents = snapshot.read(file_path)
+                return json.loads(contents) if contents is not None else None
             with open(file_path, 'r', encoding='utf-8') as f:
                 return json.load(f)
         except (json.JSONDecodeError, FileNotFoundError, PermissionError, UnicodeDecodeError):
@@ -125,18 +388,49 @@ class FileProcessor:
         return None
 
     @staticmethod
-    def find_session_title(session_id: str) -> Optional[str]:
+    def get_storage_path_for_session(session_path: Path) -> Optional[Path]:
+        """Get the OpenCode storage directory a session directory belongs to.
+
+        Session directories normally live in ``<storage>/message``; when the
+        matching ``<storage>/session`` directory exists next to it, that
+        storage directory is used so titles are found for any scanned tree.
+        Sessions inside a snapshot archive use the archive when it holds
+        session titles. Otherwise the configured storage path is returned.
+
+        Args:
+            session_path: Path to session directory
+
+        Returns:
+            Path to OpenCode storage directory or None if not found
+        """
+        if is_archive(session_path.parent):
+            has_titles = bool(read_archive_titles(session_path.parent))
+            return session_path.parent if has_titles else FileProcessor.get_opencode_storage_path()
+
+        storage_path = session_path.parent.parent
+        if session_path.parent.name == "message" and (storage_path / "session").is_dir():
+            return storage_path
+        return FileProcessor.get_opencode_storage_path()
+
+    @staticmethod
+    @instrumented("load.title")
+    def find_session_title(session_id: str, storage_path: Optional[Path] = None) -> Optional[str]:
         """Find and load session title from OpenCode storage.
         
         Args:
             session_id: Session ID to search for
+            storage_path: OpenCode storage directory or snapshot archive
+                (defaults to the configured storage directory)
             
         Returns:
             Session title or None if not found
         """
-        storage_path = FileProcessor.get_opencode_storage_path()
+        if storage_path is None:
+            storage_path = FileProcessor.get_opencode_storage_path()
         if not storage_path:
             return None
+        if is_archive(storage_path):
+            return read_archive_titles(storage_path).get(session_id)
         
         session_storage = storage_path / "session"
         if not session_storage.exists():
@@ -156,113 +450,177 @@ class FileProcessor:
         return None
 
     @staticmethod
-    def parse_interaction_file(file_path: Path, session_id: str) -> Optional[InteractionFile]:
-        """Parse a single interaction JSON file.
+    def parse_interaction_record(file_path: Path, session_id: str) -> Optional[InteractionRecord]:
+        """Parse a single interaction JSON file into a lightweight record.
 
         Args:
             file_path: Path to the interaction file
             session_id: ID of the session this file belongs to
 
         Returns:
-            InteractionFile object or None if parsing failed
+            InteractionRecord object or None if parsing failed
         """
+        snapshot = archive_of(file_path.parent)
+        if snapshot is not None:
+            # Archived message files come parsed into plain tuples
+            fields = snapshot.interaction_fields(file_path)
+            if fields is None:
+                return None
+            model_id, counts, times, project_path = fields
+            return InteractionRecord(file_path, session_id, model_id, TokenCounts(*counts),
+                                     TimeSpan(*times) if times is not None else None, project_path)
+
         data = FileProcessor.load_json_file(file_path)
         if not data:
             return None
 
         try:
-            # Extract basic information
-            model_id = data.get('modelID', 'unknown')
-            
-            # Handle fully qualified model names
-            model_id = FileProcessor._extract_model_name(model_id)
-
-            # Extract token usage
-            tokens_data = data.get('tokens', {})
-            cache_data = tokens_data.get('cache', {})
-
-            tokens = TokenUsage(
-                input=tokens_data.get('input', 0),
-                output=tokens_data.get('output', 0),
-                cache_write=cache_data.get('write', 0),
-                cache_read=cache_data.get('read', 0)
-            )
+            model_id, tokens, time_data, project_path = FileProcessor._extract_interaction_fields(data)
+        except (KeyError, ValueError, TypeError):
+            return None
+
+        return InteractionRecord(file_path, session_id, model_id, tokens, time_data, project_path)
+
+    @staticmethod
+    def _extract_interaction_fields(data: Dict[str, Any]) -> tuple:
+        """Extract model, tokens, timing and project path from interaction JSON.
+
+        Args:
+            data: Parsed interaction file
+
+        Returns:
+            Tuple of (model_id, TokenCounts, TimeSpan or None, project_path)
+
+        Raises:
+            ValueError: If token counts or timestamps are invalid
+        """
+        # Extract basic information
+        model_id = data.get('modelID', 'unknown')
+
+        # Handle fully qualified model names
+        model_id = FileProcessor._extract_model_name(model_id)
+
+        # Extract token usage
+        tokens_data = data.get('tokens', {})
+        cache_data = tokens_data.get('cache', {})
+
+        tokens = TokenCounts(
+            input=_token_count(tokens_data.get('input', 0)),
+            output=_token_count(tokens_data.get('output', 0)),
+            cache_write=_token_count(cache_data.get('write', 0)),
+            cache_read=_token_count(cache_data.get('read', 0))
+        )
 
-            # Extract time data
-            time_data = None
-            if 'time' in data:
-                time_info = data['time']
-                time_data = TimeData(
-                    created=time_info.get('created'),
-                    completed=time_info.get('completed')
-                )
-
-            # Extract project path data
-            project_path = None
-            if 'path' in data:
-                path_info = data['path']
-                # Use 'cwd' as the project path, fallback to 'root' if needed
-                project_path = path_info.get('cwd') or path_info.get('root')
-
-            return InteractionFile(
-                file_path=file_path,
-                session_id=session_id,
-                model_id=model_id,
-                tokens=tokens,
-                time_data=time_data,
-                project_path=project_path,
-                raw_data=data
+        # Extract time data
+        time_data = None
+        if 'time' in data:
+            time_info = data['time']
+            time_data = TimeSpan(
+                created=_timestamp(time_info.get('created')),
+                completed=_timestamp(time_info.get('completed'))
             )
 
-        except (KeyError, ValueError, TypeError):
-            return None
+        # Extract project path data
+        project_path = None
+        if 'path' in data:
+            path_info = data['path']
+            # Use 'cwd' as the project path, fallback to 'root' if needed
+            project_path = path_info.get('cwd') or path_info.get('root')
+
+        return model_id, tokens, time_data, project_path
 
     @staticmethod
-    def load_session_data(session_path: Path) -> Optional[SessionData]:
+    def load_session_data(session_path: Path, since: Optional[datetime] = None,
+                          until: Optional[datetime] = None) -> Optional[SessionData]:
         """Load complete session data from a session directory.
 
+        Loaded through :meth:`load_session_record` and converted to the
+        validated models.
+
         Args:
             session_path: Path to session directory
+            since: Only include interactions created at or after this time
+            until: Only include interactions created before this time
 
         Returns:
             SessionData object or None if loading failed
         """
-        if not session_path.exists() or not session_path.is_dir():
+        record = FileProcessor.load_session_record(session_path, since, until)
+        return record.to_model() if record is not None else None
+
+    @staticmethod
+    @instrumented("load.session")
+    def load_session_record(session_path: Path, since: Optional[datetime] = None,
+                            until: Optional[datetime] = None) -> Optional[SessionRecord]:
+        """Load a session as lightweight records for scanning and aggregation.
+
+        Args:
+            session_path: Path to session directory
+            since: Only include interactions created at or after this time
+            until: Only include interactions created before this time
+
+        Returns:
+            SessionRecord object or None if loading failed
+        """
+        if not FileProcessor._is_session_directory(session_path):
             return None
 
         session_id = session_path.name
-        json_files = FileProcessor.find_json_files(session_path)
+        json_files = FileProcessor._find_window_files(session_path, since)
 
         if not json_files:
             return None
 
+        windowed = since is not None or until is not None
+        since_ms, until_ms = _window_bounds(since, until)
+
         interaction_files = []
         for json_file in json_files:
-            interaction = FileProcessor.parse_interaction_file(json_file, session_id)
-            if interaction:
-                # Filter out interactions with zero token usage
-                if interaction.tokens.total > 0:
-                    interaction_files.append(interaction)
+            interaction = FileProcessor.parse_interaction_record(json_file, session_id)
+            if interaction and windowed and not _in_window(interaction.time_data, since_ms, until_ms):
+                continue
+            # Filter out interactions with zero token usage
+            if interaction and interaction.tokens.total > 0:
+                interaction_files.append(interaction)
 
         if not interaction_files:
             return None
 
-        # Load session title from OpenCode storage
-        session_title = FileProcessor.find_session_title(session_id)
-
-        return SessionData(
+        return SessionRecord(
             session_id=session_id,
             session_path=session_path,
             files=interaction_files,
-            session_title=session_title
+            session_title=FileProcessor.find_session_title(
+                session_id, FileProcessor.get_storage_path_for_session(session_path)
+            )
         )
 
     @staticmethod
-    def get_most_recent_session(base_path: str) -> Optional[SessionData]:
+    def _is_session_directory(session_path: Path) -> bool:
+        """Check that a session directory, or a session inside a snapshot archive, exists."""
+        snapshot = archive_of(session_path)
+        if snapshot is not None:
+            return session_path.name in snapshot.sessions
+        return session_path.is_dir()
+
+    @staticmethod
+    def _find_window_files(session_path: Path, since: Optional[datetime]) -> List[Path]:
+        """Find a session's message files that can hold interactions from ``since`` on.
+
+        A message's creation time never exceeds its file's modification
+        time, so files last written before the window are skipped unparsed.
+        """
+        modified_since = None
+        if since is not None:
+            modified_since = since.timestamp() - MTIME_PRUNE_SLACK_SECONDS
+        return FileProcessor.find_json_files(session_path, modified_since)
+
+    @staticmethod
+    def get_most_recent_session(base_path: StoragePath) -> Optional[SessionData]:
         """Get the most recently modified session.
 
         Args:
-            base_path: Path to search for sessions
+            base_path: Path to search for sessions, or a list of storage roots
 
         Returns:
             Most recent SessionData or None if no sessions found
@@ -287,47 +645,133 @@ class FileProcessor:
         if not json_files:
             return None
 
-        session_id = session_path.name
-        return FileProcessor.parse_interaction_file(json_files[0], session_id)
+        record = FileProcessor.parse_interaction_record(json_files[0], session_path.name)
+        return record.to_model() if record is not None else None
 
     @staticmethod
-    def load_all_sessions(base_path: str, limit: Optional[int] = None) -> List[SessionData]:
+    @instrumented("load.all_sessions")
+    def load_all_sessions(base_path: StoragePath, limit: Optional[int] = None,
+                          modified_since: Optional[float] = None,
+                          since: Optional[datetime] = None,
+                          until: Optional[datetime] = None) -> List[SessionData]:
         """Load all sessions from the base path.
 
         Args:
-            base_path: Path to search for sessions
+            base_path: Path to search for sessions, or a list of storage roots
             limit: Maximum number of sessions to load (None for all)
+            modified_since: Skip session directories last modified before this POSIX timestamp
+            since: Only include interactions created at or after this time
+            until: Only include interactions created before this time
 
         Returns:
-            List of SessionData objects
+            List of SessionData objects (the newest ``limit`` sessions that
+            contain data; directories without usable data do not count)
         """
-        session_dirs = FileProcessor.find_session_directories(base_path)
+        sessions = FileProcessor.session_generator(base_path, modified_since, since, until)
+        return list(islice(sessions, limit or None))
 
-        if limit:
-            session_dirs = session_dirs[:limit]
+    @staticmethod
+    @instrumented("load.all_sessions")
+    def load_all_session_records(base_path: StoragePath, limit: Optional[int] = None,
+                                 modified_since: Optional[float] = None,
+                                 since: Optional[datetime] = None,
+                                 until: Optional[datetime] = None) -> List[SessionRecord]:
+        """Load all sessions from the base path as lightweight records.
 
-        sessions = []
-        for session_dir in session_dirs:
-            session_data = FileProcessor.load_session_data(session_dir)
-            if session_data:
-                sessions.append(session_data)
+        Args:
+            base_path: Path to search for sessions, or a list of storage roots
+            limit: Maximum number of sessions to load (None for all)
+            modified_since: Skip session directories last modified before this POSIX timestamp
+            since: Only include interactions created at or after this time
+            until: Only include interactions created before this time
 
-        return sessions
+        Returns:
+            List of SessionRecord objects (the newest ``limit`` sessions that
+            contain data; directories without usable data do not count)
+        """
+        sessions = FileProcessor.iter_session_records(base_path, modified_since, since, until)
+        return list(islice(sessions, limit or None))
 
     @staticmethod
-    def session_generator(base_path: str) -> Generator[SessionData, None, None]:
-        """Generator that yields sessions one by one (memory efficient).
+    def iter_session_records(base_path: StoragePath, modified_since: Optional[float] = None,
+                             since: Optional[datetime] = None,
+                             until: Optional[datetime] = None) -> Generator[SessionRecord, None, None]:
+        """Yield sessions as lightweight records, newest first.
+
+        Directories are parsed only as the generator is consumed, so callers
+        that need the first N sessions stop scanning once they have them.
 
         Args:
-            base_path: Path to search for sessions
+            base_path: Path to search for sessions, or a list of storage roots
+            modified_since: Skip session directories last modified before this POSIX timestamp
+            since: Only include interactions created at or after this time
+            until: Only include interactions created before this time
 
         Yields:
-            SessionData objects
+            SessionRecord objects for directories that contain data
         """
-        session_dirs = FileProcessor.find_session_directories(base_path)
+        session_records = FileProcessor.map_session_directories(
+            base_path, lambda session_dir: FileProcessor.load_session_record(session_dir, since, until),
+            FileProcessor._window_modified_since(modified_since, since)
+        )
+        for session_record in session_records:
+            if session_record:
+                yield session_record
 
-        for session_dir in session_dirs:
-            session_data = FileProcessor.load_session_data(session_dir)
+    @staticmethod
+    def map_session_directories(base_path: StoragePath, load: Callable[[Path], T],
+                                modified_since: Optional[float] = None) -> Iterator[T]:
+        """Load every session directory of a base path, newest first.
+
+        A single root is listed lazily through :meth:`iter_session_directories`
+        and loaded on the calling thread; several roots are listed in full
+        and loaded with one worker per root (see :meth:`load_by_root`).
+
+        Args:
+            base_path: Path to search for sessions, or a list of storage roots
+            load: Function loading one session directory
+            modified_since: Skip session directories last modified before this POSIX timestamp
+
+        Yields:
+            ``load`` results, one per directory
+        """
+        if len(storage_roots(base_path)) > 1:
+            yield from FileProcessor.load_by_root(
+                FileProcessor.find_session_directories(base_path, modified_since), load
+            )
+            return
+
+        for session_dir in FileProcessor.iter_session_directories(base_path, modified_since):
+            yield load(session_dir)
+
+    @staticmethod
+    def _window_modified_since(modified_since: Optional[float], since: Optional[datetime]) -> Optional[float]:
+        """Combine an explicit directory mtime bound with the one implied by ``since``."""
+        if since is None:
+            return modified_since
+        window_bound = since.timestamp() - MTIME_PRUNE_SLACK_SECONDS
+        return window_bound if modified_since is None else max(modified_since, window_bound)
+
+    @staticmethod
+    def session_generator(base_path: StoragePath, modified_since: Optional[float] = None,
+                          since: Optional[datetime] = None,
+                          until: Optional[datetime] = None) -> Generator[SessionData, None, None]:
+        """Generator that yields sessions one by one (memory efficient), newest first.
+
+        Args:
+            base_path: Path to search for sessions, or a list of storage roots
+            modified_since: Skip session directories last modified before this POSIX timestamp
+            since: Only include interactions created at or after this time
+            until: Only include interactions created before this time
+
+        Yields:
+            SessionData objects
+        """
+        sessions = FileProcessor.map_session_directories(
+            base_path, lambda session_dir: FileProcessor.load_session_data(session_dir, since, until),
+            FileProcessor._window_modified_since(modified_since, since)
+        )
+        for session_data in sessions:
             if session_data:
                 yield session_data
 
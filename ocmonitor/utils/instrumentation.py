@@ -0,0 +1,368 @@
+"""Lightweight timing instrumentation for OpenCode Monitor.
+
+Code marks pipeline stages with :func:`span` (a context manager) or the
+:func:`instrumented` decorator. Recording is off by default, in which case a
+span costs one flag check; ``ocmonitor --timings`` enables it and prints a
+per-stage breakdown at exit. With tracing enabled every span is also kept as
+an event and can be written as a Chrome trace (``ocmonitor --trace FILE``)
+for chrome://tracing or Perfetto, one track per thread. Memory profiling
+(``ocmonitor --memory-profile``) runs tracemalloc and records, for spans on
+the main thread, the peak memory growth per stage and the top allocation
+sites of each top-level stage.
+
+Spans nest, so a stage's time includes the stages it calls (for example
+``load.session`` includes ``load.parse_json`` and ``load.title``).
+"""
+
+import functools
+import io
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+_enabled = False
+_lock = threading.Lock()
+_stats: Dict[str, List[float]] = {}
+_started_at: Optional[float] = None
+_tracing = False
+# Finished spans as (name, start, end, thread id), kept only while tracing
+_events: List[Tuple[str, float, float, int]] = []
+_thread_names: Dict[int, str] = {}
+_memory = False
+# Per-stage [count, max peak growth, total net growth] in bytes
+_memory_stats: Dict[str, List[int]] = {}
+# Formatted top allocation sites of each top-level stage, in order
+_memory_sites: List[Tuple[str, List[str]]] = []
+# Peak seen so far by each open main-thread span, innermost last
+_memory_stack: List[int] = []
+_memory_top = 10
+_memory_peak = 0
+_IGNORED_ALLOCATION_FILES = frozenset({
+    "<frozen importlib._bootstrap>",
+    "<frozen importlib._bootstrap_external>",
+    "<unknown>",
+})
+_NULL_SPAN = nullcontext()
+
+
+def enable(trace: bool = False, memory: bool = False, memory_top: int = 10) -> None:
+    """Start recording spans, discarding anything recorded before.
+
+    Args:
+        trace: Also keep every span as an event for :func:`write_trace`
+        memory: Start tracemalloc and record per-stage memory usage
+        memory_top: Allocation sites to keep per top-level stage (0 skips
+            collecting them)
+    """
+    global _enabled, _started_at, _tracing, _memory, _memory_top, _memory_peak
+    with _lock:
+        _stats.clear()
+        _events.clear()
+        _thread_names.clear()
+        _memory_stats.clear()
+        _memory_sites.clear()
+        _memory_stack.clear()
+        _memory_peak = 0
+        if memory:
+            import tracemalloc
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+        _started_at = time.perf_counter()
+        _tracing = trace
+        _memory = memory
+        _memory_top = memory_top
+        _enabled = True
+
+
+def disable() -> None:
+    """Stop recording spans."""
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    """Check whether spans are being recorded."""
+    return _enabled
+
+
+def _record(name: str, start: float, end: float) -> None:
+    """Add one finished span to the per-stage totals."""
+    with _lock:
+        stage = _stats.get(name)
+        if stage is None:
+            _stats[name] = [1, end - start, end - start]
+        else:
+            stage[0] += 1
+            stage[1] += end - start
+            stage[2] = max(stage[2], end - start)
+        if _tracing:
+            thread = threading.current_thread()
+            _events.append((name, start, end, thread.ident))
+            _thread_names.setdefault(thread.ident, thread.name)
+
+
+def _memory_enter(name: str) -> Optional[Tuple[int, Any]]:
+    """Start memory accounting for a span; returns state for :func:`_memory_exit`."""
+    import tracemalloc
+
+    # tracemalloc's peak is process-wide, so only main-thread spans are
+    # measured; allocations made by worker threads still count towards them
+    if threading.current_thread() is not threading.main_thread():
+        return None
+    current, peak = tracemalloc.get_traced_memory()
+    if _memory_stack:
+        _memory_stack[-1] = max(_memory_stack[-1], peak)
+    # Snapshots cost time proportional to the whole traced heap, so sites are
+    # collected only for top-level stages, skipping import-heavy service setup
+    snapshot = None
+    if not _memory_stack and _memory_top and not name.startswith("init."):
+        snapshot = tracemalloc.take_snapshot()
+    _memory_stack.append(current)
+    tracemalloc.reset_peak()
+    return current, snapshot
+
+
+def _memory_exit(name: str, state: Optional[Tuple[int, Any]]) -> None:
+    """Finish memory accounting for a span started by :func:`_memory_enter`."""
+    global _memory_peak
+    import tracemalloc
+
+    if state is None:
+        return
+    start_bytes, snapshot = state
+    current, peak = tracemalloc.get_traced_memory()
+    peak = max(_memory_stack.pop(), peak)
+    if _memory_stack:
+        _memory_stack[-1] = max(_memory_stack[-1], peak)
+    _memory_peak = max(_memory_peak, peak)
+
+    with _lock:
+        stage = _memory_stats.setdefault(name, [0, 0, 0])
+        stage[0] += 1
+        stage[1] = max(stage[1], peak - start_bytes)
+        stage[2] += current - start_bytes
+
+    if snapshot is not None:
+        sites = []
+        for diff in tracemalloc.take_snapshot().compare_to(snapshot, 'lineno'):
+            if len(sites) >= _memory_top:
+                break
+            frame = diff.traceback[0]
+            # Diffs are ordered by absolute size; skip freed memory, the import
+            # machinery and earlier snapshots (cheaper than filter_traces())
+            if diff.size_diff <= 0 or frame.filename in _IGNORED_ALLOCATION_FILES \
+                    or frame.filename == tracemalloc.__file__:
+                continue
+            sites.append(f"{_format_bytes(diff.size_diff):>10}  {diff.count_diff:>+9,} blocks  "
+                         f"{frame.filename}:{frame.lineno}")
+        _memory_sites.append((name, sites))
+
+
+@contextmanager
+def _timed_span(name: str) -> Iterator[None]:
+    memory_state = _memory_enter(name) if _memory else None
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        end = time.perf_counter()
+        if _memory:
+            _memory_exit(name, memory_state)
+        _record(name, start, end)
+
+
+def span(name: str):
+    """Time a block of code as the given stage.
+
+    Args:
+        name: Stage name, dotted by area (e.g. ``"aggregate.daily"``)
+
+    Returns:
+        Context manager; a shared no-op when recording is disabled
+    """
+    if not _enabled:
+        return _NULL_SPAN
+    return _timed_span(name)
+
+
+def instrumented(name: str) -> Callable[[F], F]:
+    """Decorator that times every call of a function as the given stage.
+
+    Args:
+        name: Stage name
+
+    Returns:
+        Decorator preserving the wrapped function's signature
+    """
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            memory_state = _memory_enter(name) if _memory else None
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                end = time.perf_counter()
+                if _memory:
+                    _memory_exit(name, memory_state)
+                _record(name, start, end)
+        return wrapper  # type: ignore[return-value]
+    return decorator
+
+
+def get_stage_stats() -> Dict[str, Dict[str, float]]:
+    """Get recorded per-stage statistics.
+
+    Returns:
+        Dictionary mapping stage name to count, total and max seconds
+    """
+    with _lock:
+        return {
+            name: {'count': int(count), 'total_seconds': total, 'max_seconds': longest}
+            for name, (count, total, longest) in _stats.items()
+        }
+
+
+def format_report() -> str:
+    """Format recorded stages as a plain-text table sorted by total time.
+
+    Returns:
+        Multi-line report including the wall time since recording started
+    """
+    stats = get_stage_stats()
+    wall = time.perf_counter() - _started_at if _started_at is not None else 0.0
+
+    lines = [
+        "⏱  Stage timings (nested stages are included in their parents)",
+        f"{'Stage':<28}{'Count':>9}{'Total ms':>12}{'Avg ms':>10}{'Max ms':>10}{'% wall':>8}",
+    ]
+    for name, stage in sorted(stats.items(), key=lambda item: item[1]['total_seconds'], reverse=True):
+        total_ms = stage['total_seconds'] * 1000
+        percent = (stage['total_seconds'] / wall * 100) if wall else 0.0
+        lines.append(
+            f"{name:<28}{stage['count']:>9,}{total_ms:>12.1f}"
+            f"{total_ms / stage['count']:>10.3f}{stage['max_seconds'] * 1000:>10.1f}{percent:>7.1f}%"
+        )
+    lines.append(f"{'wall time':<28}{'':>9}{wall * 1000:>12.1f}")
+    return "\n".join(lines)
+
+
+def _format_bytes(size: float) -> str:
+    """Format a byte count in KiB or MiB."""
+    if abs(size) >= 1024 * 1024:
+        return f"{size / (1024 * 1024):.1f} MiB"
+    return f"{size / 1024:.1f} KiB"
+
+
+def format_memory_report() -> str:
+    """Format recorded memory usage per stage and top allocation sites.
+
+    Returns:
+        Multi-line report, stages sorted by peak growth
+    """
+    import tracemalloc
+
+    with _lock:
+        stats = {name: list(stage) for name, stage in _memory_stats.items()}
+        sites = list(_memory_sites)
+    # Spans reset tracemalloc's peak, so combine it with the peaks they saw
+    overall_peak = max(_memory_peak, tracemalloc.get_traced_memory()[1]) if tracemalloc.is_tracing() else 0
+
+    lines = [
+        "🧠 Stage memory (tracemalloc, main thread; nested stages are included in their parents)",
+        f"{'Stage':<28}{'Count':>9}{'Peak growth':>14}{'Net retained':>14}",
+    ]
+    for name, (count, peak, net) in sorted(stats.items(), key=lambda item: item[1][1], reverse=True):
+        lines.append(f"{name:<28}{count:>9,}{_format_bytes(peak):>14}{_format_bytes(net):>14}")
+    lines.append(f"{'traced peak':<28}{'':>9}{_format_bytes(overall_peak):>14}")
+
+    for name, stage_sites in sites:
+        if stage_sites:
+            lines.append("")
+            lines.append(f"Top allocation sites retained by {name}:")
+            lines.extend(f"  {site}" for site in stage_sites)
+    return "\n".join(lines)
+
+
+def write_trace(path: str) -> int:
+    """Write recorded span events as a Chrome trace-event JSON file.
+
+    Spans become complete (``"ph": "X"``) events with microsecond
+    timestamps relative to :func:`enable`; each thread gets its own named
+    track.
+
+    Args:
+        path: Output file path
+
+    Returns:
+        Number of span events written
+    """
+    origin = _started_at or 0.0
+    pid = os.getpid()
+    with _lock:
+        events = list(_events)
+        thread_names = dict(_thread_names)
+
+    trace_events: List[Dict[str, Any]] = [
+        {"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": "ocmonitor"}}
+    ]
+    for tid, thread_name in thread_names.items():
+        trace_events.append(
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": thread_name}}
+        )
+    for name, start, end, tid in events:
+        trace_events.append({
+            "name": name,
+            "cat": name.split('.', 1)[0],
+            "ph": "X",
+            "ts": round((start - origin) * 1e6, 3),
+            "dur": round((end - start) * 1e6, 3),
+            "pid": pid,
+            "tid": tid,
+        })
+
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, f)
+    return len(events)
+
+
+def start_profiler():
+    """Start a cProfile profiler for the rest of the command.
+
+    Returns:
+        Running ``cProfile.Profile`` instance
+    """
+    import cProfile
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    return profiler
+
+
+def finish_profiler(profiler, path: str, top: int = 20) -> str:
+    """Stop a profiler, save its statistics and summarize the hottest functions.
+
+    Args:
+        profiler: Profiler returned by :func:`start_profiler`
+        path: Output ``.prof`` file, readable by ``pstats``, snakeviz and similar tools
+        top: Number of functions to include in the summary
+
+    Returns:
+        Summary of the top functions by cumulative time
+    """
+    import pstats
+
+    profiler.disable()
+    profiler.dump_stats(path)
+
+    stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stream)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+    return f"Profile written to {path}\n" + stream.getvalue().strip('\n')
@@ -0,0 +1,559 @@
+"""Memory-mapped interaction cache for OpenCode Monitor.
+
+Reports over an interaction window (``--since``/``--until``) cannot use the
+session summaries or the rollup store, whose usage is already summed per
+15-minute slot, so they parse every message file in the window into
+interaction records. This cache keeps every interaction as a fixed-width
+row of 64-bit integers (timestamps, token counts and dictionary-encoded
+session, model and project codes) in ``<cache_dir>/interactions-*.bin``,
+which is memory-mapped when a window is read. A session's rows are stored
+together and sorted by time, so the rows of a window are found by binary
+search within each session overlapping it and summed straight from the
+mapping into per-session summaries, without an object per interaction.
+With NumPy installed the columns are zero-copy NumPy views of the mapping
+and windows are summed by vectorized group-bys; otherwise ``memoryview``
+slices of the mapping serve the same columns.
+
+The cache is refreshed like the rollup store (see :mod:`.rollup_store`):
+sessions that are new, whose directory changed or that were still active
+when last read are parsed again and their rows appended, and the file is
+compacted once superseded rows outnumber live ones. A marshal index next to
+it maps sessions to their rows and holds the code dictionaries.
+"""
+
+import marshal
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+from bisect import bisect_left
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from ..models.records import SessionSummary
+from ..models.timeline import TIME_SLOT_MS, UsageTimeline, interaction_timestamp
+from .cache_files import atomic_file, cache_key, read_versioned
+from .file_utils import FileProcessor, MTIME_PRUNE_SLACK_SECONDS, StoragePath, storage_roots
+from .instrumentation import instrumented
+
+# Bump when the row layout or the index changes
+INTERACTION_CACHE_VERSION = 1
+
+# Columns of a row, each a signed 64-bit integer in native byte order
+ROW_FIELDS = ('timestamp', 'position', 'created', 'completed', 'session', 'model', 'project',
+              'input', 'output', 'cache_write', 'cache_read')
+ROW_SIZE = 8 * len(ROW_FIELDS)
+
+# Stands in for a missing creation or completion time
+MISSING = -(1 << 63)
+
+# Superseded rows are only compacted away once the file holds this many rows
+COMPACT_MIN_ROWS = 10000
+
+# Magic, version, byte order, generation; padded so rows stay 8-byte aligned
+_HEADER = struct.Struct('<4sHH8s16x')
+_MAGIC = b'OCIC'
+
+# Session index entry: [directory mtime, checked at, session code, directory
+# holding the session, first row, row count, first timestamp, last timestamp]
+_FIRST, _COUNT, _MIN_TS, _MAX_TS = 4, 5, 6, 7
+
+
+class InteractionCache:
+    """Keeps every interaction as a fixed-width row in a memory-mapped file."""
+
+    def __init__(self, cache_dir: str):
+        """Initialize interaction cache.
+
+        Args:
+            cache_dir: Directory for the row and index files
+        """
+        self.cache_dir = cache_dir
+        # (data path, generation, mapping) of the file last mapped
+        self._mapped: Optional[Tuple[str, bytes, mmap.mmap]] = None
+
+    def iter_summaries(self, base_path: StoragePath, since: Optional[datetime] = None,
+                       until: Optional[datetime] = None) -> Optional[Iterator[SessionSummary]]:
+        """Summarize the interactions in a window per session, refreshing the cache first.
+
+        Summaries equal ``SessionSummary.from_record`` of the session
+        records a windowed load returns: sessions without interactions in
+        the window are left out, and sessions come newest first like
+        :meth:`FileProcessor.iter_session_directories`.
+
+        Args:
+            base_path: Path to directory containing sessions, or a list of storage roots
+            since: Only include interactions created at or after this time
+            until: Only include interactions created before this time
+
+        Returns:
+            Iterator of SessionSummary objects, or None if the cache file
+            cannot be written
+        """
+        window = self._window(base_path, since, until)
+        if window is None:
+            return None
+        state, columns, segments = window
+        return iter(_summaries(state, columns, segments))
+
+    def timeline(self, base_path: StoragePath, since: Optional[datetime] = None,
+                 until: Optional[datetime] = None) -> Optional[UsageTimeline]:
+        """Get the usage timeline of the interactions in a window, refreshing the cache first.
+
+        Entries are per session, 15-minute slot and model, which buckets
+        exactly like the individual interactions.
+
+        Args:
+            base_path: Path to directory containing sessions, or a list of storage roots
+            since: Only include interactions created at or after this time
+            until: Only include interactions created before this time
+
+        Returns:
+            UsageTimeline for :meth:`TimeframeAnalyzer.bucket_timeline`, or
+            None if the cache file cannot be written
+        """
+        summaries = self.iter_summaries(base_path, since, until)
+        if summaries is None:
+            return None
+        return UsageTimeline.from_sessions(summaries)
+
+    def columns(self, base_path: StoragePath) -> Optional[Dict[str, Any]]:
+        """Get the cached rows as columns, refreshing the cache first.
+
+        Columns are NumPy views of the mapped file when NumPy is installed,
+        otherwise strided ``memoryview`` slices of it; neither copies the
+        rows. They include rows superseded by a later refresh, so select a
+        session's rows through the index's first row and row count.
+
+        Args:
+            base_path: Path to directory containing sessions, or a list of storage roots
+
+        Returns:
+            Dictionary of ``ROW_FIELDS`` name -> column, or None if the
+            cache file cannot be written
+        """
+        state = self.refresh(base_path)
+        if state is None:
+            return None
+        data_path, _ = self._paths(storage_roots(base_path))
+        try:
+            return self._columns(data_path, state)
+        except (OSError, ValueError):
+            return None
+
+    @instrumented("interactions.refresh")
+    def refresh(self, base_path: StoragePath) -> Optional[Dict[str, Any]]:
+        """Bring the cached rows for a session directory up to date.
+
+        Sessions are re-read under the same rules as the rollup store; their
+        new rows are appended in one write and the index is replaced
+        atomically, so a crash leaves at most unreferenced rows behind.
+
+        Args:
+            base_path: Path to directory containing sessions, or a list of storage roots
+
+        Returns:
+            Index with ``sessions`` mapping directory name to its entry,
+            ``session_ids``, ``models`` and ``projects`` code dictionaries
+            and the total number of ``rows`` in the file, or None if the
+            cache file cannot be written
+        """
+        roots = storage_roots(base_path)
+        data_path, index_path = self._paths(roots)
+        state = self._read_index(data_path, index_path)
+        try:
+            if state is None:
+                state = self._create(data_path)
+
+            sessions = state['sessions']
+            now = time.time()
+            seen = set()
+            stale = []
+            for negated_mtime, name, root in FileProcessor.scan_storage_roots(roots):
+                mtime = -negated_mtime
+                session_dir = roots[root] / name
+                seen.add(session_dir.name)
+                entry = sessions.get(session_dir.name)
+                if entry is not None and entry[0] == mtime and entry[1] - mtime >= MTIME_PRUNE_SLACK_SECONDS \
+                        and entry[3] == str(session_dir.parent):
+                    continue
+                stale.append((mtime, session_dir))
+            # Grouped by pack, so each pack is opened once while loading
+            stale.sort(key=lambda item: str(item[1].parent))
+
+            changed = False
+            if stale:
+                records = FileProcessor.load_by_root([session_dir for _, session_dir in stale],
+                                                     FileProcessor.load_session_record)
+                self._append(data_path, state, [
+                    (mtime, session_dir, record) for (mtime, session_dir), record in zip(stale, records)
+                ], now)
+                changed = True
+
+            for name in [name for name in sessions if name not in seen]:
+                del sessions[name]
+                changed = True
+
+            live_rows = sum(entry[_COUNT] for entry in sessions.values())
+            if state['rows'] >= COMPACT_MIN_ROWS and state['rows'] > 2 * live_rows:
+                self._compact(data_path, state)
+                changed = True
+
+            if changed:
+                self._write_index(index_path, state)
+        except (OSError, ValueError):
+            return None
+        return state
+
+    @instrumented("interactions.window")
+    def _window(self, base_path: StoragePath, since: Optional[datetime],
+                until: Optional[datetime]) -> Optional[Tuple[Dict[str, Any], Dict[str, Any], List[Tuple]]]:
+        """Find each session's rows in a window, newest session first."""
+        state = self.refresh(base_path)
+        if state is None:
+            return None
+        data_path, _ = self._paths(storage_roots(base_path))
+        try:
+            columns = self._columns(data_path, state)
+        except (OSError, ValueError):
+            return None
+        since_ms = int(since.timestamp() * 1000) if since else None
+        until_ms = int(until.timestamp() * 1000) if until else None
+
+        timestamps = columns['timestamp']
+        segments = []
+        for name, entry in sorted(state['sessions'].items(), key=lambda item: (-item[1][0], item[0])):
+            if not entry[_COUNT]:
+                continue
+            if since_ms is not None and entry[_MAX_TS] < since_ms:
+                continue
+            if until_ms is not None and entry[_MIN_TS] >= until_ms:
+                continue
+            lo, hi = entry[_FIRST], entry[_FIRST] + entry[_COUNT]
+            if since_ms is not None:
+                lo = bisect_left(timestamps, since_ms, lo, hi)
+            if until_ms is not None:
+                hi = bisect_left(timestamps, until_ms, lo, hi)
+            if lo < hi:
+                segments.append((name, entry, lo, hi))
+        return state, columns, segments
+
+    def _append(self, data_path: str, state: Dict[str, Any],
+                loaded: List[Tuple[float, Path, Any]], now: float) -> None:
+        """Encode re-read sessions and append their rows to the data file in one write."""
+        codes = {key: {value: code for code, value in enumerate(state[key])}
+                 for key in ('session_ids', 'models', 'projects')}
+
+        def encode(key: str, value: str) -> int:
+            code = codes[key].get(value)
+            if code is None:
+                code = codes[key][value] = len(state[key])
+                state[key].append(value)
+            return code
+
+        data = array('q')
+        entries = []
+        for mtime, session_dir, record in loaded:
+            session_code = encode('session_ids', record.session_id if record else session_dir.name)
+            rows = []
+            for position, file in enumerate(record.files if record else ()):
+                time_data = file.time_data
+                timestamp = interaction_timestamp(time_data)
+                if timestamp is None:
+                    # Outside every window
+                    continue
+                tokens = file.tokens
+                rows.append((
+                    timestamp, position,
+                    MISSING if time_data.created is None else time_data.created,
+                    MISSING if time_data.completed is None else time_data.completed,
+                    session_code, encode('models', file.model_id),
+                    encode('projects', file.project_path) if file.project_path else -1,
+                    tokens.input, tokens.output, tokens.cache_write, tokens.cache_read,
+                ))
+            rows.sort()
+
+            first = len(data) // len(ROW_FIELDS)
+            for row in rows:
+                data.extend(row)
+            entries.append((session_dir, [
+                mtime, now, session_code, str(session_dir.parent), first, len(rows),
+                rows[0][0] if rows else 0, rows[-1][0] if rows else 0,
+            ]))
+
+        payload = data.tobytes()
+        with open(data_path, 'ab') as f:
+            f.write(payload)
+            offset = f.tell() - len(payload) - _HEADER.size
+        # Appends from another process interleaved or the file was truncated
+        if offset < 0 or offset % ROW_SIZE:
+            raise ValueError(f"Interaction cache {data_path} is corrupt")
+
+        base_row = offset // ROW_SIZE
+        for session_dir, entry in entries:
+            entry[_FIRST] += base_row
+            state['sessions'][session_dir.name] = entry
+        state['rows'] = max(state['rows'], base_row + len(data) // len(ROW_FIELDS))
+
+    def _compact(self, data_path: str, state: Dict[str, Any]) -> None:
+        """Rewrite the data file with only the rows the index still refers to."""
+        buffer = self._map(data_path, state)
+        generation = os.urandom(8)
+        first_rows = {}
+        with atomic_file(data_path) as f:
+            f.write(_header(generation))
+            row = 0
+            for name, entry in state['sessions'].items():
+                start = _HEADER.size + entry[_FIRST] * ROW_SIZE
+                f.write(buffer[start:start + entry[_COUNT] * ROW_SIZE])
+                first_rows[name] = row
+                row += entry[_COUNT]
+        for name, first_row in first_rows.items():
+            state['sessions'][name][_FIRST] = first_row
+        state['generation'] = generation
+        state['rows'] = row
+
+    def _create(self, data_path: str) -> Dict[str, Any]:
+        """Start an empty data file and index."""
+        os.makedirs(os.path.dirname(data_path), exist_ok=True)
+        generation = os.urandom(8)
+        with atomic_file(data_path) as f:
+            f.write(_header(generation))
+        return {
+            'version': INTERACTION_CACHE_VERSION,
+            'generation': generation,
+            'rows': 0,
+            'sessions': {},
+            'session_ids': [],
+            'models': [],
+            'projects': [],
+        }
+
+    def _columns(self, data_path: str, state: Dict[str, Any]) -> Dict[str, Any]:
+        """Get zero-copy column views of the rows of the mapped data file."""
+        buffer = self._map(data_path, state)
+        rows = state['rows']
+        try:
+            import numpy
+        except ImportError:
+            flat = memoryview(buffer)[_HEADER.size:_HEADER.size + rows * ROW_SIZE].cast('q')
+            return {name: flat[index::len(ROW_FIELDS)] for index, name in enumerate(ROW_FIELDS)}
+
+        table = numpy.frombuffer(buffer, dtype=numpy.int64, count=rows * len(ROW_FIELDS),
+                                 offset=_HEADER.size).reshape(rows, len(ROW_FIELDS))
+        return {name: table[:, index] for index, name in enumerate(ROW_FIELDS)}
+
+    def _map(self, data_path: str, state: Dict[str, Any]) -> mmap.mmap:
+        """Memory-map the data file, reusing the last mapping while it covers the index."""
+        needed = _HEADER.size + state['rows'] * ROW_SIZE
+        mapped = self._mapped
+        if mapped is not None and mapped[0] == data_path and mapped[1] == state['generation'] \
+                and len(mapped[2]) >= needed:
+            return mapped[2]
+
+        with open(data_path, 'rb') as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(buffer) < needed or buffer[:_HEADER.size] != _header(state['generation']):
+            raise ValueError(f"Interaction cache {data_path} does not match its index")
+        self._mapped = (data_path, state['generation'], buffer)
+        return buffer
+
+    def _paths(self, roots: List[Path]) -> Tuple[str, str]:
+        """Get the data and index files for a set of storage roots."""
+        base = os.path.join(self.cache_dir, f"interactions-{cache_key(roots)}")
+        return f"{base}.bin", f"{base}.idx"
+
+    def _read_index(self, data_path: str, index_path: str) -> Optional[Dict[str, Any]]:
+        """Read an index, ignoring missing or stale ones and those not matching the data file."""
+        state = read_versioned(index_path, INTERACTION_CACHE_VERSION)
+        if state is None:
+            return None
+        try:
+            with open(data_path, 'rb') as f:
+                header = f.read(_HEADER.size)
+                size = f.seek(0, os.SEEK_END)
+        except OSError:
+            return None
+
+        if header != _header(state['generation']) or size < _HEADER.size + state['rows'] * ROW_SIZE:
+            return None
+        return state
+
+    @staticmethod
+    def _write_index(index_path: str, state: Dict[str, Any]) -> None:
+        """Write an index atomically."""
+        with atomic_file(index_path) as f:
+            marshal.dump(state, f)
+
+
+def _header(generation: bytes) -> bytes:
+    """Get the header of a data file; rows in another byte order are not readable."""
+    return _HEADER.pack(_MAGIC, INTERACTION_CACHE_VERSION, sys.byteorder == 'little', generation)
+
+
+def _summaries(state: Dict[str, Any], columns: Dict[str, Any], segments: List[Tuple]) -> List[SessionSummary]:
+    """Build a SessionSummary per session from its rows in a window."""
+    if not segments:
+        return []
+    if hasattr(columns['timestamp'], 'dtype'):
+        groups = _numpy_groups(columns, segments)
+    else:
+        groups = _python_groups(columns, segments)
+
+    session_ids, models, projects = state['session_ids'], state['models'], state['projects']
+    summaries = []
+    for (name, entry, _, _), (slots, project_counts, start_ms, end_ms) in zip(segments, groups):
+        # Models and slots keep the order of their first message file, like
+        # summarize_model_usage and summarize_time_slots
+        model_totals: Dict[str, List[int]] = {}
+        processing_ms = 0
+        for (_, model), totals in sorted(slots.items(), key=lambda item: item[1][6]):
+            row = model_totals.setdefault(models[model], [0, 0, 0, 0, 0])
+            for index in range(5):
+                row[index] += totals[index]
+            processing_ms += totals[5]
+        time_slots = [
+            [slot, models[model]] + totals[:6]
+            for (slot, model), totals in sorted(slots.items(), key=lambda item: (item[0][0], item[1][6]))
+        ]
+
+        project_path = None
+        if project_counts:
+            # Most common project, ties going to the one seen first like Counter.most_common
+            project, _ = max(project_counts.items(), key=lambda item: (item[1][0], -item[1][1]))
+            project_path = projects[project]
+
+        session_path = Path(entry[3]) / name
+        summaries.append(SessionSummary(
+            session_id=session_ids[entry[2]],
+            session_path=session_path,
+            models=model_totals,
+            start_ms=start_ms,
+            end_ms=end_ms,
+            processing_ms=processing_ms,
+            project_path=project_path,
+            session_title=FileProcessor.find_session_title(
+                session_ids[entry[2]], FileProcessor.get_storage_path_for_session(session_path)
+            ),
+            time_slots=time_slots,
+        ))
+    return summaries
+
+
+def _python_groups(columns: Dict[str, Any], segments: List[Tuple]) -> Iterator[Tuple]:
+    """Sum each segment's rows per slot and model from ``memoryview`` columns.
+
+    Yields:
+        Tuples of (slots, project counts, start ms, end ms), where slots map
+        (slot start, model code) to [interactions, input, output,
+        cache_write, cache_read, processing ms, first position] and project
+        counts map a project code to [interactions, first position]
+    """
+    names = ('timestamp', 'position', 'created', 'completed', 'model', 'project',
+             'input', 'output', 'cache_write', 'cache_read')
+    for _, _, lo, hi in segments:
+        slots: Dict[Tuple[int, int], List[int]] = {}
+        project_counts: Dict[int, List[int]] = {}
+        start_ms = end_ms = None
+        for timestamp, position, created, completed, model, project, input, output, cache_write, cache_read \
+                in zip(*(columns[name][lo:hi].tolist() for name in names)):
+            processing_ms = 0
+            if created != MISSING:
+                if start_ms is None or created < start_ms:
+                    start_ms = created
+            if completed != MISSING:
+                if end_ms is None or completed > end_ms:
+                    end_ms = completed
+                if created != MISSING:
+                    processing_ms = completed - created
+
+            key = (timestamp - timestamp % TIME_SLOT_MS, model)
+            totals = slots.get(key)
+            if totals is None:
+                slots[key] = [1, input, output, cache_write, cache_read, processing_ms, position]
+            else:
+                totals[0] += 1
+                totals[1] += input
+                totals[2] += output
+                totals[3] += cache_write
+                totals[4] += cache_read
+                totals[5] += processing_ms
+                if position < totals[6]:
+                    totals[6] = position
+
+            if project >= 0:
+                counts = project_counts.get(project)
+                if counts is None:
+                    project_counts[project] = [1, position]
+                else:
+                    counts[0] += 1
+                    if position < counts[1]:
+                        counts[1] = position
+        yield slots, project_counts, start_ms, end_ms
+
+
+def _numpy_groups(columns: Dict[str, Any], segments: List[Tuple]) -> List[Tuple]:
+    """Sum each segment's rows per slot and model with vectorized group-bys.
+
+    Returns:
+        The same tuples as :func:`_python_groups`, one per segment
+    """
+    import numpy
+
+    lengths = numpy.array([hi - lo for _, _, lo, hi in segments])
+    rows = numpy.concatenate([numpy.arange(lo, hi) for _, _, lo, hi in segments])
+    segment = numpy.repeat(numpy.arange(len(segments)), lengths)
+    column = {name: columns[name][rows] for name in ROW_FIELDS if name != 'session'}
+
+    created, completed = column['created'], column['completed']
+    timed = (created != MISSING) & (completed != MISSING)
+    processing = numpy.where(timed, completed - created, 0)
+    slot = column['timestamp'] - column['timestamp'] % TIME_SLOT_MS
+    position = column['position']
+
+    # Rows are already grouped by segment, so session bounds reduce over segment starts
+    starts = numpy.concatenate(([0], numpy.cumsum(lengths)[:-1]))
+    int64_max = numpy.iinfo(numpy.int64).max
+    start_ms = numpy.minimum.reduceat(numpy.where(created != MISSING, created, int64_max), starts).tolist()
+    end_ms = numpy.maximum.reduceat(completed, starts).tolist()
+
+    results = [({}, {}, None if first == int64_max else first, None if last == MISSING else last)
+               for first, last in zip(start_ms, end_ms)]
+
+    keys = (segment, slot, column['model'])
+    order, group_starts = _group(keys)
+    measures = (numpy.ones(len(rows), dtype=numpy.int64), column['input'], column['output'],
+                column['cache_write'], column['cache_read'], processing)
+    sums = [numpy.add.reduceat(values[order], group_starts).tolist() for values in measures]
+    first_positions = numpy.minimum.reduceat(position[order], group_starts).tolist()
+    group_keys = [key[order][group_starts].tolist() for key in keys]
+    for index, (segment_index, slot_start, model) in enumerate(zip(*group_keys)):
+        results[segment_index][0][(slot_start, model)] = [total[index] for total in sums] + [first_positions[index]]
+
+    with_project = column['project'] >= 0
+    if with_project.any():
+        keys = (segment[with_project], column['project'][with_project])
+        order, group_starts = _group(keys)
+        counts = numpy.diff(numpy.append(group_starts, len(order))).tolist()
+        first_positions = numpy.minimum.reduceat(position[with_project][order], group_starts).tolist()
+        for segment_index, project, count, first in zip(keys[0][order][group_starts].tolist(),
+                                                        keys[1][order][group_starts].tolist(),
+                                                        counts, first_positions):
+            results[segment_index][1][project] = [count, first]
+    return results
+
+
+def _group(keys: Tuple) -> Tuple[Any, Any]:
+    """Sort rows by several key columns and find where each distinct key starts."""
+    import numpy
+
+    order = numpy.lexsort(keys[::-1])
+    changed = numpy.zeros(len(order), dtype=bool)
+    changed[0] = True
+    for key in keys:
+        ordered = key[order]
+        changed[1:] |= ordered[1:] != ordered[:-1]
+    return order, numpy.flatnonzero(changed)
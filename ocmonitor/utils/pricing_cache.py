@@ -0,0 +1,190 @@
+"""Compiled pricing table cache for OpenCode Monitor.
+
+``models.json`` is parsed and validated through pydantic once; the validated
+prices are then stored in a compact marshal file in the cache directory, keyed
+by the source file's mtime, size and content hash. Warm starts read the
+compiled rows back without JSON parsing or validation, and build
+``ModelPricing`` objects only for the models that are actually looked up.
+"""
+
+import hashlib
+import json
+import os
+from collections.abc import Mapping
+from decimal import Decimal
+from typing import Dict, Iterator, Optional, Tuple
+
+from ..config import ModelPricing
+from .cache_files import cache_key, read_versioned, write_atomic
+
+# Bump when the layout of the compiled rows changes
+PRICING_CACHE_VERSION = 1
+
+MILLION = Decimal('1000000')
+
+# input, output, cache_write, cache_read, context_window, session_quota
+PricingRow = Tuple[str, str, str, str, int, str]
+TokenRates = Tuple[Decimal, Decimal, Decimal, Decimal]
+
+
+class PricingTable(Mapping):
+    """Read-only mapping of model name to ``ModelPricing``.
+
+    Entries are stored as compiled rows and turned into ``ModelPricing``
+    objects on first access. Per-token rates are kept alongside so cost
+    calculation can skip the per-million conversion for every interaction.
+    """
+
+    def __init__(self, rows: Dict[str, PricingRow]):
+        """Initialize pricing table.
+
+        Args:
+            rows: Compiled pricing rows keyed by model name
+        """
+        self._rows = rows
+        self._models: Dict[str, ModelPricing] = {}
+        self._rates: Dict[str, TokenRates] = {}
+
+    def __getitem__(self, model_name: str) -> ModelPricing:
+        model = self._models.get(model_name)
+        if model is None:
+            row = self._rows[model_name]
+            model = ModelPricing.model_construct(
+                input=Decimal(row[0]),
+                output=Decimal(row[1]),
+                cache_write=Decimal(row[2]),
+                cache_read=Decimal(row[3]),
+                context_window=row[4],
+                session_quota=Decimal(row[5]),
+            )
+            self._models[model_name] = model
+        return model
+
+    def __contains__(self, model_name: object) -> bool:
+        return model_name in self._rows
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @property
+    def rows(self) -> Dict[str, PricingRow]:
+        """Compiled pricing rows keyed by model name."""
+        return self._rows
+
+    def token_rates(self, model_name: str) -> Optional[TokenRates]:
+        """Get per-token input, output, cache write and cache read rates.
+
+        Args:
+            model_name: Model identifier
+
+        Returns:
+            Tuple of per-token rates or None if the model is unknown
+        """
+        rates = self._rates.get(model_name)
+        if rates is None:
+            row = self._rows.get(model_name)
+            if row is None:
+                return None
+            rates = tuple(Decimal(price) / MILLION for price in row[:4])
+            self._rates[model_name] = rates
+        return rates
+
+    @classmethod
+    def from_models(cls, pricing_data: Dict[str, ModelPricing]) -> "PricingTable":
+        """Build a pricing table from validated ``ModelPricing`` objects."""
+        table = cls({name: compile_pricing_row(pricing) for name, pricing in pricing_data.items()})
+        table._models.update(pricing_data)
+        return table
+
+
+def compile_pricing_row(pricing: ModelPricing) -> PricingRow:
+    """Convert a validated ``ModelPricing`` into a compact row."""
+    return (
+        str(pricing.input),
+        str(pricing.output),
+        str(pricing.cache_write),
+        str(pricing.cache_read),
+        int(pricing.context_window),
+        str(pricing.session_quota),
+    )
+
+
+class PricingCache:
+    """Loads pricing files through a compiled on-disk cache."""
+
+    def __init__(self, cache_dir: Optional[str]):
+        """Initialize pricing cache.
+
+        Args:
+            cache_dir: Directory for compiled pricing files. If None, caching is disabled.
+        """
+        self.cache_dir = cache_dir
+
+    def load(self, models_file: str) -> PricingTable:
+        """Load pricing data, using the compiled cache when it is current.
+
+        Args:
+            models_file: Path to models.json
+
+        Returns:
+            Pricing table for all models in the file
+
+        Raises:
+            ValueError: If the pricing file is invalid
+        """
+        stat = os.stat(models_file)
+        cache_path = self._cache_path(models_file)
+        cached = read_versioned(cache_path, PRICING_CACHE_VERSION) if cache_path else None
+
+        if cached and cached['mtime_ns'] == stat.st_mtime_ns and cached['size'] == stat.st_size:
+            return PricingTable(cached['models'])
+
+        with open(models_file, 'rb') as f:
+            content = f.read()
+        digest = hashlib.sha256(content).hexdigest()
+
+        if cached and cached['sha256'] == digest:
+            # File was touched but not changed; refresh the fingerprint only
+            rows = cached['models']
+            table = PricingTable(rows)
+        else:
+            table = PricingTable.from_models(self.validate(content, models_file))
+            rows = table.rows
+
+        if cache_path:
+            write_atomic(cache_path, {
+                'version': PRICING_CACHE_VERSION,
+                'source': os.path.abspath(models_file),
+                'mtime_ns': stat.st_mtime_ns,
+                'size': stat.st_size,
+                'sha256': digest,
+                'models': rows,
+            })
+        return table
+
+    @staticmethod
+    def validate(content: bytes, models_file: str) -> Dict[str, ModelPricing]:
+        """Parse and validate raw pricing file content.
+
+        Args:
+            content: Raw models.json content
+            models_file: Path used in error messages
+
+        Returns:
+            Dictionary of validated pricing models
+        """
+        try:
+            raw_data = json.loads(content)
+            return {model_name: ModelPricing(**model_data)
+                    for model_name, model_data in raw_data.items()}
+        except (json.JSONDecodeError, ValueError) as e:
+            raise ValueError(f"Invalid pricing file {models_file}: {e}")
+
+    def _cache_path(self, models_file: str) -> Optional[str]:
+        """Get the compiled cache path for a pricing file."""
+        if not self.cache_dir:
+            return None
+        return os.path.join(self.cache_dir, f"pricing-{cache_key([models_file])}.bin")
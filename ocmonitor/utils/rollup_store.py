@@ -0,0 +1,234 @@
+"""Materialized usage rollups for OpenCode Monitor.
+
+The daily, weekly and monthly reports only need usage per time period, yet
+building them from sessions touches every session on every run. The rollup
+store keeps each session's usage per 15-minute slot and model (see
+:mod:`ocmonitor.models.timeline`) in a marshal file in the cache directory
+and updates it incrementally: a refresh lists the session directories and
+re-reads only sessions that are new or whose directory changed (through the
+session summary cache). The slots are kept sorted by time, together with
+an index of session start times, so reports bucket the stored slots and
+date filters pick sessions by binary search instead of reading every
+session. Usage cubes (see :mod:`ocmonitor.models.cube`) are built from the
+same slots on first use and kept in the file per timezone until a
+session's usage changes.
+
+A store can cover several storage roots (mirrors of other machines); they
+are listed and read with one worker per root, and a session ID found under
+more than one root is stored once, from the root where it changed last.
+
+Slots are aligned to UTC and fine enough for local midnight in every
+timezone, so apart from the cubes the store does not depend on the timezone
+reports use. Costs
+are computed from the token sums when a period is read, so pricing changes
+need no refresh.
+"""
+
+import os
+import time
+from datetime import tzinfo
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ..models.cube import UsageCube
+from ..models.timeline import UsageTimeline
+from .cache_files import cache_key, read_versioned, write_atomic
+from .file_utils import FileProcessor, MTIME_PRUNE_SLACK_SECONDS, StoragePath, storage_roots
+from .instrumentation import instrumented
+from .summary_cache import SessionSummaryCache
+
+# Bump when the layout of the rollup file changes
+ROLLUP_STORE_VERSION = 5
+
+
+class DailyRollupStore:
+    """Keeps per-slot usage totals for a session directory up to date on disk."""
+
+    def __init__(self, cache_dir: Optional[str], summary_cache: Optional[SessionSummaryCache] = None):
+        """Initialize rollup store.
+
+        Args:
+            cache_dir: Directory for rollup files. If None, rollups are
+                rebuilt in memory on every refresh.
+            summary_cache: Cache used to read sessions that changed
+        """
+        self.cache_dir = cache_dir
+        self.summary_cache = summary_cache or SessionSummaryCache(None)
+
+    @instrumented("rollup.timeline")
+    def timeline(self, base_path: StoragePath) -> UsageTimeline:
+        """Get the usage timeline of all sessions, refreshing the store first.
+
+        Args:
+            base_path: Path to directory containing sessions, or a list of storage roots
+
+        Returns:
+            UsageTimeline with one entry per session, time slot and model
+        """
+        return UsageTimeline.from_dict(self.refresh(base_path)['timeline'])
+
+    @instrumented("rollup.cube")
+    def cube(self, base_path: StoragePath, timezone: Optional[tzinfo] = None) -> UsageCube:
+        """Get the usage cube of all sessions, refreshing the store first.
+
+        The cube is built from the stored slots the first time a timezone
+        asks for it and kept in the rollup file until a session's usage
+        changes.
+
+        Args:
+            base_path: Path to directory containing sessions, or a list of storage roots
+            timezone: Timezone days are taken in; None for local time
+
+        Returns:
+            UsageCube with every session's usage
+        """
+        state = self.refresh(base_path)
+        key = _timezone_key(timezone)
+        cubes = state.setdefault('cubes', {})
+        data = cubes.get(key)
+        if data is not None:
+            return UsageCube.from_dict(data)
+
+        cube = UsageCube.from_slots(
+            ((entry[2], entry[5], entry[3]) for entry in state['sessions'].values()), timezone
+        )
+        cubes[key] = cube.to_dict()
+        store_path = self._store_path(storage_roots(base_path))
+        if store_path:
+            write_atomic(store_path, state)
+        return cube
+
+    @instrumented("rollup.sessions")
+    def sessions_between(self, base_path: StoragePath, start_ms: Optional[int] = None,
+                         end_ms: Optional[int] = None) -> List[Path]:
+        """Find the sessions that started in a time range, refreshing the store first.
+
+        Args:
+            base_path: Path to directory containing sessions, or a list of storage roots
+            start_ms: Inclusive lower bound in milliseconds, or None
+            end_ms: Exclusive upper bound in milliseconds, or None
+
+        Returns:
+            Session directories, most recently modified first like
+            :meth:`FileProcessor.iter_session_directories`
+        """
+        state = self.refresh(base_path)
+        index = state['index']
+        starts = array('q')
+        starts.frombytes(index['start_ms'])
+        lo = bisect_left(starts, start_ms) if start_ms is not None else 0
+        hi = bisect_left(starts, end_ms, lo) if end_ms is not None else len(starts)
+        sessions = state['sessions']
+        names = sorted(index['names'][lo:hi], key=lambda name: (-sessions[name][0], name))
+        return [Path(sessions[name][6]) / name for name in names]
+
+    @instrumented("rollup.refresh")
+    def refresh(self, base_path: StoragePath) -> Dict[str, Any]:
+        """Bring the stored sessions for a session directory up to date.
+
+        A session is re-read when it is new, when its directory modification
+        time changed (a message file was added or removed), or when it was
+        last read less than an hour after that modification time, since the
+        newest messages may still have been written in place. Sessions whose
+        directory disappeared are removed. When any session's usage changed,
+        the sorted timeline and session start index are rebuilt and stored
+        with the sessions, so unchanged stores are read back without sorting.
+
+        Args:
+            base_path: Path to directory containing sessions, or a list of storage roots
+
+        Returns:
+            Rollup state with ``sessions`` mapping directory name to
+            ``[directory mtime, checked at, session ID, time slots, start ms,
+            project name, storage root]``, ``timeline`` (a serialized
+            ``UsageTimeline``), ``index`` (session ``start_ms`` as bytes and
+            directory ``names``, sorted by start time) and ``cubes``
+            (serialized ``UsageCube`` objects by timezone)
+        """
+        roots = storage_roots(base_path)
+        store_path = self._store_path(roots)
+        state = read_versioned(store_path, ROLLUP_STORE_VERSION) if store_path else None
+        if state is None:
+            state = {'version': ROLLUP_STORE_VERSION, 'sessions': {}}
+
+        sessions = state['sessions']
+        now = time.time()
+        seen = set()
+        changed = False
+        usage_changed = 'timeline' not in state
+
+        stale = []
+        for negated_mtime, name, root in FileProcessor.scan_storage_roots(roots):
+            mtime = -negated_mtime
+            # Packed sessions live below a pack rather than directly in the root
+            session_dir = roots[root] / name
+            seen.add(session_dir.name)
+            entry = sessions.get(session_dir.name)
+            if entry is not None and entry[0] == mtime and entry[1] - mtime >= MTIME_PRUNE_SLACK_SECONDS \
+                    and entry[6] == str(session_dir.parent):
+                continue
+            stale.append((mtime, session_dir))
+        # Grouped by pack, so each pack is opened once while loading
+        stale.sort(key=lambda item: str(item[1].parent))
+
+        summaries = FileProcessor.load_by_root([session_dir for _, session_dir in stale],
+                                               self.summary_cache.load)
+        for (mtime, session_dir), summary in zip(stale, summaries):
+            name = session_dir.name
+            root = str(session_dir.parent)
+            if summary:
+                new_entry = [mtime, now, summary.session_id, summary.time_slots, summary.start_ms,
+                             summary.project_name, root]
+            else:
+                new_entry = [mtime, now, name, [], None, "Unknown", root]
+            # Sessions still being written are re-read on every run; only
+            # rebuild the indexes when their usage actually changed
+            entry = sessions.get(name)
+            if entry is None or entry[2:6] != new_entry[2:6]:
+                usage_changed = True
+            sessions[name] = new_entry
+            changed = True
+
+        for name in [name for name in sessions if name not in seen]:
+            del sessions[name]
+            changed = usage_changed = True
+
+        if usage_changed:
+            self._build_indexes(state)
+        if changed and store_path:
+            write_atomic(store_path, state)
+        return state
+
+    @staticmethod
+    def _build_indexes(state: Dict[str, Any]) -> None:
+        """Rebuild the stored timeline and session start index, dropping stale cubes."""
+        sessions = state['sessions']
+        state['timeline'] = UsageTimeline(
+            (row[0], session_id, row[1], row[2:7])
+            for _, _, session_id, time_slots, _, _, _ in sessions.values()
+            for row in time_slots
+        ).to_dict()
+
+        starts = sorted((entry[4], name) for name, entry in sessions.items() if entry[4] is not None)
+        state['index'] = {
+            'start_ms': array('q', [start for start, _ in starts]).tobytes(),
+            'names': [name for _, name in starts],
+        }
+        state['cubes'] = {}
+
+    def _store_path(self, roots: List[Path]) -> Optional[str]:
+        """Get the rollup file for a set of storage roots."""
+        if not self.cache_dir:
+            return None
+        return os.path.join(self.cache_dir, f"rollup-{cache_key(roots)}.bin")
+
+
+
+def _timezone_key(timezone: Optional[tzinfo]) -> str:
+    """Get the key cubes for a timezone are stored under."""
+    if timezone is None:
+        # Local time follows the machine's zone, so a zone change rebuilds the cube
+        return f"local:{','.join(time.tzname)}:{time.timezone}:{time.altzone}"
+    return str(timezone)
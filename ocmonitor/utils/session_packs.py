@@ -0,0 +1,192 @@
+"""Per-month packs of cold sessions for OpenCode Monitor.
+
+Sessions nobody has touched for weeks are never written again, yet every
+scan still lists their directories and opens each of their message files.
+:meth:`SessionPacker.pack` copies such sessions into one zip per month of
+last modification, ``<messages dir>/ocmonitor-packs/YYYY-MM.zip``, together
+with their title files and an index of their titles and exact modification
+times (see :mod:`.archive_storage`). The index is the first member of a
+pack, so scans list packed sessions and find their titles without reading
+the rest, and a pack that must be loaded is read from one open file instead
+of one open per message file.
+
+Original directories are left in place unless pruning is asked for. A
+directory modified after it was packed takes precedence over its packed
+copy, and is packed again once it is old enough.
+"""
+
+import json
+import os
+import shutil
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .archive_storage import PACK_DIRECTORY, PACK_INDEX, PACK_VERSION, read_archive_titles, read_pack_index
+from .cache_files import atomic_file
+from .file_utils import FileProcessor
+
+# Session directory name -> [directory mtime, {message file name: mtime}]
+PackIndex = Dict[str, List]
+
+
+class SessionPacker:
+    """Packs sessions that are no longer written into per-month zips."""
+
+    @staticmethod
+    def pack(base_dir: Path, older_than_days: int, prune: bool = False,
+             now: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Pack the sessions of a messages directory last modified before a cutoff.
+
+        Sessions already packed with the same modification times are not
+        copied again, so repeated runs only rewrite packs that gained or
+        changed sessions.
+
+        Args:
+            base_dir: Messages directory holding ``ses_*`` session directories
+            older_than_days: Pack sessions last modified more than this many days ago
+            prune: Delete each session directory once its packed copy is written
+            now: Current POSIX timestamp (defaults to the current time)
+
+        Returns:
+            One dictionary per month with ``month``, pack ``path``, number of
+            ``sessions`` in the pack, sessions ``added`` by this run, session
+            directories ``pruned`` and pack ``size_bytes``
+
+        Raises:
+            ValueError: If ``base_dir`` is not a directory or an existing pack cannot be read
+        """
+        if not base_dir.is_dir():
+            raise ValueError(f"Cannot pack sessions in {base_dir}: not a directory")
+        cutoff = (now if now is not None else time.time()) - older_than_days * 86400
+
+        by_month: Dict[str, List[Tuple[str, float]]] = {}
+        with os.scandir(base_dir) as entries:
+            for entry in entries:
+                if not entry.name.startswith('ses_') or not entry.is_dir():
+                    continue
+                mtime = entry.stat().st_mtime
+                if mtime < cutoff:
+                    month = datetime.fromtimestamp(mtime).strftime('%Y-%m')
+                    by_month.setdefault(month, []).append((entry.name, mtime))
+
+        title_files = SessionPacker._find_title_files(base_dir) if by_month else {}
+        return [
+            SessionPacker._pack_month(base_dir, month, sorted(by_month[month]), title_files, prune)
+            for month in sorted(by_month)
+        ]
+
+    @staticmethod
+    def _pack_month(base_dir: Path, month: str, sessions: List[Tuple[str, float]],
+                    title_files: Dict[str, Path], prune: bool) -> Dict[str, Any]:
+        """Add one month's sessions to its pack, rewriting the pack only if any changed."""
+        pack_path = base_dir / PACK_DIRECTORY / f"{month}.zip"
+        index: PackIndex = read_pack_index(pack_path) if pack_path.exists() else {}
+        index = dict(index)
+
+        added = {}
+        for name, mtime in sessions:
+            files = {
+                entry.name: entry.stat().st_mtime
+                for entry in os.scandir(base_dir / name)
+                if entry.name.endswith('.json') and entry.is_file()
+            }
+            if index.get(name) != [mtime, files]:
+                added[name] = [mtime, files]
+
+        if added:
+            index.update(added)
+            SessionPacker._write_pack(pack_path, base_dir, month, index, added, title_files)
+
+        pruned = 0
+        if prune:
+            for name, mtime in sessions:
+                session_dir = base_dir / name
+                # Only delete directories left exactly as they were packed
+                if session_dir.stat().st_mtime == mtime and index.get(name, [None])[0] == mtime:
+                    shutil.rmtree(session_dir)
+                    pruned += 1
+
+        return {
+            'month': month,
+            'path': str(pack_path),
+            'sessions': len(index),
+            'added': len(added),
+            'pruned': pruned,
+            'size_bytes': pack_path.stat().st_size if pack_path.exists() else 0,
+        }
+
+    @staticmethod
+    def _write_pack(pack_path: Path, base_dir: Path, month: str, index: PackIndex,
+                    added: PackIndex, title_files: Dict[str, Path]) -> None:
+        """Write a pack atomically, copying unchanged sessions over from the previous one."""
+        # Imported here so commands that never pack sessions do not pay for it
+        import zipfile
+
+        titles = read_archive_titles(pack_path) if pack_path.exists() else {}
+        titles = {name: title for name, title in titles.items() if name in index and name not in added}
+        for name in added:
+            title = SessionPacker._read_title(title_files.get(name))
+            if title is not None:
+                titles[name] = title
+
+        pack_path.parent.mkdir(parents=True, exist_ok=True)
+        with atomic_file(pack_path) as f, \
+                zipfile.ZipFile(f, 'w', zipfile.ZIP_DEFLATED, strict_timestamps=False) as pack:
+            # The index goes first, where it is read without the central directory
+            pack.writestr(PACK_INDEX, json.dumps({
+                'version': PACK_VERSION,
+                'month': month,
+                'sessions': index,
+                'titles': titles,
+            }))
+
+            if pack_path.exists():
+                with zipfile.ZipFile(pack_path) as previous:
+                    for info in previous.infolist():
+                        if info.filename == PACK_INDEX or _member_session(info.filename) in added:
+                            continue
+                        pack.writestr(info, previous.read(info))
+
+            for name, (_, files) in added.items():
+                for file_name in sorted(files):
+                    pack.write(base_dir / name / file_name, f"{name}/{file_name}")
+                title_file = title_files.get(name)
+                if title_file is not None:
+                    pack.write(title_file, f"session/{title_file.parent.name}/{title_file.name}")
+
+    @staticmethod
+    def _read_title(title_file: Optional[Path]) -> Optional[str]:
+        """Read the title from a session's title file, if it has a readable one."""
+        if title_file is None:
+            return None
+        data = FileProcessor.load_json_file(title_file)
+        return data.get('title') if isinstance(data, dict) else None
+
+    @staticmethod
+    def _find_title_files(base_dir: Path) -> Dict[str, Path]:
+        """Map session IDs to their title files in the storage the messages directory belongs to."""
+        # Every session directory of base_dir resolves to the same storage
+        storage_path = FileProcessor.get_storage_path_for_session(base_dir / 'ses_')
+        session_storage = storage_path / "session" if storage_path else None
+        if session_storage is None or not session_storage.is_dir():
+            return {}
+
+        title_files = {}
+        for project_dir in session_storage.iterdir():
+            if not project_dir.is_dir():
+                continue
+            for title_file in project_dir.glob('ses_*.json'):
+                title_files.setdefault(title_file.stem, title_file)
+        return title_files
+
+
+def _member_session(member_name: str) -> Optional[str]:
+    """Get the session a pack member belongs to, for message files and titles alike."""
+    parts = member_name.split('/')
+    if parts[0].startswith('ses_'):
+        return parts[0]
+    if parts[0] == 'session' and parts[-1].endswith('.json'):
+        return parts[-1][:-len('.json')]
+    return None
@@ -0,0 +1,150 @@
+"""Per-session summary cache for OpenCode Monitor.
+
+Summary-level reports (sessions, daily, weekly, monthly, models, projects)
+only need per-session totals, yet loading a session parses every message
+file in it. This cache stores one small ``SessionSummary`` per session as a
+marshal file in the cache directory, fingerprinted by the number of message
+files in the session directory and their newest modification time. A warm
+scan lists each session directory once and reads one cache file instead of
+opening every message file; sessions whose fingerprint changed are parsed
+again and their summary rewritten.
+
+Session titles live outside the message directory, so they are looked up on
+every load rather than cached.
+"""
+
+import os
+from pathlib import Path
+from typing import Generator, List, Optional, Tuple
+
+from ..models.records import SessionSummary
+from .archive_storage import archive_of, packed_session_files
+from .cache_files import cache_key, read_versioned, write_atomic
+from .file_utils import FileProcessor, StoragePath
+from .instrumentation import instrumented
+
+# Bump when the layout of the cached summaries changes
+SUMMARY_CACHE_VERSION = 3
+
+# (message file count, newest message file mtime in nanoseconds)
+Fingerprint = Tuple[int, int]
+
+
+class SessionSummaryCache:
+    """Loads session summaries through an on-disk cache."""
+
+    def __init__(self, cache_dir: Optional[str]):
+        """Initialize summary cache.
+
+        Args:
+            cache_dir: Directory for cached summaries. If None, caching is
+                disabled and every summary is computed from the message files.
+        """
+        self.cache_dir = cache_dir
+
+    def iter_summaries(self, base_path: StoragePath, modified_since: Optional[float] = None,
+                       session_dirs: Optional[List[Path]] = None) -> Generator[SessionSummary, None, None]:
+        """Yield session summaries, newest first.
+
+        Sessions under several storage roots are loaded with one worker per
+        root (see :meth:`FileProcessor.load_by_root`).
+
+        Args:
+            base_path: Path to search for sessions, or a list of storage roots
+            modified_since: Skip session directories last modified before this POSIX timestamp
+            session_dirs: Only load these session directories, in this order,
+                instead of listing ``base_path``
+
+        Yields:
+            SessionSummary objects for directories that contain data
+        """
+        if session_dirs is not None:
+            summaries = FileProcessor.load_by_root(session_dirs, self.load)
+        else:
+            summaries = FileProcessor.map_session_directories(base_path, self.load, modified_since)
+        for summary in summaries:
+            if summary:
+                yield summary
+
+    @instrumented("load.summary")
+    def load(self, session_path: Path) -> Optional[SessionSummary]:
+        """Load one session summary, using the cached copy when it is current.
+
+        Args:
+            session_path: Path to session directory
+
+        Returns:
+            SessionSummary object or None if the session has no usable data
+        """
+        fingerprint = self.fingerprint(session_path)
+        if fingerprint is None:
+            return None
+
+        cache_path = self._cache_path(session_path)
+        cached = read_versioned(cache_path, SUMMARY_CACHE_VERSION) if cache_path else None
+
+        if cached and tuple(cached['fingerprint']) == fingerprint:
+            data = cached['summary']
+        else:
+            record = FileProcessor.load_session_record(session_path)
+            # Sessions without usable data are cached too, so they are not reparsed
+            data = SessionSummary.from_record(record).to_dict() if record else None
+            if cache_path:
+                write_atomic(cache_path, {
+                    'version': SUMMARY_CACHE_VERSION,
+                    'fingerprint': fingerprint,
+                    'summary': data,
+                })
+            if record:
+                return SessionSummary.from_dict(data, session_path, record.session_title)
+
+        if data is None:
+            return None
+        return SessionSummary.from_dict(
+            data, session_path,
+            FileProcessor.find_session_title(
+                session_path.name, FileProcessor.get_storage_path_for_session(session_path)
+            )
+        )
+
+    @staticmethod
+    def fingerprint(session_path: Path) -> Optional[Fingerprint]:
+        """Fingerprint a session directory by its message files.
+
+        Adding a message changes the count and rewriting one changes its
+        modification time, so either invalidates the cached summary.
+
+        Args:
+            session_path: Path to session directory
+
+        Returns:
+            Tuple of (file count, newest mtime in ns), or None if the
+            directory is missing or holds no message files
+        """
+        # Packed sessions are fingerprinted from the pack index, so an
+        # unchanged one is served without opening its pack
+        files = packed_session_files(session_path)
+        if files is not None:
+            return (len(files), int(max(files.values()) * 1_000_000_000)) if files else None
+        snapshot = archive_of(session_path)
+        if snapshot is not None:
+            return snapshot.fingerprint(session_path.name)
+
+        count = 0
+        newest = 0
+        try:
+            with os.scandir(session_path) as entries:
+                for entry in entries:
+                    if not entry.name.endswith('.json'):
+                        continue
+                    count += 1
+                    newest = max(newest, entry.stat().st_mtime_ns)
+        except OSError:
+            return None
+        return (count, newest) if count else None
+
+    def _cache_path(self, session_path: Path) -> Optional[str]:
+        """Get the cache file for a session, grouped by the directory it lives in."""
+        if not self.cache_dir:
+            return None
+        return os.path.join(self.cache_dir, cache_key([session_path.parent]), f"{session_path.name}.bin")
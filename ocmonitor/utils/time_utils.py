@@ -1,8 +1,15 @@
 """Time utility functions for OpenCode Monitor."""
 
-from datetime import datetime, date, timedelta
+import re
+from datetime import datetime, date, timedelta, timezone, tzinfo
 from typing import Optional, Tuple
 
+# Relative time bounds such as "24h" or "7d"
+_RELATIVE_TIME_PATTERN = re.compile(r'^\s*(\d+(?:\.\d+)?)\s*([smhdw])\s*$', re.IGNORECASE)
+_RELATIVE_TIME_UNITS = {'s': 'seconds', 'm': 'minutes', 'h': 'hours', 'd': 'days', 'w': 'weeks'}
+# Fixed UTC offsets such as "+02:00" or "-0530"
+_UTC_OFFSET_PATTERN = re.compile(r'^([+-])(\d{2}):?(\d{2})$')
+
 
 class TimeUtils:
     """Utility functions for time operations."""
@@ -150,6 +157,138 @@ class TimeUtils:
         end_date = date(year, 12, 31)
         return start_date, end_date
 
+    @staticmethod
+    def parse_time_bound(value: str, now: Optional[datetime] = None) -> datetime:
+        """Parse a time window bound such as ``24h``, ``7d`` or ``2024-01-15``.
+
+        Relative values (a number followed by ``s``, ``m``, ``h``, ``d`` or
+        ``w``) count back from now; ``today`` and ``yesterday`` mean local
+        midnight; anything else is read as an ISO date or date and time.
+
+        Args:
+            value: Bound to parse
+            now: Reference time for relative values (defaults to now)
+
+        Returns:
+            Local datetime of the bound
+
+        Raises:
+            ValueError: If the value is not a recognized time bound
+        """
+        now = now or datetime.now()
+        text = value.strip().lower()
+
+        match = _RELATIVE_TIME_PATTERN.match(text)
+        if match:
+            amount, unit = match.groups()
+            return now - timedelta(**{_RELATIVE_TIME_UNITS[unit]: float(amount)})
+
+        if text in ('today', 'yesterday'):
+            midnight = datetime.combine(now.date(), datetime.min.time())
+            return midnight if text == 'today' else midnight - timedelta(days=1)
+
+        try:
+            parsed = datetime.fromisoformat(value.strip())
+        except ValueError:
+            raise ValueError(
+                f"Invalid time '{value}'. Use a relative time like 30m, 24h, 7d or 2w, "
+                "'today', 'yesterday', or a date like 2024-01-15 or 2024-01-15T09:30"
+            )
+        # Timestamps in messages are compared as local times
+        if parsed.tzinfo is not None:
+            parsed = parsed.astimezone().replace(tzinfo=None)
+        return parsed
+
+    @staticmethod
+    def date_start_timestamp(day: date, tz: Optional[tzinfo] = None) -> float:
+        """Get the POSIX timestamp of midnight at the start of a date.
+
+        Args:
+            day: Date
+            tz: Timezone of the date; None for local time
+
+        Returns:
+            Seconds since the epoch, comparable with file modification times
+        """
+        return datetime.combine(day, datetime.min.time(), tzinfo=tz).timestamp()
+
+    @staticmethod
+    def date_range_ms(start_date: Optional[date], end_date: Optional[date],
+                      tz: Optional[tzinfo] = None) -> Tuple[Optional[int], Optional[int]]:
+        """Convert an inclusive date range to millisecond timestamp bounds.
+
+        Args:
+            start_date: First date, or None for no lower bound
+            end_date: Last date (inclusive), or None for no upper bound
+            tz: Timezone of the dates; None for local time
+
+        Returns:
+            Tuple of (inclusive start, exclusive end) in milliseconds, either
+            None when the matching date is None
+        """
+        start_ms = end_ms = None
+        if start_date:
+            start_ms = int(TimeUtils.date_start_timestamp(start_date, tz) * 1000)
+        if end_date:
+            end_ms = int(TimeUtils.date_start_timestamp(end_date + timedelta(days=1), tz) * 1000)
+        return start_ms, end_ms
+
+    @staticmethod
+    def timestamp_date(timestamp_ms: int, tz: Optional[tzinfo] = None) -> date:
+        """Get the date a millisecond timestamp falls on.
+
+        Args:
+            timestamp_ms: Timestamp in milliseconds
+            tz: Timezone to take the date in; None for local time
+
+        Returns:
+            Date of the timestamp
+        """
+        return datetime.fromtimestamp(timestamp_ms / 1000, tz).date()
+
+    @staticmethod
+    def get_timezone(name: str) -> Optional[tzinfo]:
+        """Resolve a timezone setting.
+
+        Args:
+            name: ``"local"``, ``"UTC"``, a fixed offset such as ``"+02:00"``
+                or an IANA name such as ``"Europe/Berlin"``
+
+        Returns:
+            tzinfo object, or None for local time
+
+        Raises:
+            ValueError: If the timezone is unknown, or a fixed offset is not a
+                multiple of 15 minutes (the width of the time slots reports
+                are bucketed from)
+        """
+        name = name.strip()
+        if not name or name.lower() == 'local':
+            return None
+        if name.upper() in ('UTC', 'Z'):
+            return timezone.utc
+
+        offset = _UTC_OFFSET_PATTERN.match(name)
+        if offset:
+            sign, hours, minutes = offset.groups()
+            delta = timedelta(hours=int(hours), minutes=int(minutes))
+            if int(minutes) >= 60 or delta >= timedelta(hours=24):
+                raise ValueError(f"Invalid UTC offset: {name}")
+            if int(minutes) % 15:
+                raise ValueError(f"UTC offset must be a multiple of 15 minutes: {name}")
+            return timezone(-delta if sign == '-' else delta)
+
+        try:
+            from zoneinfo import ZoneInfo
+        except ImportError:
+            raise ValueError(f"Timezone names like '{name}' require Python 3.9 or newer; "
+                             f"use 'local', 'UTC' or an offset such as '+02:00'")
+        try:
+            return ZoneInfo(name)
+        except (KeyError, ValueError, OSError):
+            # ZoneInfoNotFoundError is a KeyError; malformed keys raise ValueError
+            raise ValueError(f"Unknown timezone: {name}")
+
     @staticmethod
     def get_current_month_range() -> Tuple[date, date]:
         """Get the start and end dates for the current month.
@@ -44,6 +44,9 @@ setup(
             "isort>=5.10.0",
             "flake8>=4.0.0",
         ],
+        "numpy": [
+            "numpy>=1.20.0",
+        ],
     },
     entry_points={
         "console_scripts": [